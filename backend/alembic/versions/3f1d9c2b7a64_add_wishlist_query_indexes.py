@@ -0,0 +1,68 @@
+"""add wishlist query indexes
+
+Revision ID: 3f1d9c2b7a64
+Revises: 0ca315882232
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1d9c2b7a64"
+down_revision: Union[str, None] = "0ca315882232"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_wishlists_owner_username_is_archived_created_at",
+            "wishlists",
+            ["owner_username", "is_archived", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_wishlists_active_owner_username_created_at",
+            "wishlists",
+            ["owner_username", sa.text("created_at DESC")],
+            postgresql_where=sa.text("is_archived = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_wishlist_items_wishlist_uuid",
+            "wishlist_items",
+            ["wishlist_uuid"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_wishlist_items_wishlist_uuid",
+            table_name="wishlist_items",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_wishlists_active_owner_username_created_at",
+            table_name="wishlists",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_wishlists_owner_username_is_archived_created_at",
+            table_name="wishlists",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,87 @@
+"""add uuid to wishlist keyset indexes
+
+Revision ID: 8b2e4a71c5d0
+Revises: 3f1d9c2b7a64
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8b2e4a71c5d0"
+down_revision: Union[str, None] = "3f1d9c2b7a64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Build the replacements before dropping the old indexes, both CONCURRENTLY
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_wishlists_owner_username_is_archived_created_at_uuid",
+            "wishlists",
+            [
+                "owner_username",
+                "is_archived",
+                sa.text("created_at DESC"),
+                sa.text("uuid DESC"),
+            ],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_wishlists_active_owner_username_created_at_uuid",
+            "wishlists",
+            ["owner_username", sa.text("created_at DESC"), sa.text("uuid DESC")],
+            postgresql_where=sa.text("is_archived = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_wishlists_active_owner_username_created_at",
+            table_name="wishlists",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_wishlists_owner_username_is_archived_created_at",
+            table_name="wishlists",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_wishlists_owner_username_is_archived_created_at",
+            "wishlists",
+            ["owner_username", "is_archived", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_wishlists_active_owner_username_created_at",
+            "wishlists",
+            ["owner_username", sa.text("created_at DESC")],
+            postgresql_where=sa.text("is_archived = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_wishlists_active_owner_username_created_at_uuid",
+            table_name="wishlists",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_wishlists_owner_username_is_archived_created_at_uuid",
+            table_name="wishlists",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,42 @@
+"""make wishlists created_at timezone aware
+
+Revision ID: a1d3e5f7b9c2
+Revises: f7c2d4e6a1b9
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a1d3e5f7b9c2"
+down_revision: Union[str, None] = "f7c2d4e6a1b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing values were written as naive UTC
+    op.alter_column(
+        "wishlists",
+        "created_at",
+        type_=sa.DateTime(timezone=True),
+        existing_type=sa.DateTime(),
+        existing_nullable=True,
+        postgresql_using="created_at AT TIME ZONE 'UTC'",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "wishlists",
+        "created_at",
+        type_=sa.DateTime(),
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=True,
+        postgresql_using="created_at AT TIME ZONE 'UTC'",
+    )
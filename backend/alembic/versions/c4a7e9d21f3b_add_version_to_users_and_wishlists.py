@@ -0,0 +1,35 @@
+"""add version to users and wishlists
+
+Revision ID: c4a7e9d21f3b
+Revises: 8b2e4a71c5d0
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a7e9d21f3b"
+down_revision: Union[str, None] = "8b2e4a71c5d0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+    )
+    op.add_column(
+        "wishlists",
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("wishlists", "version")
+    op.drop_column("users", "version")
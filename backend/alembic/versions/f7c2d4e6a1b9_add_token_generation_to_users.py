@@ -0,0 +1,30 @@
+"""add token generation to users
+
+Revision ID: f7c2d4e6a1b9
+Revises: e5f0b3a8d912
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f7c2d4e6a1b9"
+down_revision: Union[str, None] = "e5f0b3a8d912"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("token_generation", sa.Integer(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "token_generation")
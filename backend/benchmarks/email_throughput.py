@@ -0,0 +1,131 @@
+"""
+Email delivery throughput: one SMTP connection per message versus the pooled sender.
+
+Usage (from the backend directory):
+    python -m benchmarks.email_throughput --smtp-host smtp.example.com --smtp-port 587
+Without --smtp-host a local aiosmtpd sink is started, which measures client overhead
+only: connection setup to a real server (TLS, AUTH, network latency) costs much more.
+"""
+
+import argparse
+import asyncio
+import socket
+import time
+from email.message import EmailMessage as MIMEMessage
+
+from fakeredis import FakeRedis
+
+from src.infrastructure.cache.redis.email_queue import RedisEmailQueue
+from src.shared.ports.email_queue import EmailMessage
+from src.shared.utils.notifications.email_sender import (
+    EmailSender,
+    create_smtp_connection_factory,
+)
+
+SENDER_ADDRESS = "benchmark@localhost"
+
+
+def make_messages(count: int) -> list[EmailMessage]:
+    return [
+        EmailMessage(
+            recipient=f"user{number}@localhost",
+            subject="WannaBuyThis Account activation",
+            body=f"Activation code: {number:08}",
+        )
+        for number in range(count)
+    ]
+
+
+def send_with_connection_per_message(connect, messages: list[EmailMessage]) -> None:
+    """Previous EmailNotificator behaviour: connect, send and quit for every email"""
+    for message in messages:
+        mime_message = MIMEMessage()
+        mime_message["From"] = SENDER_ADDRESS
+        mime_message["To"] = message.recipient
+        mime_message["Subject"] = message.subject
+        mime_message.set_content(message.body)
+        with connect() as smtp:
+            smtp.send_message(mime_message)
+
+
+async def send_with_pooled_sender(
+    connect, messages: list[EmailMessage], pool_size: int, batch_size: int
+) -> None:
+    email_queue = RedisEmailQueue(FakeRedis())
+    for message in messages:
+        email_queue.enqueue(message)
+
+    sender = EmailSender(
+        email_queue=email_queue,
+        connection_factory=connect,
+        sender_address=SENDER_ADDRESS,
+        pool_size=pool_size,
+        batch_size=batch_size,
+    )
+    try:
+        while await sender.send_batch():
+            pass
+    finally:
+        sender.close()
+
+
+def start_sink_server():
+    from aiosmtpd.controller import Controller
+    from aiosmtpd.handlers import Sink
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    controller = Controller(Sink(), hostname="127.0.0.1", port=port)
+    controller.start()
+    return controller
+
+
+async def main(args: argparse.Namespace):
+    controller = None
+    if args.smtp_host is None:
+        controller = start_sink_server()
+        connect = create_smtp_connection_factory(
+            host=controller.hostname,
+            port=controller.port,
+            username="",
+            use_tls=False,
+            use_ssl=False,
+        )
+    else:
+        connect = create_smtp_connection_factory(
+            host=args.smtp_host, port=args.smtp_port
+        )
+
+    messages = make_messages(args.messages)
+    try:
+        start = time.perf_counter()
+        await asyncio.to_thread(send_with_connection_per_message, connect, messages)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{'per-message':>12}: {len(messages) / elapsed:8.1f} emails/s "
+            f"in {elapsed:.2f}s"
+        )
+
+        start = time.perf_counter()
+        await send_with_pooled_sender(
+            connect, messages, args.pool_size, args.batch_size
+        )
+        elapsed = time.perf_counter() - start
+        print(
+            f"{'pooled':>12}: {len(messages) / elapsed:8.1f} emails/s "
+            f"in {elapsed:.2f}s ({args.pool_size} connections)"
+        )
+    finally:
+        if controller is not None:
+            controller.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--smtp-host", default=None)
+    parser.add_argument("--smtp-port", type=int, default=None)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--pool-size", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=50)
+    asyncio.run(main(parser.parse_args()))
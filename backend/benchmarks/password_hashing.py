@@ -0,0 +1,110 @@
+"""
+Login throughput of Argon2 verification in the event loop's thread pool and in process pools.
+
+Usage (from the backend directory):
+    python -m benchmarks.password_hashing --logins 200 --processes 1 2 4
+Uses the Argon2 parameters from settings. Logins per core divides by the number of
+workers that can run at once (at most the CPU count). Loop lag is the longest delay of a
+10 ms ticker, standing in for other requests served while logins are verified.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.config import settings
+from src.shared.utils.auth.password_manager import (
+    Argon2Parameters,
+    Argon2PasswordManager,
+    argon2_hash,
+)
+
+PASSWORD = "correct horse battery staple"
+
+
+async def measure_loop_lag(stop: asyncio.Event) -> float:
+    max_lag = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        max_lag = max(max_lag, time.perf_counter() - start - 0.01)
+    return max_lag
+
+
+async def run_logins(
+    password_manager: Argon2PasswordManager, password_hash: str, logins: int
+) -> tuple[float, float]:
+    # Warm up the workers so process start-up is not measured
+    await asyncio.gather(
+        *(
+            password_manager.verify_password(PASSWORD, password_hash)
+            for _ in range(password_manager.max_concurrency)
+        )
+    )
+
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(measure_loop_lag(stop))
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            password_manager.verify_password(PASSWORD, password_hash)
+            for _ in range(logins)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    stop.set()
+    return elapsed, await lag_task
+
+
+async def main(args: argparse.Namespace):
+    parameters = Argon2Parameters.from_settings()
+    password_hash = argon2_hash(PASSWORD, parameters)
+    cpu_count = os.cpu_count() or 1
+    print(
+        f"Argon2 t={parameters.time_cost} m={parameters.memory_cost}KiB "
+        f"p={parameters.parallelism}, {cpu_count} CPUs"
+    )
+
+    for processes in args.processes:
+        executor = None
+        if processes:
+            executor = ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        password_manager = Argon2PasswordManager(
+            parameters=parameters,
+            executor=executor,
+            max_concurrency=args.max_concurrency,
+        )
+        try:
+            elapsed, lag = await run_logins(
+                password_manager, password_hash, args.logins
+            )
+        finally:
+            password_manager.close()
+
+        cores = min(processes or args.max_concurrency, cpu_count)
+        label = f"{processes} processes" if processes else "threads"
+        print(
+            f"{label:>12}: {args.logins / elapsed:7.1f} logins/s, "
+            f"{args.logins / elapsed / cores:6.1f} logins/s per core, "
+            f"max loop lag {lag * 1000:.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument(
+        "--processes", type=int, nargs="+", default=sorted({0, 1, os.cpu_count() or 1})
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=settings.password_hashing_max_concurrency,
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,77 @@
+"""
+Password strength check cost across password lengths: zxcvbn alone versus pre-filter + truncated zxcvbn.
+
+Usage (from the backend directory):
+    python -m benchmarks.password_strength --repeat 20
+zxcvbn alone cannot analyze passwords longer than 72 characters and reports n/a there.
+"""
+
+import argparse
+import random
+import string
+import time
+from typing import Callable
+
+from zxcvbn import zxcvbn
+
+from src.config import settings
+from src.shared.application.exceptions import PasswordValidationError
+from src.shared.utils.auth.password_strength import (
+    assert_password_strong,
+    prefilter_password,
+)
+
+LENGTHS = (8, 12, 16, 32, 64, 72, 128, 1024)
+
+
+def check_with_prefilter(password: str) -> None:
+    prefilter_password(password)
+    assert_password_strong(
+        password, max_length=settings.password_strength_max_analyzed_length
+    )
+
+
+def time_check(check: Callable[[str], object], passwords: list[str]) -> float | None:
+    """Average milliseconds per password, None if the check cannot handle them"""
+    start = time.perf_counter()
+    for password in passwords:
+        try:
+            check(password)
+        except PasswordValidationError:
+            pass
+        except ValueError:
+            return None
+    return (time.perf_counter() - start) / len(passwords) * 1000
+
+
+def format_milliseconds(value: float | None) -> str:
+    return f"{value:9.3f}" if value is not None else f"{'n/a':>9}"
+
+
+def main(args: argparse.Namespace):
+    rnd = random.Random(args.seed)
+    alphabet = string.ascii_letters + string.digits + string.punctuation
+
+    print(f"{'length':>7} {'zxcvbn ms':>9} {'prefilter+zxcvbn ms':>20}")
+    for length in LENGTHS:
+        passwords = [
+            "".join(rnd.choice(alphabet) for _ in range(length))
+            for _ in range(args.repeat)
+        ]
+        print(
+            f"{length:>7} {format_milliseconds(time_check(zxcvbn, passwords))} "
+            f"{format_milliseconds(time_check(check_with_prefilter, passwords)):>20}"
+        )
+
+    common = ["password1", "qwertyuiop", "1234567890"] * args.repeat
+    print(
+        f"{'common':>7} {format_milliseconds(time_check(zxcvbn, common))} "
+        f"{format_milliseconds(time_check(check_with_prefilter, common)):>20}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    main(parser.parse_args())
@@ -0,0 +1,150 @@
+"""
+Database statements per burst of concurrent GET /wishlists/{uuid} right after the cached wishlist is invalidated.
+
+Usage (from the backend directory):
+    python -m benchmarks.wishlist_burst --requests 100 --bursts 5
+Runs the FastAPI app in process against a temporary SQLite file (or --database-url)
+and a fake Redis. Each burst starts with the wishlist evicted from the cache, so every
+request misses: without coalescing each one loads the wishlist, with single-flight
+the process loads it once. The lock row adds the cross-process Redis lock, which
+only costs Redis round trips here as all requests share one process.
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+import uuid
+
+import httpx
+from fakeredis import FakeAsyncRedis
+from sqlalchemy import NullPool, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import clear_mappers
+
+from src.infrastructure.cache.two_tier_cache import TwoTierCache
+from src.infrastructure.database.sqlalchemy.orm import (
+    mapper_registry,
+    start_sqlalchemy_mappers,
+)
+from src.infrastructure.entrypoints.fastapi.app import create_app
+from src.modules.users.domain.model import User
+from src.modules.wishlists.domain.model import (
+    MeasurementUnit,
+    Priority,
+    Wishlist,
+    WishlistItem,
+)
+
+
+async def create_popular_wishlist(
+    session_factory: async_sessionmaker, items: int
+) -> uuid.UUID:
+    owner = User(
+        username=f"bench_{uuid.uuid4().hex[:8]}",
+        email=f"{uuid.uuid4().hex}@example.com",
+        password_hash="",
+        is_active=True,
+    )
+    wishlist = Wishlist(uuid=uuid.uuid4(), owner_username=owner.username, name="Gifts")
+    wishlist.items = [
+        WishlistItem(
+            uuid=uuid.uuid4(),
+            wishlist_uuid=wishlist.uuid,
+            name=f"item {number}",
+            quantity=1,
+            measurement_unit=MeasurementUnit.PIECE,
+            priority=Priority.MEDIUM,
+        )
+        for number in range(items)
+    ]
+    async with session_factory() as session:
+        session.add_all([owner, wishlist])
+        await session.commit()
+    return wishlist.uuid
+
+
+async def run_bursts(
+    client: httpx.AsyncClient,
+    wishlist_cache: TwoTierCache,
+    wishlist_uuid: uuid.UUID,
+    statements: list[str],
+    requests: int,
+    bursts: int,
+) -> tuple[float, float]:
+    """Average statements and milliseconds per burst"""
+    statement_counts, elapsed_times = [], []
+    for _ in range(bursts):
+        await wishlist_cache.invalidate(str(wishlist_uuid))
+        statements.clear()
+        start = time.perf_counter()
+        responses = await asyncio.gather(
+            *(client.get(f"/wishlists/{wishlist_uuid}") for _ in range(requests))
+        )
+        elapsed_times.append(time.perf_counter() - start)
+        assert all(response.status_code == 200 for response in responses)
+        statement_counts.append(len(statements))
+    return statistics.mean(statement_counts), statistics.mean(elapsed_times) * 1000
+
+
+async def main(args: argparse.Namespace):
+    database_url = args.database_url
+    if database_url is None:
+        database_url = f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/benchmark.db"
+    if database_url.startswith("sqlite"):
+        engine_options = {"poolclass": NullPool}
+    else:
+        engine_options = {"pool_size": args.pool_size}
+    engine = create_async_engine(database_url, **engine_options)
+    statements = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *_: statements.append(statement),
+    )
+
+    app = create_app()
+    start_sqlalchemy_mappers()
+    async with engine.begin() as conn:
+        await conn.run_sync(mapper_registry.metadata.create_all)
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    app.state.dependencies["uow_factory"].session_factory = session_factory
+
+    strategies = {
+        "uncoalesced": {"coalesce": False},
+        "single-flight": {"coalesce": True},
+        "single-flight + lock": {"coalesce": True, "lock_timeout": 1.0},
+    }
+    print(f"{args.requests} concurrent requests per burst, {args.items} items")
+    print(f"{'strategy':>20} {'statements/burst':>16} {'ms/burst':>9}")
+    try:
+        wishlist_uuid = await create_popular_wishlist(session_factory, args.items)
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://benchmark"
+        ) as client:
+            for name, options in strategies.items():
+                wishlist_cache = TwoTierCache("wishlist", FakeAsyncRedis(), **options)
+                app.state.dependencies["wishlist_cache"] = wishlist_cache
+                statement_count, milliseconds = await run_bursts(
+                    client,
+                    wishlist_cache,
+                    wishlist_uuid,
+                    statements,
+                    args.requests,
+                    args.bursts,
+                )
+                print(f"{name:>20} {statement_count:16.1f} {milliseconds:9.1f}")
+    finally:
+        await engine.dispose()
+        clear_mappers()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--bursts", type=int, default=5)
+    parser.add_argument("--items", type=int, default=20)
+    parser.add_argument("--pool-size", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,152 @@
+"""
+Throughput of concurrent item additions to one popular wishlist,
+with optimistic (version column + retries) and pessimistic (SELECT ... FOR UPDATE) locking.
+
+Usage (from the backend directory):
+    python -m benchmarks.wishlist_locking --database-url postgresql+asyncpg://...
+Without --database-url a temporary SQLite file is used, which only checks that the
+benchmark runs: SQLite serializes writers and ignores FOR UPDATE.
+"""
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import NullPool
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import clear_mappers
+
+from src.bootstrap import MessagebusFactory
+from src.infrastructure.database.sqlalchemy.orm import (
+    mapper_registry,
+    start_sqlalchemy_mappers,
+)
+from src.infrastructure.database.sqlalchemy.unit_of_work import (
+    SQLAlchemyAsyncUnitOfWorkFactory,
+)
+from src.modules.users.domain.model import User
+from src.modules.wishlists.domain.commands import AddWishlistItem
+from src.modules.wishlists.domain.model import MeasurementUnit, Priority, Wishlist
+from src.shared.application.exceptions import ConcurrentModification
+from src.shared.application.messagebus import RetryPolicy
+from src.shared.utils.generators.uuid_generator import DefaultUUIDGenerator
+
+
+class RetryCounter(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.retries = 0
+
+    def emit(self, record: logging.LogRecord):
+        if "retrying" in record.getMessage():
+            self.retries += 1
+
+
+async def create_popular_wishlist(session_factory: async_sessionmaker) -> uuid.UUID:
+    owner = User(
+        username=f"bench_{uuid.uuid4().hex[:8]}",
+        email=f"{uuid.uuid4().hex}@example.com",
+        password_hash="",
+        is_active=True,
+    )
+    wishlist = Wishlist(uuid=uuid.uuid4(), owner_username=owner.username, name="Gifts")
+    async with session_factory() as session:
+        session.add_all([owner, wishlist])
+        await session.commit()
+    return wishlist.uuid
+
+
+async def run_strategy(
+    session_factory: async_sessionmaker,
+    lock_for_update: bool,
+    requests: int,
+    concurrency: int,
+    retry_policy: RetryPolicy,
+) -> dict:
+    wishlist_uuid = await create_popular_wishlist(session_factory)
+    messagebus_factory = MessagebusFactory(
+        uow_factory=SQLAlchemyAsyncUnitOfWorkFactory(
+            session_factory, lock_for_update=lock_for_update
+        ),
+        dependencies={"uuid_generator": DefaultUUIDGenerator()},
+        retry_policy=retry_policy,
+    )
+    retry_counter = RetryCounter()
+    logging.getLogger("messagebus").addHandler(retry_counter)
+    semaphore = asyncio.Semaphore(concurrency)
+    failures = 0
+
+    async def add_item(number: int):
+        nonlocal failures
+        command = AddWishlistItem(
+            wishlist_uuid=wishlist_uuid,
+            name=f"item {number}",
+            quantity=1,
+            measurement_unit=MeasurementUnit.PIECE,
+            priority=Priority.MEDIUM,
+        )
+        async with semaphore:
+            try:
+                await messagebus_factory().handle(command)
+            except ConcurrentModification:
+                failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(add_item(number) for number in range(requests)))
+    elapsed = time.perf_counter() - started
+    logging.getLogger("messagebus").removeHandler(retry_counter)
+
+    return {
+        "strategy": "pessimistic" if lock_for_update else "optimistic",
+        "commands_per_second": (requests - failures) / elapsed,
+        "elapsed_seconds": elapsed,
+        "retries": retry_counter.retries,
+        "failures": failures,
+    }
+
+
+async def main(args: argparse.Namespace):
+    database_url = args.database_url
+    if database_url is None:
+        database_url = f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/benchmark.db"
+    if database_url.startswith("sqlite"):
+        engine_options = {"poolclass": NullPool}
+    else:
+        engine_options = {"pool_size": args.concurrency}
+    engine = create_async_engine(database_url, **engine_options)
+    start_sqlalchemy_mappers()
+    async with engine.begin() as conn:
+        await conn.run_sync(mapper_registry.metadata.create_all)
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    retry_policy = RetryPolicy(attempts=args.retry_attempts)
+    logging.getLogger("messagebus").setLevel(logging.INFO)
+
+    try:
+        for lock_for_update in (False, True):
+            result = await run_strategy(
+                session_factory,
+                lock_for_update,
+                args.requests,
+                args.concurrency,
+                retry_policy,
+            )
+            print(
+                f"{result['strategy']:>12}: {result['commands_per_second']:8.1f} commands/s "
+                f"in {result['elapsed_seconds']:.2f}s, "
+                f"{result['retries']} retries, {result['failures']} failed"
+            )
+    finally:
+        await engine.dispose()
+        clear_mappers()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--retry-attempts", type=int, default=10)
+    asyncio.run(main(parser.parse_args()))
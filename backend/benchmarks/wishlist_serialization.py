@@ -0,0 +1,101 @@
+"""
+Wishlist response serialization cost: asdict + FastAPI response_model round trip versus from_attributes + pydantic-core JSON.
+
+Usage (from the backend directory):
+    python -m benchmarks.wishlist_serialization --repeat 20
+The legacy path rebuilds what get_wishlist did before: WishlistResponse built from
+dataclasses.asdict copies, then validated and encoded again by FastAPI for the
+response_model and rendered by JSONResponse.
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from dataclasses import asdict
+from typing import Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from src.modules.wishlists.domain.model import (
+    MeasurementUnit,
+    Priority,
+    Wishlist,
+    WishlistItem,
+)
+from src.modules.wishlists.entrypoints.fastapi.schemas import (
+    WishlistItemResponse,
+    WishlistResponse,
+    dump_wishlist_json,
+)
+
+ITEM_COUNTS = (10, 100, 1_000, 10_000)
+
+response_field = create_response_field(name="response", type_=WishlistResponse)
+loop = asyncio.new_event_loop()
+
+
+def create_wishlist(items: int) -> Wishlist:
+    wishlist = Wishlist(uuid=uuid.uuid4(), owner_username="benchmark", name="Gifts")
+    wishlist.items = [
+        WishlistItem(
+            uuid=uuid.uuid4(),
+            wishlist_uuid=wishlist.uuid,
+            name=f"item {number}",
+            quantity=number,
+            measurement_unit=MeasurementUnit.PIECE,
+            priority=Priority.MEDIUM,
+            is_purchased=number % 2 == 0,
+        )
+        for number in range(items)
+    ]
+    return wishlist
+
+
+def legacy_serialize(wishlist: Wishlist) -> bytes:
+    response = WishlistResponse(
+        uuid=wishlist.uuid,
+        owner_username=wishlist.owner_username,
+        name=wishlist.name,
+        items=[WishlistItemResponse(**asdict(item)) for item in wishlist.items],
+        is_archived=wishlist.is_archived,
+        created_at=wishlist.created_at.isoformat(),
+    )
+    content = loop.run_until_complete(
+        serialize_response(field=response_field, response_content=response)
+    )
+    return JSONResponse(content).body
+
+
+def fast_serialize(wishlist: Wishlist) -> bytes:
+    return dump_wishlist_json(wishlist).encode()
+
+
+def time_serializer(
+    serialize: Callable[[Wishlist], bytes], wishlist: Wishlist, repeat: int
+) -> float:
+    """Average milliseconds per wishlist"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        serialize(wishlist)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main(args: argparse.Namespace):
+    print(f"{'items':>7} {'legacy ms':>10} {'fast ms':>9} {'speedup':>8}")
+    for items in args.items:
+        wishlist = create_wishlist(items)
+        assert legacy_serialize(wishlist) == fast_serialize(wishlist)
+        repeat = max(1, args.repeat * 100 // max(items, 100))
+        legacy = time_serializer(legacy_serialize, wishlist, repeat)
+        fast = time_serializer(fast_serialize, wishlist, repeat)
+        print(f"{items:>7} {legacy:10.3f} {fast:9.3f} {legacy / fast:7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--items", type=int, nargs="+", default=ITEM_COUNTS)
+    main(parser.parse_args())
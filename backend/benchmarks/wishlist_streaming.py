@@ -0,0 +1,145 @@
+"""
+Peak Python memory exporting every wishlist of a user: one list response versus a streamed NDJSON body.
+
+Usage (from the backend directory):
+    python -m benchmarks.wishlist_streaming --wishlists 5000 --items 5
+Runs against a temporary SQLite file (or --database-url). The list row loads all
+wishlists in one query and serializes them at once, as a single page holding them
+all would. The streamed rows read them from a server-side cursor in batches of
+--batch-size and discard each chunk once written. Memory is the tracemalloc peak.
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Awaitable, Callable
+
+from sqlalchemy import NullPool
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import clear_mappers
+
+from src.infrastructure.database.sqlalchemy.orm import (
+    mapper_registry,
+    start_sqlalchemy_mappers,
+)
+from src.infrastructure.entrypoints.fastapi.streaming import (
+    StreamFormat,
+    streaming_json_response,
+)
+from src.modules.users.domain.model import User
+from src.modules.wishlists.domain.model import (
+    MeasurementUnit,
+    Priority,
+    Wishlist,
+    WishlistItem,
+)
+from src.modules.wishlists.entrypoints.fastapi.schemas import (
+    WishlistResponse,
+    dump_wishlists_json,
+)
+from src.modules.wishlists.queries import wishlist_queries
+
+
+async def create_wishlists(
+    session_factory: async_sessionmaker, wishlists: int, items: int
+) -> str:
+    owner = User(
+        username=f"bench_{uuid.uuid4().hex[:8]}",
+        email=f"{uuid.uuid4().hex}@example.com",
+        password_hash="",
+        is_active=True,
+    )
+    created_at = datetime.now(UTC)
+    async with session_factory() as session:
+        session.add(owner)
+        for number in range(wishlists):
+            wishlist = Wishlist(
+                uuid=uuid.uuid4(),
+                owner_username=owner.username,
+                name=f"wishlist {number}",
+                created_at=created_at - timedelta(seconds=number),
+            )
+            wishlist.items = [
+                WishlistItem(
+                    uuid=uuid.uuid4(),
+                    wishlist_uuid=wishlist.uuid,
+                    name=f"item {item_number}",
+                    quantity=1,
+                    measurement_unit=MeasurementUnit.PIECE,
+                    priority=Priority.MEDIUM,
+                )
+                for item_number in range(items)
+            ]
+            session.add(wishlist)
+        await session.commit()
+    return owner.username
+
+
+async def measure(export: Callable[[], Awaitable[int]]) -> tuple[int, float, float]:
+    """Bytes written, peak MiB and milliseconds of an export"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    size = await export()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, peak / 2**20, elapsed * 1000
+
+
+async def main(args: argparse.Namespace):
+    database_url = args.database_url
+    if database_url is None:
+        database_url = f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/benchmark.db"
+    engine_options = (
+        {"poolclass": NullPool} if database_url.startswith("sqlite") else {}
+    )
+    engine = create_async_engine(database_url, **engine_options)
+
+    start_sqlalchemy_mappers()
+    async with engine.begin() as conn:
+        await conn.run_sync(mapper_registry.metadata.create_all)
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async def export_list() -> int:
+        async with session_factory() as session:
+            page = await wishlist_queries.get_wishlists_owned_by(
+                session=session, username=username, limit=args.wishlists
+            )
+            return len(dump_wishlists_json(page.items))
+
+    async def export_stream() -> int:
+        async with session_factory() as session:
+            batches = wishlist_queries.stream_wishlists_owned_by(
+                username=username, batch_size=args.batch_size
+            )(session)
+            response = streaming_json_response(
+                batches, WishlistResponse, StreamFormat.NDJSON
+            )
+            size = 0
+            async for chunk in response.body_iterator:
+                size += len(chunk)
+            return size
+
+    try:
+        username = await create_wishlists(session_factory, args.wishlists, args.items)
+        print(f"{args.wishlists} wishlists with {args.items} items each")
+        print(f"{'export':>8} {'MiB written':>11} {'peak MiB':>9} {'ms':>8}")
+        for name, export in (("list", export_list), ("stream", export_stream)):
+            size, peak, milliseconds = await measure(export)
+            print(f"{name:>8} {size / 2**20:11.1f} {peak:9.1f} {milliseconds:8.0f}")
+    finally:
+        await engine.dispose()
+        clear_mappers()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--wishlists", type=int, default=5000)
+    parser.add_argument("--items", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=500)
+    asyncio.run(main(parser.parse_args()))
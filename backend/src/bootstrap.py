@@ -1,16 +1,29 @@
 import inspect
+from functools import lru_cache
 from typing import Any, Callable
 
-from src.modules.users.application.command_handlers import USER_COMMAND_HANDLERS
-from src.modules.users.application.event_handlers import USER_EVENT_HANDLERS
+from src.modules.users.application.command_handlers import (
+    USER_COMMAND_HANDLERS,
+    handle_refresh_auth_token,
+    handle_resend_activation_code,
+)
+from src.modules.users.application.event_handlers import (
+    USER_COMMITTED_EVENT_HANDLERS,
+    USER_EVENT_HANDLERS,
+    handle_user_created,
+)
 from src.modules.wishlists.application.command_handlers import WISHLIST_COMMAND_HANDLERS
-from src.modules.wishlists.application.event_handlers import WISHLIST_EVENT_HANDLERS
-from src.shared.application.messagebus import Messagebus
-from src.shared.application.uow import UnitOfWork
+from src.modules.wishlists.application.event_handlers import (
+    WISHLIST_COMMITTED_EVENT_HANDLERS,
+    WISHLIST_EVENT_HANDLERS,
+)
+from src.shared.application.messagebus import AsyncMessagebus, RetryPolicy
+from src.shared.application.uow import AsyncUnitOfWork
 from src.shared.domain.commands import Command
 from src.shared.domain.events import DomainEvent
 from src.shared.logger import setup_logging
 from src.shared.ports.activation_code_storage import ActivationCodeStorage
+from src.shared.ports.cache import Cache
 from src.shared.utils.activation_codes.activation_code_generator import (
     ActivationCodeGenerator,
 )
@@ -27,6 +40,26 @@ EVENT_HANDLERS = {
     **USER_EVENT_HANDLERS,
     **WISHLIST_EVENT_HANDLERS,
 }
+# Run by the messagebus that committed an event, the relay runs EVENT_HANDLERS later
+# for every process, so these must be safe to run twice
+COMMITTED_EVENT_HANDLERS = {
+    **USER_COMMITTED_EVENT_HANDLERS,
+    **WISHLIST_COMMITTED_EVENT_HANDLERS,
+}
+# Handlers that never write get a read-only unit of work:
+# no row locks, a read-only transaction and no collected events
+# (login reads through uow.as_read_only() itself and writes only to upgrade a hash)
+READ_ONLY_HANDLERS = {
+    handle_refresh_auth_token,
+    handle_resend_activation_code,
+    handle_user_created,
+}
+
+
+@lru_cache
+def get_handler_parameters(handler: Callable) -> tuple[str, ...]:
+    """Returns handler parameter names. Cached, as handlers are injected on every request."""
+    return tuple(inspect.signature(handler).parameters)
 
 
 def build_handler_with_injected_dependencies(
@@ -35,13 +68,15 @@ def build_handler_with_injected_dependencies(
     """
     Builds a new handler function with injected dependencies based on the original handler's required parameters.
     """
-    params = inspect.signature(handler).parameters
+    params = get_handler_parameters(handler)
     dependencies_to_inject = {
         name: dependencies[name] for name in params if name in dependencies
     }
+    if handler in READ_ONLY_HANDLERS and "uow" in dependencies_to_inject:
+        dependencies_to_inject["uow"] = dependencies_to_inject["uow"].as_read_only()
 
-    def injected_handler(message):
-        return handler(message, **dependencies_to_inject)
+    async def injected_handler(message):
+        return await handler(message, **dependencies_to_inject)
 
     injected_handler.__name__ = handler.__name__
 
@@ -60,52 +95,96 @@ def inject_dependencies(
         command_type: build_handler_with_injected_dependencies(handler, dependencies)
         for command_type, handler in command_handlers.items()
     }
-    injected_event_handlers = {
+    return injected_command_handlers, inject_event_handler_dependencies(
+        event_handlers, dependencies
+    )
+
+
+def inject_event_handler_dependencies(
+    event_handlers: dict[type[DomainEvent], list[Callable]], dependencies
+) -> dict[type[DomainEvent], list[Callable]]:
+    return {
         event_type: [
             build_handler_with_injected_dependencies(handler, dependencies)
             for handler in handlers
         ]
         for event_type, handlers in event_handlers.items()
     }
-    return injected_command_handlers, injected_event_handlers
 
 
-def initialize_messagebus(dependencies: dict[str, Any]) -> Messagebus:
-    """Prepares handlers with injected dependencies and returns a configured Messagebus instance."""
+class MessagebusFactory:
+    """
+    Creates a new AsyncMessagebus with its own AsyncUnitOfWork on every call.
+    Messagebus and UnitOfWork keep per-request state (session, seen aggregates, queue),
+    so they must never be shared between concurrent requests.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], AsyncUnitOfWork],
+        dependencies: dict[str, Any],
+        retry_policy: RetryPolicy = RetryPolicy(),
+    ):
+        self.uow_factory = uow_factory
+        self.dependencies = dependencies
+        self.retry_policy = retry_policy
+
+    def __call__(self) -> AsyncMessagebus:
+        dependencies = {**self.dependencies, "uow": self.uow_factory()}
+
+        injected_command_handlers, injected_event_handlers = inject_dependencies(
+            command_handlers=COMMAND_HANDLERS,
+            event_handlers=EVENT_HANDLERS,
+            dependencies=dependencies,
+        )
+
+        return AsyncMessagebus(
+            uow=dependencies["uow"],
+            command_handlers=injected_command_handlers,
+            event_handlers=injected_event_handlers,
+            dependencies=dependencies,
+            retry_policy=self.retry_policy,
+            committed_event_handlers=inject_event_handler_dependencies(
+                COMMITTED_EVENT_HANDLERS, dependencies
+            ),
+        )
+
+
+def initialize_messagebus(
+    dependencies: dict[str, Any], retry_policy: RetryPolicy = RetryPolicy()
+) -> MessagebusFactory:
+    """Returns a factory creating configured AsyncMessagebus instances with injected dependencies."""
 
     setup_logging("messagebus")
 
-    injected_command_handlers, injected_event_handlers = inject_dependencies(
-        command_handlers=COMMAND_HANDLERS,
-        event_handlers=EVENT_HANDLERS,
-        dependencies=dependencies,
-    )
-
-    return Messagebus(
-        uow=dependencies["uow"],
-        command_handlers=injected_command_handlers,
-        event_handlers=injected_event_handlers,
+    return MessagebusFactory(
+        uow_factory=dependencies["uow_factory"],
         dependencies=dependencies,
+        retry_policy=retry_policy,
     )
 
 
 def create_dependencies_dict(
-    uow: UnitOfWork,
+    uow_factory: Callable[[], AsyncUnitOfWork],
     password_manager: PasswordManager,
     uuid_generator: UUIDGenerator,
     activation_code_generator: ActivationCodeGenerator,
     activation_code_storage: ActivationCodeStorage,
     token_manager: TokenManager,
     notificator: Notificator,
+    user_cache: Cache,
+    wishlist_cache: Cache,
 ) -> dict[str, Any]:
     """Declares dependencies"""
 
     return {
-        "uow": uow,
+        "uow_factory": uow_factory,
         "password_manager": password_manager,
         "uuid_generator": uuid_generator,
         "activation_code_generator": activation_code_generator,
         "activation_code_storage": activation_code_storage,
         "token_manager": token_manager,
         "notificator": notificator,
+        "user_cache": user_cache,
+        "wishlist_cache": wishlist_cache,
     }
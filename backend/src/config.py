@@ -29,6 +29,92 @@ class Settings(BaseSettings):
     postgres_port: int = Field(default=5432, description="PostgreSQL port")
     postgres_db: str = Field(default="postgres", description="PostgreSQL database name")
 
+    # Database connection pool
+    postgres_pool_size: int = Field(
+        default=5, ge=1, description="Number of connections kept open in the pool"
+    )
+    postgres_max_overflow: int = Field(
+        default=10,
+        ge=0,
+        description="Number of connections allowed above the pool size",
+    )
+    postgres_pool_timeout: float = Field(
+        default=30,
+        gt=0,
+        description="Seconds to wait for a free connection before giving up",
+    )
+    postgres_pool_recycle: int = Field(
+        default=1800,
+        ge=-1,
+        description="Seconds after which a connection is replaced (-1 to disable)",
+    )
+    postgres_pool_pre_ping: bool = Field(
+        default=True, description="Test connections for liveness on checkout"
+    )
+    postgres_statement_timeout_ms: int = Field(
+        default=0,
+        ge=0,
+        description="Server-side statement timeout in milliseconds (0 to disable)",
+    )
+
+    # Pagination
+    pagination_default_page_size: int = Field(
+        default=50, ge=1, description="Number of items in a page by default"
+    )
+    pagination_max_page_size: int = Field(
+        default=100, ge=1, description="Maximum number of items a client can request"
+    )
+    pagination_stream_batch_size: int = Field(
+        default=500,
+        ge=1,
+        description="Number of rows fetched from the database at a time when streaming",
+    )
+    wishlist_batch_get_max_size: int = Field(
+        default=100, ge=1, description="Maximum number of wishlists in a batch get"
+    )
+
+    # Concurrency control
+    database_locking_strategy: Literal["optimistic", "pessimistic"] = Field(
+        default="optimistic",
+        description="Detect concurrent changes with version columns, "
+        "or lock aggregates with SELECT ... FOR UPDATE",
+    )
+    command_retry_attempts: int = Field(
+        default=10,
+        ge=1,
+        description="Attempts to handle a command that conflicts with a concurrent change",
+    )
+    command_retry_base_delay_seconds: float = Field(
+        default=0.01, ge=0, description="Delay before the first command retry"
+    )
+    command_retry_max_delay_seconds: float = Field(
+        default=0.5,
+        ge=0,
+        description="Upper bound of the delay between command retries",
+    )
+
+    # Outbox relay
+    outbox_relay_batch_size: int = Field(
+        default=100, ge=1, description="Number of events relayed in one transaction"
+    )
+    outbox_relay_poll_interval_seconds: float = Field(
+        default=1.0, gt=0, description="Seconds to wait when the outbox is empty"
+    )
+    outbox_relay_max_attempts: int = Field(
+        default=10, ge=1, description="Delivery attempts before an event is dropped"
+    )
+    outbox_relay_retry_base_delay_seconds: float = Field(
+        default=1.0,
+        gt=0,
+        description="Delay before the first retry, doubled on every next attempt",
+    )
+    outbox_relay_in_app: bool = Field(
+        default=False,
+        description="Relay events from the API process instead of the outbox-relay "
+        "worker deployed by compose.yml and k8s/workers.yaml "
+        "(always enabled in development, where Redis is faked in-process)",
+    )
+
     # Security
     secret_key: str = Field(
         default="dev-secret-key",
@@ -36,6 +122,34 @@ class Settings(BaseSettings):
         description="Secret key for JWT authentication",
     )
 
+    # Password hashing
+    password_hashing_time_cost: int = Field(
+        default=3, ge=1, description="Argon2 time cost (number of passes)"
+    )
+    password_hashing_memory_cost: int = Field(
+        default=65536, ge=8, description="Argon2 memory cost in KiB"
+    )
+    password_hashing_parallelism: int = Field(
+        default=4, ge=1, description="Argon2 parallelism (number of lanes)"
+    )
+    password_hashing_processes: int = Field(
+        default=2,
+        ge=0,
+        description="Processes hashing passwords (0 hashes in threads of the API process)",
+    )
+    password_hashing_max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Hashing operations in flight before further requests wait",
+    )
+
+    password_strength_max_analyzed_length: int = Field(
+        default=32,
+        ge=9,
+        le=72,
+        description="Leading password characters analyzed by zxcvbn, the rest is ignored",
+    )
+
     # SMTP configuration
     smtp_host: str = Field(default="localhost", description="SMTP server host")
     smtp_port: int = Field(default=25, description="SMTP server port")
@@ -48,7 +162,32 @@ class Settings(BaseSettings):
     smtp_password: str | None = Field(
         default=None, description="SMTP authentication password"
     )
-    smtp_use_tls: bool = Field(default=False, description="Use TLS for SMTP")
+    smtp_use_tls: bool = Field(default=False, description="Use STARTTLS for SMTP")
+    smtp_use_ssl: bool = Field(
+        default=False, description="Connect to SMTP over implicit TLS (SMTPS)"
+    )
+    smtp_timeout_seconds: float = Field(
+        default=10.0, gt=0, description="SMTP connection timeout in seconds"
+    )
+
+    # Email sender worker
+    email_sender_pool_size: int = Field(
+        default=2, ge=1, description="Number of persistent SMTP connections"
+    )
+    email_sender_batch_size: int = Field(
+        default=50, ge=1, description="Number of emails claimed from the queue at once"
+    )
+    email_sender_max_attempts: int = Field(
+        default=5, ge=1, description="Delivery attempts before an email is dropped"
+    )
+    email_sender_retry_base_delay_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        description="Delay before the first retry, doubled on every next attempt",
+    )
+    email_sender_poll_interval_seconds: float = Field(
+        default=1.0, gt=0, description="Seconds to wait when the email queue is empty"
+    )
 
     # Application
     base_url: str = Field(
@@ -57,11 +196,17 @@ class Settings(BaseSettings):
     )
 
     # Token lifetimes
+    access_token_lifetime_in_minutes: int = Field(
+        default=15,
+        ge=1,
+        le=1440,
+        description="Access token lifetime in minutes, user flags in it are trusted until then",
+    )
     token_lifetime_in_hours: int = Field(
         default=24,
         ge=1,
         le=720,
-        description="Auth token lifetime in hours",
+        description="Refresh token lifetime in hours",
     )
     activation_token_lifetime_in_hours: int = Field(
         default=24,
@@ -70,6 +215,48 @@ class Settings(BaseSettings):
         description="Activation token lifetime in hours",
     )
 
+    # User cache
+    user_cache_max_size: int = Field(
+        default=10000, ge=1, description="Users kept in the in-process cache"
+    )
+    user_cache_ttl_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds a user is served from the in-process cache",
+    )
+    user_cache_redis_ttl_seconds: int = Field(
+        default=300, ge=1, description="Seconds a user stays cached in Redis"
+    )
+
+    # Wishlist cache
+    wishlist_cache_ttl_seconds: int = Field(
+        default=300, ge=1, description="Seconds a serialized wishlist stays cached"
+    )
+    wishlist_cache_max_entries: int = Field(
+        default=10000, ge=1, description="Wishlists kept in the Redis cache"
+    )
+    wishlist_cache_max_entry_bytes: int = Field(
+        default=256 * 1024,
+        ge=1,
+        description="Serialized wishlists above this size are not cached",
+    )
+    wishlist_cache_local_max_size: int = Field(
+        default=1000, ge=1, description="Wishlists kept in the in-process cache"
+    )
+    wishlist_cache_local_ttl_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        description="Seconds a wishlist is served from the in-process cache",
+    )
+    wishlist_cache_lock_timeout_seconds: float | None = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Seconds other processes wait for a wishlist being loaded into the cache, "
+            "cross-process coalescing is disabled when unset"
+        ),
+    )
+
     # Redis configuration
     redis_host: str = Field(default="localhost", description="Redis host")
     redis_port: int = Field(default=6379, description="Redis port")
@@ -79,6 +266,18 @@ class Settings(BaseSettings):
         le=15,
         description="Redis activation codes database",
     )
+    redis_email_queue_db: int = Field(
+        default=1,
+        ge=0,
+        le=15,
+        description="Redis email queue database",
+    )
+    redis_cache_db: int = Field(
+        default=2,
+        ge=0,
+        le=15,
+        description="Redis response cache database",
+    )
     redis_password: str | None = Field(default=None, description="Redis password")
 
     # User name validation
@@ -114,8 +313,21 @@ class Settings(BaseSettings):
         )
 
     @property
-    def auth_token_lifetime(self) -> datetime.timedelta:
-        """Get auth token lifetime as timedelta."""
+    def postgres_async_uri(self) -> str:
+        """Generate PostgreSQL connection URI for the asyncio driver."""
+        return (
+            f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}"
+            f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
+        )
+
+    @property
+    def access_token_lifetime(self) -> datetime.timedelta:
+        """Get access token lifetime as timedelta."""
+        return datetime.timedelta(minutes=self.access_token_lifetime_in_minutes)
+
+    @property
+    def refresh_token_lifetime(self) -> datetime.timedelta:
+        """Get refresh token lifetime as timedelta."""
         return datetime.timedelta(hours=self.token_lifetime_in_hours)
 
     @property
@@ -0,0 +1,41 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Concurrent loads of the same key share one in-flight task, whose result or
+    exception is returned to every caller. The task is shielded, so a cancelled
+    caller does not cancel the load for the others.
+    """
+
+    def __init__(self):
+        self._in_flight: dict[tuple[asyncio.AbstractEventLoop, K], asyncio.Task] = {}
+        self.loads = 0
+        self.coalesced = 0
+
+    async def do(self, key: K, load: Callable[[], Awaitable[V]]) -> V:
+        # Tasks can only be awaited from the loop running them
+        flight_key = (asyncio.get_running_loop(), key)
+        task = self._in_flight.get(flight_key)
+        if task is None:
+            task = asyncio.ensure_future(load())
+            self._in_flight[flight_key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(flight_key, None))
+            self.loads += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    def snapshot(self) -> dict:
+        return {
+            "loads": self.loads,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
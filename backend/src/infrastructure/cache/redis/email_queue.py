@@ -0,0 +1,76 @@
+import time
+
+import redis
+
+from src.config import settings
+from src.shared.ports.email_queue import EmailMessage, EmailQueue
+
+
+class RedisEmailQueue(EmailQueue):
+    """
+    Reliable queue: claimed messages are moved to a processing list and stay there
+    until acknowledged, retries wait in a sorted set scored by their due time.
+    """
+
+    PENDING_KEY = "email_queue:pending"
+    PROCESSING_KEY = "email_queue:processing"
+    DELAYED_KEY = "email_queue:delayed"
+
+    def __init__(self, redis_client: redis.Redis = None):
+        if redis_client:
+            self.redis_client = redis_client
+        else:
+            self.redis_client = redis.Redis(
+                host=settings.redis_host,
+                port=settings.redis_port,
+                db=settings.redis_email_queue_db,
+                password=settings.redis_password,
+            )
+
+    def enqueue(self, message: EmailMessage) -> None:
+        self.redis_client.lpush(self.PENDING_KEY, message.to_json())
+
+    def claim(self, count: int) -> list[EmailMessage]:
+        self._promote_due_retries()
+
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for _ in range(count):
+            pipeline.lmove(self.PENDING_KEY, self.PROCESSING_KEY, "RIGHT", "LEFT")
+        payloads = pipeline.execute()
+
+        return [
+            EmailMessage.from_json(payload)
+            for payload in payloads
+            if payload is not None
+        ]
+
+    def ack(self, messages: list[EmailMessage]) -> None:
+        if not messages:
+            return
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for message in messages:
+            pipeline.lrem(self.PROCESSING_KEY, 1, message.to_json())
+        pipeline.execute()
+
+    def retry(self, message: EmailMessage, delay: float) -> None:
+        pipeline = self.redis_client.pipeline()
+        pipeline.lrem(self.PROCESSING_KEY, 1, message.to_json())
+        pipeline.zadd(
+            self.DELAYED_KEY, {message.next_attempt().to_json(): time.time() + delay}
+        )
+        pipeline.execute()
+
+    def requeue_unacknowledged(self) -> int:
+        requeued = 0
+        while self.redis_client.lmove(
+            self.PROCESSING_KEY, self.PENDING_KEY, "LEFT", "RIGHT"
+        ):
+            requeued += 1
+        return requeued
+
+    def _promote_due_retries(self) -> None:
+        due = self.redis_client.zrangebyscore(self.DELAYED_KEY, 0, time.time())
+        for payload in due:
+            # Only the sender that removed the entry requeues it
+            if self.redis_client.zrem(self.DELAYED_KEY, payload):
+                self.redis_client.lpush(self.PENDING_KEY, payload)
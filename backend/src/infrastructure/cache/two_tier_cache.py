@@ -0,0 +1,333 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable
+from uuid import uuid4
+
+import redis.asyncio as redis
+
+from src.config import settings
+from src.infrastructure.cache.memory.single_flight import SingleFlight
+from src.infrastructure.cache.memory.ttl_cache import TTLCache
+from src.shared.ports.cache import Cache
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache_invalidation"
+
+
+def create_cache_redis_client() -> redis.Redis:
+    return redis.Redis(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        db=settings.redis_cache_db,
+        password=settings.redis_password,
+    )
+
+
+class TwoTierCache(Cache):
+    """
+    Bounded in-process cache (L1) in front of Redis (L2), keys scoped by namespace.
+
+    Redis entries expire after ttl seconds, values above max_entry_bytes are not
+    cached, and once max_entries is exceeded the oldest entries are removed.
+    Redis errors are logged and treated as misses.
+
+    Invalidations delete the Redis entry and are published on INVALIDATION_CHANNEL,
+    every process running listen_for_invalidations drops the key from its L1.
+    A value read from Redis just before its invalidation may still be kept in L1,
+    so local_ttl bounds how long a process can serve a stale value.
+    Invalidations also bump a per-key generation in Redis, and a loaded value is only
+    stored if the generation did not change while it was loading.
+
+    Concurrent misses for the same key in a process share one load. With
+    lock_timeout set, the loading process also holds a short Redis lock, and other
+    processes wait up to lock_timeout for its value instead of loading it too.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        redis_client: redis.Redis = None,
+        ttl: int = 300,
+        max_entries: int = 10000,
+        max_entry_bytes: int = 256 * 1024,
+        local_max_size: int = 1000,
+        local_ttl: float = 5.0,
+        coalesce: bool = True,
+        lock_timeout: float | None = None,
+        lock_poll_interval: float = 0.02,
+    ):
+        self.namespace = namespace
+        self.redis_client = redis_client or create_cache_redis_client()
+        self.local_cache: TTLCache[str, str] = TTLCache(
+            max_size=local_max_size, ttl=local_ttl
+        )
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_entry_bytes = max_entry_bytes
+        self.single_flight: SingleFlight[str, str] | None = (
+            SingleFlight() if coalesce else None
+        )
+        self.lock_timeout = lock_timeout
+        self.lock_poll_interval = lock_poll_interval
+        self.redis_hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.skipped = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.stale_loads = 0
+        self.lock_waits = 0
+        self.lock_timeouts = 0
+
+    async def get(self, key: str) -> str | None:
+        value = self.local_cache.get(key)
+        if value is not None:
+            return value
+
+        try:
+            value = await self.redis_client.get(self._key(key))
+        except redis.RedisError as e:
+            self._record_error(e)
+            return None
+
+        if value is None:
+            self.misses += 1
+            return None
+        self.redis_hits += 1
+        value = value.decode()
+        self.local_cache.set(key, value)
+        return value
+
+    async def get_or_load(self, key: str, load: Callable[[], Awaitable[str]]) -> str:
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        if self.single_flight is None:
+            return await self._load(key, load)
+        return await self.single_flight.do(key, lambda: self._load(key, load))
+
+    async def set(self, key: str, value: str) -> None:
+        encoded = self._encode(value)
+        if encoded is None:
+            return
+
+        self.local_cache.set(key, value)
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipeline:
+                self._queue_store(pipeline, key, encoded)
+                *_, size = await pipeline.execute()
+            await self._evict_above_max_entries(size)
+        except redis.RedisError as e:
+            self._record_error(e)
+
+    async def invalidate(self, key: str) -> None:
+        self.local_cache.invalidate(key)
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipeline:
+                pipeline.delete(self._key(key))
+                pipeline.zrem(self._index_key(), key)
+                pipeline.incr(self._generation_key(key))
+                pipeline.expire(self._generation_key(key), self.ttl)
+                pipeline.publish(INVALIDATION_CHANNEL, f"{self.namespace}:{key}")
+                deleted, *_ = await pipeline.execute()
+        except redis.RedisError as e:
+            self._record_error(e)
+            return
+        self.invalidations += deleted
+
+    async def listen_for_invalidations(self, reconnect_delay: float = 1.0) -> None:
+        """Drops invalidated keys from L1 until cancelled"""
+        while True:
+            try:
+                async with self.redis_client.pubsub() as pubsub:
+                    await pubsub.subscribe(INVALIDATION_CHANNEL)
+                    # Invalidations published while unsubscribed were missed
+                    self.local_cache.clear()
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._handle_invalidation(message["data"].decode())
+            except redis.RedisError as e:
+                self._record_error(e)
+                await asyncio.sleep(reconnect_delay)
+
+    def snapshot(self) -> dict:
+        local_hits = self.local_cache.hits
+        lookups = local_hits + self.redis_hits + self.misses
+        return {
+            "hits": local_hits + self.redis_hits,
+            "local_hits": local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_ratio": (local_hits + self.redis_hits) / lookups if lookups else 0.0,
+            "errors": self.errors,
+            "skipped_oversized": self.skipped,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "stale_loads": self.stale_loads,
+            "ttl_seconds": self.ttl,
+            "max_entries": self.max_entries,
+            "lock_waits": self.lock_waits,
+            "lock_timeouts": self.lock_timeouts,
+            **(self.single_flight.snapshot() if self.single_flight else {}),
+            "local": self.local_cache.snapshot(),
+        }
+
+    def _handle_invalidation(self, message: str) -> None:
+        namespace, _, key = message.partition(":")
+        if namespace == self.namespace:
+            self.local_cache.invalidate(key)
+
+    async def _load(self, key: str, load: Callable[[], Awaitable[str]]) -> str:
+        if self.lock_timeout is None:
+            return await self._load_and_set(key, load)
+
+        lock_key = self._lock_key(key)
+        token = uuid4().hex
+        try:
+            acquired = await self.redis_client.set(
+                lock_key, token, nx=True, px=round(self.lock_timeout * 1000)
+            )
+        except redis.RedisError as e:
+            self._record_error(e)
+            return await self._load_and_set(key, load)
+
+        if not acquired:
+            self.lock_waits += 1
+            value = await self._wait_for_value(key)
+            if value is not None:
+                return value
+            return await self._load_and_set(key, load)
+
+        try:
+            return await self._load_and_set(key, load)
+        finally:
+            await self._release_lock(lock_key, token)
+
+    async def _load_and_set(self, key: str, load: Callable[[], Awaitable[str]]) -> str:
+        try:
+            generation = await self.redis_client.get(self._generation_key(key))
+        except redis.RedisError as e:
+            self._record_error(e)
+            value = await load()
+            await self.set(key, value)
+            return value
+
+        value = await load()
+        await self._set_if_not_invalidated(key, value, generation)
+        return value
+
+    async def _set_if_not_invalidated(
+        self, key: str, value: str, generation: bytes | None
+    ) -> None:
+        """Stores a loaded value unless the key was invalidated since the load started"""
+        encoded = self._encode(value)
+        if encoded is None:
+            return
+
+        generation_key = self._generation_key(key)
+        try:
+            async with self.redis_client.pipeline(transaction=True) as pipeline:
+                await pipeline.watch(generation_key)
+                if await pipeline.get(generation_key) != generation:
+                    self.stale_loads += 1
+                    return
+                pipeline.multi()
+                self._queue_store(pipeline, key, encoded)
+                *_, size = await pipeline.execute()
+        except redis.WatchError:
+            self.stale_loads += 1
+            return
+        except redis.RedisError as e:
+            self._record_error(e)
+            self.local_cache.set(key, value)
+            return
+
+        self.local_cache.set(key, value)
+        try:
+            await self._evict_above_max_entries(size)
+        except redis.RedisError as e:
+            self._record_error(e)
+
+    def _encode(self, value: str) -> bytes | None:
+        """Value as stored in Redis, None if it is too large to cache"""
+        # Encoded once, as non-ASCII characters take up to 4 bytes in Redis
+        encoded = value.encode()
+        if len(encoded) > self.max_entry_bytes:
+            self.skipped += 1
+            return None
+        return encoded
+
+    def _queue_store(
+        self, pipeline: redis.client.Pipeline, key: str, encoded: bytes
+    ) -> None:
+        pipeline.set(self._key(key), encoded, ex=self.ttl)
+        pipeline.zadd(self._index_key(), {key: time.time()})
+        pipeline.zcard(self._index_key())
+
+    async def _wait_for_value(self, key: str) -> str | None:
+        """Polls for the lock holder's value, None once the lock is gone without one"""
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.lock_poll_interval)
+            try:
+                async with self.redis_client.pipeline(transaction=False) as pipeline:
+                    pipeline.get(self._key(key))
+                    pipeline.exists(self._lock_key(key))
+                    value, locked = await pipeline.execute()
+            except redis.RedisError as e:
+                self._record_error(e)
+                return None
+            if value is not None:
+                return value.decode()
+            if not locked:
+                return None
+
+        self.lock_timeouts += 1
+        return None
+
+    async def _release_lock(self, lock_key: str, token: str) -> None:
+        """Deletes the lock unless it expired and was taken by another process"""
+        try:
+            async with self.redis_client.pipeline(transaction=True) as pipeline:
+                await pipeline.watch(lock_key)
+                if await pipeline.get(lock_key) == token.encode():
+                    pipeline.multi()
+                    pipeline.delete(lock_key)
+                    await pipeline.execute()
+        except redis.WatchError:
+            pass
+        except redis.RedisError as e:
+            self._record_error(e)
+
+    async def _evict_above_max_entries(self, size: int) -> None:
+        if size > self.max_entries:
+            await self._evict_oldest(size - self.max_entries)
+
+    async def _evict_oldest(self, count: int) -> None:
+        oldest = await self.redis_client.zpopmin(self._index_key(), count)
+        if oldest:
+            await self.redis_client.delete(
+                *(self._key(member.decode()) for member, _ in oldest)
+            )
+            for member, _ in oldest:
+                self.local_cache.invalidate(member.decode())
+            self.evictions += len(oldest)
+
+    def _key(self, key: str) -> str:
+        return f"cache:{self.namespace}:{key}"
+
+    def _index_key(self) -> str:
+        return f"cache_index:{self.namespace}"
+
+    def _generation_key(self, key: str) -> str:
+        return f"cache_generation:{self.namespace}:{key}"
+
+    def _lock_key(self, key: str) -> str:
+        return f"cache_lock:{self.namespace}:{key}"
+
+    def _record_error(self, error: Exception) -> None:
+        self.errors += 1
+        logger.warning(f"{self.namespace} cache unavailable: {error}")
@@ -1,16 +1,18 @@
+import asyncio
 import logging
-import time
 
 import alembic.config
 from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
 
-from src.infrastructure.database.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
+from src.infrastructure.database.sqlalchemy.unit_of_work import (
+    SQLAlchemyAsyncUnitOfWork,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def wait_for_database(max_retries: int = 10) -> None:
+async def wait_for_database(max_retries: int = 10) -> None:
     """
     Wait for the database to become available.
 
@@ -18,29 +20,25 @@ def wait_for_database(max_retries: int = 10) -> None:
         Exception: If database is not available after max_retries
     """
 
+    engine = SQLAlchemyAsyncUnitOfWork.get_engine()
+
     for attempt in range(1, max_retries + 1):
         try:
-            engine = SQLAlchemyUnitOfWork.get_engine()
-
-            with engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
             logger.info(f"Database connected (attempt {attempt})")
-            engine.dispose()
             return
-        except OperationalError as e:
+        except (OperationalError, OSError) as e:
             if attempt < max_retries:
                 logger.warning(
                     f"Database not ready, retrying... ({attempt}/{max_retries})"
                 )
-                time.sleep(5)
+                await asyncio.sleep(5)
             else:
-                engine.dispose()
                 raise Exception(
                     f"Database unavailable after {max_retries} attempts"
                 ) from e
 
-    engine.dispose()
-
 
 def run_migrations():
     alembic_args = [
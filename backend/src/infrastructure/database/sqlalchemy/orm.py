@@ -1,17 +1,22 @@
 from sqlalchemy import (
+    JSON,
+    BigInteger,
     Boolean,
     Column,
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
     Uuid,
     event,
+    false,
 )
 from sqlalchemy.orm import registry, relationship
 
+from src.infrastructure.database.sqlalchemy.outbox import OutboxMessage
 from src.modules.users.domain import model as user_domain_model
 from src.modules.wishlists.domain import model as wishlist_domain_model
 
@@ -25,6 +30,8 @@ users = Table(
     Column("password_hash", String),
     Column("is_active", Boolean),
     Column("is_superuser", Boolean, default=False),
+    Column("token_generation", Integer, nullable=False, server_default="0"),
+    Column("version", Integer, nullable=False, server_default="1"),
 )
 
 wishlists = Table(
@@ -39,7 +46,23 @@ wishlists = Table(
     ),
     Column("name", String),
     Column("is_archived", Boolean),
-    Column("created_at", DateTime),
+    Column("created_at", DateTime(timezone=True)),
+    Column("version", Integer, nullable=False, server_default="1"),
+)
+Index(
+    "ix_wishlists_owner_username_is_archived_created_at_uuid",
+    wishlists.c.owner_username,
+    wishlists.c.is_archived,
+    wishlists.c.created_at.desc(),
+    wishlists.c.uuid.desc(),
+)
+Index(
+    "ix_wishlists_active_owner_username_created_at_uuid",
+    wishlists.c.owner_username,
+    wishlists.c.created_at.desc(),
+    wishlists.c.uuid.desc(),
+    postgresql_where=wishlists.c.is_archived == false(),
+    sqlite_where=wishlists.c.is_archived == false(),
 )
 
 wishlist_items = Table(
@@ -57,6 +80,23 @@ wishlist_items = Table(
     Column("measurement_unit", Enum(wishlist_domain_model.MeasurementUnit)),
     Column("priority", Enum(wishlist_domain_model.Priority)),
     Column("is_purchased", Boolean),
+    Index("ix_wishlist_items_wishlist_uuid", "wishlist_uuid"),
+)
+
+outbox = Table(
+    "outbox",
+    mapper_registry.metadata,
+    Column(
+        "id",
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    Column("event_type", String, nullable=False),
+    Column("payload", JSON, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("attempts", Integer, nullable=False, server_default="0"),
+    Column("next_attempt_at", DateTime(timezone=True)),
 )
 
 
@@ -68,23 +108,30 @@ def add_events_field_listener(aggregate):
 
 def start_sqlalchemy_mappers():
     # Users context
-    mapper_registry.map_imperatively(user_domain_model.User, users)
+    mapper_registry.map_imperatively(
+        user_domain_model.User, users, version_id_col=users.c.version
+    )
 
     # Wishlists context
     mapper_registry.map_imperatively(
         wishlist_domain_model.Wishlist,
         wishlists,
+        version_id_col=wishlists.c.version,
         properties={
             "items": relationship(
                 wishlist_domain_model.WishlistItem,
                 order_by=wishlist_items.c.uuid,
-                lazy="dynamic",
+                # Items are loaded explicitly by queries and repositories (selectinload)
+                lazy="raise",
                 cascade="all, delete-orphan",
             )
         },
     )
     mapper_registry.map_imperatively(wishlist_domain_model.WishlistItem, wishlist_items)
 
+    # Outbox
+    mapper_registry.map_imperatively(OutboxMessage, outbox)
+
     # Add events field to loaded aggregates
     aggregates = [
         user_domain_model.User,
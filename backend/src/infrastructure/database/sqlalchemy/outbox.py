@@ -0,0 +1,129 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import Callable, Optional
+
+from pydantic import TypeAdapter
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.shared.application.messagebus import AsyncMessagebus
+from src.shared.domain.events import DomainEvent
+
+logger = logging.getLogger("outbox")
+
+
+@lru_cache
+def get_event_adapter(event_type: type[DomainEvent]) -> TypeAdapter:
+    return TypeAdapter(event_type)
+
+
+@dataclass(kw_only=True)
+class OutboxMessage:
+    """A domain event stored in the same transaction as the changes that raised it."""
+
+    id: Optional[int] = None
+    event_type: str
+    payload: dict
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    attempts: int = 0
+    next_attempt_at: Optional[datetime] = None
+
+    @classmethod
+    def from_event(cls, event: DomainEvent) -> "OutboxMessage":
+        adapter = get_event_adapter(type(event))
+        return cls(
+            event_type=type(event).__name__,
+            payload=adapter.dump_python(event, mode="json"),
+        )
+
+    def to_event(self, event_types: dict[str, type[DomainEvent]]) -> DomainEvent:
+        event_type = event_types[self.event_type]
+        return get_event_adapter(event_type).validate_python(self.payload)
+
+
+class OutboxRelay:
+    """
+    Dispatches stored events to event handlers in batches.
+    A message is deleted in the transaction that claimed it, after its event was handled,
+    so a crash before that commit delivers the event again (at-least-once delivery).
+    When a handler fails the message is kept and retried with exponential backoff
+    until max_attempts is reached.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        messagebus_factory: Callable[[], AsyncMessagebus],
+        event_types: dict[str, type[DomainEvent]],
+        batch_size: int = 100,
+        max_attempts: int = 10,
+        retry_base_delay: float = 1.0,
+        poll_interval: float = 1.0,
+    ):
+        self.session_factory = session_factory
+        self.messagebus_factory = messagebus_factory
+        self.event_types = event_types
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.poll_interval = poll_interval
+
+    async def relay_batch(self) -> int:
+        """Relays one batch of the oldest due messages. Returns the number of claimed messages."""
+        now = datetime.now(UTC)
+        async with self.session_factory() as session:
+            messages = (
+                await session.scalars(
+                    select(OutboxMessage)
+                    .where(
+                        or_(
+                            OutboxMessage.next_attempt_at.is_(None),
+                            OutboxMessage.next_attempt_at <= now,
+                        )
+                    )
+                    .order_by(OutboxMessage.id)
+                    .limit(self.batch_size)
+                    # Concurrent relays claim different batches
+                    .with_for_update(skip_locked=True)
+                )
+            ).all()
+            for message in messages:
+                if message.event_type not in self.event_types:
+                    logger.error(f"Dropping outbox message of unknown type {message}")
+                elif not await self._dispatch(message, now):
+                    continue
+                await session.delete(message)
+            await session.commit()
+        return len(messages)
+
+    async def _dispatch(self, message: OutboxMessage, now: datetime) -> bool:
+        """Handles the event of a message. Returns False if it should be retried later."""
+        event = message.to_event(self.event_types)
+        try:
+            await self.messagebus_factory().handle(event, raise_on_error=True)
+        except Exception:
+            message.attempts += 1
+            if message.attempts >= self.max_attempts:
+                logger.error(
+                    f"Dropping outbox message {message.id} after {message.attempts} attempts"
+                )
+                return True
+            delay = self.retry_base_delay * 2 ** (message.attempts - 1)
+            message.next_attempt_at = now + timedelta(seconds=delay)
+            return False
+        return True
+
+    async def run(self):
+        """Relays messages until cancelled, sleeping when the outbox is drained."""
+        logger.info("Outbox relay started")
+        while True:
+            try:
+                relayed = await self.relay_batch()
+            except Exception as e:
+                logger.exception(f"Failed to relay outbox messages. Exception: {e}")
+                relayed = 0
+            if relayed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
@@ -0,0 +1,38 @@
+from typing import Any, AsyncIterator, Callable, Sequence, TypeVar
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.shared.application.pagination import Page, encode_cursor
+
+T = TypeVar("T")
+
+
+async def fetch_page(
+    session: AsyncSession,
+    stmt: Select,
+    limit: int,
+    keyset: Callable[[T], tuple[Any, ...]],
+    scalars: bool = True,
+) -> Page[T]:
+    """
+    Fetch one page of an ordered statement, reading one extra row to detect the next page.
+    Items are the first column of each row, or whole rows if scalars is False.
+    """
+    result = await session.execute(stmt.limit(limit + 1))
+    rows = (result.scalars() if scalars else result).all()
+    items = rows[:limit]
+    next_cursor = encode_cursor(*keyset(items[-1])) if len(rows) > limit else None
+    return Page(items=items, next_cursor=next_cursor)
+
+
+async def stream_batches(
+    session: AsyncSession, stmt: Select, batch_size: int
+) -> AsyncIterator[Sequence[T]]:
+    """
+    Stream the first column of an ordered statement in batches from a server-side
+    cursor, so only one batch of rows is held in memory at a time.
+    """
+    result = await session.stream_scalars(stmt.execution_options(yield_per=batch_size))
+    async for batch in result.partitions():
+        yield batch
@@ -1,22 +1,22 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.modules.users.domain.model import User
 from src.modules.users.infrastructure.user_repository import UserRepository
 from src.shared.application.exceptions import UserNotFound
 
 
-class SQLAlchemyUserRepository(UserRepository):
-    def __init__(self, session: Session):
+class SQLAlchemyAsyncUserRepository(UserRepository):
+    def __init__(self, session: AsyncSession, lock_for_update: bool = False):
         super().__init__()
         self.session = session
+        self.lock_for_update = lock_for_update
 
-    def _get(self, username: str) -> User:
-        user = (
-            self.session.query(User)
-            .filter_by(username=username)
-            .with_for_update()
-            .first()
-        )
+    async def _get(self, username: str) -> User:
+        stmt = select(User).filter_by(username=username)
+        if self.lock_for_update:
+            stmt = stmt.with_for_update()
+        user = await self.session.scalar(stmt)
         if not user:
             raise UserNotFound(username=username)
         return user
@@ -1,31 +1,48 @@
-from typing import Type
+from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.modules.wishlists.domain.model import Wishlist
 from src.modules.wishlists.infrastructure.wishlist_repository import WishlistRepository
 from src.shared.application.exceptions import WishlistNotFound
 
 
-class SQLAlchemyWishlistRepository(WishlistRepository):
-    def __init__(self, session: Session):
+class SQLAlchemyAsyncWishlistRepository(WishlistRepository):
+    def __init__(self, session: AsyncSession, lock_for_update: bool = False):
         super().__init__()
         self.session = session
+        self.lock_for_update = lock_for_update
 
-    def _get(self, uuid: UUID) -> Wishlist:
-        wishlist = (
-            self.session.query(Wishlist).filter_by(uuid=uuid).with_for_update().first()
+    async def _get(self, uuid: UUID) -> Wishlist:
+        stmt = (
+            select(Wishlist).filter_by(uuid=uuid).options(selectinload(Wishlist.items))
         )
+        if self.lock_for_update:
+            stmt = stmt.with_for_update()
+        wishlist = await self.session.scalar(stmt)
         if not wishlist:
             raise WishlistNotFound(uuid)
         return wishlist
 
-    def _list_all(self) -> list[Type[Wishlist]]:
-        return self.session.query(Wishlist).all()
-
-    def _list_owned_by(self, username: str) -> list[Type[Wishlist]]:
-        return self.session.query(Wishlist).filter_by(owner_username=username).all()
+    async def _list_all(self) -> Sequence[Wishlist]:
+        return (
+            await self.session.scalars(
+                select(Wishlist).options(selectinload(Wishlist.items))
+            )
+        ).all()
+
+    async def _list_owned_by(self, username: str) -> Sequence[Wishlist]:
+        return (
+            await self.session.scalars(
+                select(Wishlist)
+                .filter_by(owner_username=username)
+                .order_by(Wishlist.created_at)
+                .options(selectinload(Wishlist.items))
+            )
+        ).all()
 
     def _add(self, user: Wishlist):
         self.session.add(user)
@@ -0,0 +1,36 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+
+# Sessions holding a connection, tracked per request (see track_open_sessions)
+_open_sessions: ContextVar[Optional[set[Session]]] = ContextVar(
+    "open_sessions", default=None
+)
+
+
+@contextmanager
+def track_open_sessions() -> Iterator[set[Session]]:
+    """Collects sessions that begin a transaction inside the block and did not release it"""
+    open_sessions = set()
+    token = _open_sessions.set(open_sessions)
+    try:
+        yield open_sessions
+    finally:
+        _open_sessions.reset(token)
+
+
+@event.listens_for(Session, "after_begin")
+def _track_session(session: Session, transaction: SessionTransaction, connection):
+    open_sessions = _open_sessions.get()
+    if open_sessions is not None:
+        open_sessions.add(session)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _untrack_session(session: Session, transaction: SessionTransaction):
+    open_sessions = _open_sessions.get()
+    if open_sessions is not None and transaction.parent is None:
+        open_sessions.discard(session)
@@ -1,40 +1,123 @@
 from typing import Optional
 
-from sqlalchemy import Engine, create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm.exc import StaleDataError
+
 from src.config import settings
+from src.infrastructure.database.sqlalchemy.outbox import OutboxMessage
+from src.infrastructure.database.sqlalchemy.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    pool_metrics,
+)
 from src.infrastructure.database.sqlalchemy.repositories.user_repository import (
-    SQLAlchemyUserRepository,
+    SQLAlchemyAsyncUserRepository,
 )
 from src.infrastructure.database.sqlalchemy.repositories.wishlist_repository import (
-    SQLAlchemyWishlistRepository,
+    SQLAlchemyAsyncWishlistRepository,
 )
-from src.shared.application.uow import UnitOfWork
+from src.shared.application.exceptions import ConcurrentModification
+from src.shared.application.uow import AsyncUnitOfWork
 
 
-class SQLAlchemyUnitOfWork(UnitOfWork):
-    _shared_engine: Optional[Engine] = None
+class SQLAlchemyAsyncUnitOfWork(AsyncUnitOfWork):
+    _shared_engine: Optional[AsyncEngine] = None
 
     @classmethod
-    def get_engine(cls) -> Engine:
+    def get_engine(cls) -> AsyncEngine:
         if cls._shared_engine is None:
-            cls._shared_engine = create_engine(
-                settings.postgres_uri,
+            connect_args = {}
+            if settings.postgres_statement_timeout_ms:
+                connect_args["server_settings"] = {
+                    "statement_timeout": str(settings.postgres_statement_timeout_ms)
+                }
+
+            cls._shared_engine = create_async_engine(
+                settings.postgres_async_uri,
+                poolclass=InstrumentedAsyncAdaptedQueuePool,
+                pool_size=settings.postgres_pool_size,
+                max_overflow=settings.postgres_max_overflow,
+                pool_timeout=settings.postgres_pool_timeout,
+                pool_recycle=settings.postgres_pool_recycle,
+                pool_pre_ping=settings.postgres_pool_pre_ping,
+                connect_args=connect_args,
             )
+            pool_metrics.listen(cls._shared_engine)
         return cls._shared_engine
 
-    def __init__(self, session_factory: Optional[sessionmaker] = None):
-        super().__init__()
-        self.session_factory = session_factory or sessionmaker(bind=self.get_engine())
+    @classmethod
+    def create_session_factory(cls) -> async_sessionmaker:
+        # Loaded objects are used after commit (e.g. by event handlers),
+        # expiring them would require implicit IO, which is not allowed with asyncio
+        return async_sessionmaker(bind=cls.get_engine(), expire_on_commit=False)
+
+    def __init__(
+        self,
+        session_factory: Optional[async_sessionmaker] = None,
+        lock_for_update: Optional[bool] = None,
+        read_only: bool = False,
+    ):
+        super().__init__(read_only=read_only)
+        self.session_factory = session_factory or self.create_session_factory()
+        # Aggregates are versioned, so row locks are only taken when configured
+        self.lock_for_update = (
+            settings.database_locking_strategy == "pessimistic"
+            if lock_for_update is None
+            else lock_for_update
+        )
+
+    def as_read_only(self) -> "SQLAlchemyAsyncUnitOfWork":
+        return SQLAlchemyAsyncUnitOfWork(self.session_factory, read_only=True)
 
-    def _commit(self):
-        self.session.commit()
+    async def _commit(self):
+        # Events are stored with the changes that raised them and dispatched by
+        # the outbox relay, so nothing is left for in-process dispatch
+        events = list(self.collect_new_events())
+        self.session.add_all(OutboxMessage.from_event(event) for event in events)
+        try:
+            await self.session.commit()
+        except StaleDataError as e:
+            raise ConcurrentModification() from e
+        self.committed_events.extend(events)
 
-    def _rollback(self):
-        self.session.rollback()
+    async def _rollback(self):
+        await self.session.rollback()
 
-    def __enter__(self):
+    async def __aenter__(self):
         self.session = self.session_factory()
-        self.user_repository = SQLAlchemyUserRepository(self.session)
-        self.wishlist_repository = SQLAlchemyWishlistRepository(self.session)
-        return super().__enter__()
+        lock_for_update = self.lock_for_update and not self.read_only
+        self.user_repository = SQLAlchemyAsyncUserRepository(
+            self.session, lock_for_update=lock_for_update
+        )
+        self.wishlist_repository = SQLAlchemyAsyncWishlistRepository(
+            self.session, lock_for_update=lock_for_update
+        )
+        if self.read_only:
+            # Begins a READ ONLY transaction on PostgreSQL, other dialects ignore it
+            await self.session.connection(
+                execution_options={"postgresql_readonly": True}
+            )
+        return await super().__aenter__()
+
+    async def __aexit__(self, *args):
+        # Closing the session rolls back uncommitted changes without expiring
+        # loaded objects, so handlers can still read them after the unit of work ends
+        await self.session.close()
+
+
+class SQLAlchemyAsyncUnitOfWorkFactory:
+    """Creates a new SQLAlchemyAsyncUnitOfWork on every call. All of them share one session factory."""
+
+    def __init__(
+        self,
+        session_factory: Optional[async_sessionmaker] = None,
+        lock_for_update: Optional[bool] = None,
+    ):
+        self.session_factory = (
+            session_factory or SQLAlchemyAsyncUnitOfWork.create_session_factory()
+        )
+        self.lock_for_update = lock_for_update
+
+    def __call__(self) -> SQLAlchemyAsyncUnitOfWork:
+        return SQLAlchemyAsyncUnitOfWork(
+            self.session_factory, lock_for_update=self.lock_for_update
+        )
@@ -0,0 +1,131 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from fakeredis import FakeAsyncRedis, FakeRedis
+
+from src import bootstrap
+from src.config import settings
+from src.infrastructure.cache.redis.activation_code_storage import (
+    RedisActivationCodeStorage,
+)
+from src.infrastructure.cache.redis.email_queue import RedisEmailQueue
+from src.infrastructure.cache.two_tier_cache import TwoTierCache
+from src.infrastructure.database.sqlalchemy.outbox import OutboxRelay
+from src.infrastructure.database.sqlalchemy.unit_of_work import (
+    SQLAlchemyAsyncUnitOfWorkFactory,
+)
+from src.shared.application.messagebus import RetryPolicy
+from src.shared.ports.email_queue import EmailQueue
+from src.shared.utils.activation_codes.activation_code_generator import (
+    RandomActivationCodeGenerator,
+)
+from src.shared.utils.auth.password_manager import (
+    Argon2Parameters,
+    Argon2PasswordManager,
+)
+from src.shared.utils.auth.token_manager import JWTManager
+from src.shared.utils.generators.uuid_generator import DefaultUUIDGenerator
+from src.shared.utils.notifications.email_sender import (
+    EmailSender,
+    create_smtp_connection_factory,
+)
+from src.shared.utils.notifications.notificator import EmailNotificator
+from tests.fakes import FakeNotificator
+
+
+def setup_messagebus_dependencies():
+    """Set up utils for messagebus based on app environment"""
+
+    notificator = (
+        FakeNotificator()
+        if settings.is_development
+        else EmailNotificator(email_queue=RedisEmailQueue())
+    )
+    redis_client = FakeRedis() if settings.is_development else None
+    cache_redis_client = FakeAsyncRedis() if settings.is_development else None
+
+    dependencies = bootstrap.create_dependencies_dict(
+        uow_factory=SQLAlchemyAsyncUnitOfWorkFactory(),
+        password_manager=create_password_manager(),
+        uuid_generator=DefaultUUIDGenerator(),
+        activation_code_generator=RandomActivationCodeGenerator(),
+        activation_code_storage=RedisActivationCodeStorage(redis_client=redis_client),
+        token_manager=JWTManager(),
+        notificator=notificator,
+        user_cache=TwoTierCache(
+            namespace="user_response",
+            redis_client=cache_redis_client,
+            ttl=settings.user_cache_redis_ttl_seconds,
+            local_max_size=settings.user_cache_max_size,
+            local_ttl=settings.user_cache_ttl_seconds,
+        ),
+        wishlist_cache=TwoTierCache(
+            namespace="wishlist_response",
+            redis_client=cache_redis_client,
+            ttl=settings.wishlist_cache_ttl_seconds,
+            max_entries=settings.wishlist_cache_max_entries,
+            max_entry_bytes=settings.wishlist_cache_max_entry_bytes,
+            local_max_size=settings.wishlist_cache_local_max_size,
+            local_ttl=settings.wishlist_cache_local_ttl_seconds,
+            lock_timeout=settings.wishlist_cache_lock_timeout_seconds,
+        ),
+    )
+    return dependencies
+
+
+def create_password_manager() -> Argon2PasswordManager:
+    """Password manager hashing in a process pool sized as configured in settings"""
+    executor = None
+    if settings.password_hashing_processes:
+        executor = ProcessPoolExecutor(
+            max_workers=settings.password_hashing_processes,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return Argon2PasswordManager(
+        parameters=Argon2Parameters.from_settings(),
+        executor=executor,
+        max_concurrency=settings.password_hashing_max_concurrency,
+    )
+
+
+def create_messagebus_factory(dependencies: dict) -> bootstrap.MessagebusFactory:
+    """Messagebus factory retrying commands as configured in settings"""
+    return bootstrap.initialize_messagebus(
+        dependencies=dependencies,
+        retry_policy=RetryPolicy(
+            attempts=settings.command_retry_attempts,
+            base_delay=settings.command_retry_base_delay_seconds,
+            max_delay=settings.command_retry_max_delay_seconds,
+        ),
+    )
+
+
+def create_outbox_relay(
+    dependencies: dict, messagebus_factory: bootstrap.MessagebusFactory
+) -> OutboxRelay:
+    """Outbox relay dispatching stored events to the registered event handlers"""
+    return OutboxRelay(
+        session_factory=dependencies["uow_factory"].session_factory,
+        messagebus_factory=messagebus_factory,
+        event_types={
+            event_type.__name__: event_type for event_type in bootstrap.EVENT_HANDLERS
+        },
+        batch_size=settings.outbox_relay_batch_size,
+        max_attempts=settings.outbox_relay_max_attempts,
+        retry_base_delay=settings.outbox_relay_retry_base_delay_seconds,
+        poll_interval=settings.outbox_relay_poll_interval_seconds,
+    )
+
+
+def create_email_sender(email_queue: EmailQueue) -> EmailSender:
+    """Email sender delivering queued emails through the configured SMTP server"""
+    return EmailSender(
+        email_queue=email_queue,
+        connection_factory=create_smtp_connection_factory(),
+        sender_address=settings.smtp_sender,
+        pool_size=settings.email_sender_pool_size,
+        batch_size=settings.email_sender_batch_size,
+        max_attempts=settings.email_sender_max_attempts,
+        retry_base_delay=settings.email_sender_retry_base_delay_seconds,
+        poll_interval=settings.email_sender_poll_interval_seconds,
+    )
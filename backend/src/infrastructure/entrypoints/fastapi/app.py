@@ -1,29 +1,36 @@
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 import uvicorn
-from fakeredis import FakeRedis
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.routing import APIRoute
 from sqlalchemy.orm import clear_mappers
 
-from src import bootstrap
 from src.config import settings
-from src.infrastructure.cache.redis.activation_code_storage import (
-    RedisActivationCodeStorage,
-)
 from src.infrastructure.database.sqlalchemy.database_manager import (
     run_migrations,
     wait_for_database,
 )
 from src.infrastructure.database.sqlalchemy.orm import start_sqlalchemy_mappers
-from src.infrastructure.database.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
+from src.infrastructure.database.sqlalchemy.unit_of_work import (
+    SQLAlchemyAsyncUnitOfWork,
+)
+from src.infrastructure.dependencies import (
+    create_messagebus_factory,
+    create_outbox_relay,
+    setup_messagebus_dependencies,
+)
 from src.infrastructure.entrypoints.fastapi.exception_handlers import (
     exception_to_exception_handlers,
 )
 from src.infrastructure.entrypoints.fastapi.health_router import health_router
 from src.infrastructure.entrypoints.fastapi.limiter import limiter
+from src.infrastructure.entrypoints.fastapi.metrics_router import metrics_router
+from src.infrastructure.entrypoints.fastapi.session_leak_detector import (
+    SessionLeakDetectorMiddleware,
+)
 from src.modules.users.entrypoints.fastapi.admin_router import users_admin_router
 from src.modules.users.entrypoints.fastapi.auth_router import users_auth_router
 from src.modules.users.entrypoints.fastapi.command_router import users_command_router
@@ -34,14 +41,6 @@ from src.modules.wishlists.entrypoints.fastapi.command_router import (
 from src.modules.wishlists.entrypoints.fastapi.query_router import (
     wishlists_query_router,
 )
-from src.shared.utils.activation_codes.activation_code_generator import (
-    RandomActivationCodeGenerator,
-)
-from src.shared.utils.auth.password_manager import Argon2PasswordManager
-from src.shared.utils.auth.token_manager import JWTManager
-from src.shared.utils.generators.uuid_generator import DefaultUUIDGenerator
-from src.shared.utils.notifications.notificator import EmailNotificator
-from tests.fakes import FakeNotificator
 
 ROUTERS = [
     users_admin_router,
@@ -51,6 +50,7 @@ ROUTERS = [
     wishlists_query_router,
     wishlists_command_router,
     health_router,
+    metrics_router,
 ]
 
 logger = logging.getLogger(__name__)
@@ -65,36 +65,42 @@ async def lifespan(application: FastAPI):
 
     # Initialize database (skip in tests)
     if not settings.is_testing:
-        wait_for_database()
+        await wait_for_database()
         run_migrations()
 
+    # Relay outbox events in-process when no worker can share the fake Redis
+    relay_task = None
+    if settings.outbox_relay_in_app or settings.is_development:
+        relay = create_outbox_relay(
+            application.state.dependencies, application.state.messagebus_factory
+        )
+        relay_task = asyncio.create_task(relay.run())
+
+    # Drop entries invalidated by other processes from the in-process caches
+    cache_listener_tasks = [
+        asyncio.create_task(
+            application.state.dependencies[name].listen_for_invalidations()
+        )
+        for name in ("user_cache", "wishlist_cache")
+    ]
+
     logger.info("FastAPI application started")
 
     yield
 
     # Cleanup
     logger.info("Shutting down FastAPI application")
+    for task in [relay_task, *cache_listener_tasks]:
+        if task is None:
+            continue
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    application.state.dependencies["password_manager"].close()
+    await SQLAlchemyAsyncUnitOfWork.get_engine().dispose()
     clear_mappers()
 
 
-def setup_messagebus_dependencies():
-    """Set up utils for messagebus based on app environment"""
-
-    notificator = FakeNotificator() if settings.is_development else EmailNotificator()
-    redis_client = FakeRedis() if settings.is_development else None
-
-    dependencies = bootstrap.create_dependencies_dict(
-        uow=SQLAlchemyUnitOfWork(),
-        password_manager=Argon2PasswordManager(),
-        uuid_generator=DefaultUUIDGenerator(),
-        activation_code_generator=RandomActivationCodeGenerator(),
-        activation_code_storage=RedisActivationCodeStorage(redis_client=redis_client),
-        token_manager=JWTManager(),
-        notificator=notificator,
-    )
-    return dependencies
-
-
 def use_route_names_as_operation_ids(app: FastAPI) -> None:
     """
     Simplify operation IDs so that generated API clients have simpler function names.
@@ -119,16 +125,18 @@ def create_app():
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["Link", "ETag"],
     )
+    app.add_middleware(SessionLeakDetectorMiddleware)
 
     # Initialize utils and messagebus
     dependencies = setup_messagebus_dependencies()
-    messagebus = bootstrap.initialize_messagebus(dependencies=dependencies)
+    messagebus_factory = create_messagebus_factory(dependencies)
 
     # Save objects in app state
     app.state.limiter = limiter
     app.state.dependencies = dependencies
-    app.state.messagebus = messagebus
+    app.state.messagebus_factory = messagebus_factory
 
     # Include routers
     for router in ROUTERS:
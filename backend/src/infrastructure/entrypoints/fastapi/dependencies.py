@@ -1,57 +1,76 @@
-from typing import TYPE_CHECKING, Annotated
+from typing import Annotated, AsyncIterator
 from uuid import UUID
 
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 from starlette.status import HTTP_403_FORBIDDEN
 
-from src.modules.users.queries import user_queries
 from src.modules.wishlists.queries import wishlist_queries
 from src.shared.application.exceptions import UserNotAuthorized
-from src.shared.utils.auth.token_manager import TokenManager
-
-if TYPE_CHECKING:
-    from src.modules.users.domain.model import User
+from src.shared.application.messagebus import AsyncMessagebus
+from src.shared.utils.auth.token_manager import TokenClaims, TokenManager
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
-def get_current_user(
+def get_messagebus(request: Request) -> AsyncMessagebus:
+    """FastAPI dependency to get a new messagebus for the current request"""
+    return request.app.state.messagebus_factory()
+
+
+MessagebusDependency = Annotated[AsyncMessagebus, Depends(get_messagebus)]
+
+
+async def get_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """
+    FastAPI dependency to get a read session for the current request.
+    FastAPI caches it per request, so auth dependencies and queries share one session,
+    which is closed when the request ends.
+    """
+    session_factory = request.app.state.dependencies["uow_factory"].session_factory
+    async with session_factory() as session:
+        yield session
+
+
+SessionDependency = Annotated[AsyncSession, Depends(get_session)]
+
+
+async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     request: Request,
-) -> "User":
-    """FastAPI dependency to get current user from token"""
+) -> TokenClaims:
+    """
+    FastAPI dependency to get current user from the access token claims.
+    Claims are trusted until the token expires, so no database lookup is made.
+    """
     token_manager: TokenManager = request.app.state.dependencies["token_manager"]
-    session = request.app.state.messagebus.uow.session_factory()
-
-    username = token_manager.get_username_from_token(token)
-    user = user_queries.get_user_by_username(session=session, username=username)
 
-    return user
+    return token_manager.get_claims_from_token(token)
 
 
-CurrentUserDependency = Annotated["User", Depends(get_current_user)]
+CurrentUserDependency = Annotated[TokenClaims, Depends(get_current_user)]
 
 
-def get_wishlist_owner(
+async def get_wishlist_owner(
     current_user: CurrentUserDependency,
+    session: SessionDependency,
     request: Request,
-) -> "User":
+) -> TokenClaims:
     """FastAPI dependency to check if current user is wishlist owner"""
-    session = request.app.state.messagebus.uow.session_factory()
     wishlist_uuid = UUID(request.path_params["wishlist_uuid"])
 
-    wishlist = wishlist_queries.get_wishlist_by_uuid(
+    owner_username = await wishlist_queries.get_wishlist_owner_username(
         session=session, uuid=wishlist_uuid
     )
-    if current_user.username != wishlist.owner_username:
+    if current_user.username != owner_username:
         raise UserNotAuthorized(username=current_user.username)
 
     return current_user
 
 
-WishlistOwnerDependency = Annotated["User", Depends(get_wishlist_owner)]
+WishlistOwnerDependency = Annotated[TokenClaims, Depends(get_wishlist_owner)]
 
 
 def get_superuser(
@@ -65,4 +84,4 @@ def get_superuser(
     return current_user
 
 
-CurrentAdminDependency = Annotated["User", Depends(get_superuser)]
+CurrentAdminDependency = Annotated[TokenClaims, Depends(get_superuser)]
@@ -0,0 +1,62 @@
+import hashlib
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.shared.application.fieldsets import Fieldset
+from src.shared.application.pagination import Page
+
+# Clients may keep responses but must revalidate them with If-None-Match
+PUBLIC_CACHE_CONTROL = "no-cache"
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    """Strong entity tag of a representation built from the given parts."""
+    digest = hashlib.blake2b(
+        "\x1f".join(str(part) for part in parts).encode(), digest_size=16
+    )
+    return f'"{digest.hexdigest()}"'
+
+
+def page_etag(page: Page) -> str:
+    """Entity tag of a page of versioned items, taken from their uuids and versions."""
+    return make_etag(
+        *(f"{item.uuid}:{item.version}" for item in page.items), page.next_cursor
+    )
+
+
+def fieldset_etag(etag: str, fieldset: Fieldset | None) -> str:
+    """Entity tag of the representation narrowed to a fieldset, distinct from the full one."""
+    if fieldset is None:
+        return etag
+    return make_etag(etag, *sorted(fieldset.paths))
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether If-None-Match lists the entity tag, compared weakly as RFC 9110 requires."""
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def etag_headers(etag: str, private: bool = False) -> dict[str, str]:
+    cache_control = PRIVATE_CACHE_CONTROL if private else PUBLIC_CACHE_CONTROL
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def not_modified(etag: str, private: bool = False) -> Response:
+    return Response(status_code=304, headers=etag_headers(etag, private))
+
+
+def attach_etag(etag: str, payload: str) -> str:
+    """Keeps the entity tag with a cached payload, so hits are answered without parsing it."""
+    return f"{etag}\n{payload}"
+
+
+def detach_etag(value: str) -> tuple[str, str]:
+    etag, _, payload = value.partition("\n")
+    return etag, payload
@@ -2,6 +2,7 @@ from fastapi import HTTPException
 from sqlalchemy.exc import IntegrityError
 from starlette.requests import Request
 from starlette.status import (
+    HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
     HTTP_403_FORBIDDEN,
     HTTP_404_NOT_FOUND,
@@ -9,6 +10,7 @@ from starlette.status import (
 )
 
 from src.shared.application.exceptions import (
+    BadRequestException,
     ConflictException,
     Forbidden,
     NotFoundException,
@@ -38,6 +40,10 @@ def handle_forbidden(request: Request, exception: Forbidden):
     raise HTTPException(status_code=HTTP_403_FORBIDDEN, detail=exception.args[0])
 
 
+def handle_bad_request(request: Request, exception: BadRequestException):
+    raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=exception.args[0])
+
+
 def handle_token_error(request: Request, exception: TokenException):
     raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail=exception.args[0])
 
@@ -52,5 +58,7 @@ exception_to_exception_handlers = {
     ValidationException: handle_validation_error,
     VerificationException: handle_verification_error,
     Forbidden: handle_forbidden,
+    BadRequestException: handle_bad_request,
+    TokenException: handle_token_error,
     IntegrityError: handle_sqlalchemy_integrity_error,
 }
@@ -0,0 +1,30 @@
+from functools import lru_cache
+from typing import Any, Iterable, get_type_hints
+
+from pydantic import BaseModel, ConfigDict, create_model
+
+FIELDS_DESCRIPTION = "Comma separated fields to return, nested ones like items.name"
+
+
+@lru_cache(maxsize=256)
+def _sparse_model(
+    model: type[BaseModel],
+    fields: frozenset[str],
+    annotations: tuple[tuple[str, Any], ...],
+) -> type[BaseModel]:
+    hints = get_type_hints(model, include_extras=True) | dict(annotations)
+    return create_model(
+        f"Sparse{model.__name__}",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (hints[name], ...) for name in model.model_fields if name in fields},
+    )
+
+
+def sparse_model(
+    model: type[BaseModel], fields: Iterable[str], **annotations: Any
+) -> type[BaseModel]:
+    """
+    Response model with only the given fields of model, keeping their annotations
+    and serializers unless overridden, e.g. with a sparse model of a nested object.
+    """
+    return _sparse_model(model, frozenset(fields), tuple(sorted(annotations.items())))
@@ -1,5 +1,7 @@
 from sqlalchemy import text
-from src.infrastructure.database.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
+from src.infrastructure.database.sqlalchemy.unit_of_work import (
+    SQLAlchemyAsyncUnitOfWork,
+)
 from starlette import status
 from starlette.responses import JSONResponse
 
@@ -18,9 +20,9 @@ async def liveness():
 async def readiness():
     """Application is ready to serve requests."""
     try:
-        engine = SQLAlchemyUnitOfWork.get_engine()
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        engine = SQLAlchemyAsyncUnitOfWork.get_engine()
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
             return {"status": "ready"}
     except Exception:
         return JSONResponse(
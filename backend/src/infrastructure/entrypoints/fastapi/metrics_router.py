@@ -0,0 +1,40 @@
+from fastapi import APIRouter
+from starlette.requests import Request
+
+from src.infrastructure.database.sqlalchemy.pool import pool_metrics
+from src.infrastructure.database.sqlalchemy.unit_of_work import (
+    SQLAlchemyAsyncUnitOfWork,
+)
+from src.infrastructure.entrypoints.fastapi.dependencies import CurrentAdminDependency
+from src.shared.utils.auth.password_manager import password_hash_metrics
+
+metrics_router = APIRouter(prefix="/admin/metrics", tags=["admin_metrics"])
+
+
+@metrics_router.get("/database-pool")
+async def get_database_pool_metrics(_admin: CurrentAdminDependency) -> dict:
+    """Connection pool state: checked-out, idle and overflow connections, wait times."""
+    engine = SQLAlchemyAsyncUnitOfWork.get_engine()
+    return pool_metrics.snapshot(engine.pool)
+
+
+@metrics_router.get("/password-hashing")
+async def get_password_hashing_metrics(_admin: CurrentAdminDependency) -> dict:
+    """Password verifications, outdated hashes found on login and hashes upgraded."""
+    return password_hash_metrics.snapshot()
+
+
+@metrics_router.get("/user-cache")
+async def get_user_cache_metrics(
+    _admin: CurrentAdminDependency, request: Request
+) -> dict:
+    """User cache hits per tier, misses, evictions and invalidations."""
+    return request.app.state.dependencies["user_cache"].snapshot()
+
+
+@metrics_router.get("/wishlist-cache")
+async def get_wishlist_cache_metrics(
+    _admin: CurrentAdminDependency, request: Request
+) -> dict:
+    """Wishlist cache hits per tier, misses, coalesced loads and evictions."""
+    return request.app.state.dependencies["wishlist_cache"].snapshot()
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from typing import Annotated
+
+from fastapi import Depends, Query
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.config import settings
+from src.shared.application.pagination import Page
+
+
+@dataclass
+class PageParams:
+    limit: int
+    cursor: str | None
+
+
+def get_page_params(
+    limit: Annotated[
+        int, Query(ge=1, le=settings.pagination_max_page_size)
+    ] = settings.pagination_default_page_size,
+    cursor: Annotated[
+        str | None, Query(description="Opaque cursor from the previous page")
+    ] = None,
+) -> PageParams:
+    """FastAPI dependency to read keyset pagination query parameters"""
+    return PageParams(limit=limit, cursor=cursor)
+
+
+PageParamsDependency = Annotated[PageParams, Depends(get_page_params)]
+
+
+def add_next_page_link(request: Request, response: Response, page: Page) -> None:
+    """Point to the next page with a Link header, keeping the body a plain list."""
+    if page.next_cursor is not None:
+        next_url = request.url.include_query_params(cursor=page.next_cursor)
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
@@ -0,0 +1,10 @@
+from starlette.responses import Response
+
+
+class JSONBytesResponse(Response):
+    """
+    Response for a body already serialized to JSON. Returning it from a route skips
+    FastAPI's response_model validation and encoding, the model only documents it.
+    """
+
+    media_type = "application/json"
@@ -0,0 +1,31 @@
+import logging
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.infrastructure.database.sqlalchemy.session_tracking import (
+    track_open_sessions,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SessionLeakDetectorMiddleware:
+    """Logs database sessions still holding a connection when a request ends."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_open_sessions() as open_sessions:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                if open_sessions:
+                    logger.warning(
+                        f"{len(open_sessions)} database session(s) still open "
+                        f"at the end of {scope['method']} {scope['path']}"
+                    )
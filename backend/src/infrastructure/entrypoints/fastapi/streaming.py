@@ -0,0 +1,90 @@
+from enum import StrEnum
+from typing import Annotated, AsyncIterator, Callable, Sequence, TypeVar
+
+from fastapi import Depends, Query
+from pydantic import BaseModel
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+from starlette.responses import StreamingResponse
+
+T = TypeVar("T")
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+class StreamFormat(StrEnum):
+    NDJSON = "ndjson"
+    JSON_ARRAY = "json_array"
+
+
+def get_stream_format(
+    request: Request,
+    stream: Annotated[
+        bool,
+        Query(
+            description="Stream every remaining item as one JSON array instead of a page"
+        ),
+    ] = False,
+) -> StreamFormat | None:
+    """
+    FastAPI dependency to negotiate a streamed listing: NDJSON when the client accepts
+    application/x-ndjson, a JSON array when the stream flag is set, otherwise None
+    """
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        return StreamFormat.NDJSON
+    if stream:
+        return StreamFormat.JSON_ARRAY
+    return None
+
+
+StreamFormatDependency = Annotated[StreamFormat | None, Depends(get_stream_format)]
+
+
+async def stream_with_own_session(
+    request: Request,
+    query: Callable[[AsyncSession], AsyncIterator[Sequence[T]]],
+) -> AsyncIterator[Sequence[T]]:
+    """
+    Run a streaming query in a session of its own. The request session is closed
+    before a streamed body is sent, this one is closed when the stream ends.
+    """
+    session_factory = request.app.state.dependencies["uow_factory"].session_factory
+    async with session_factory() as session:
+        async for batch in query(session):
+            yield batch
+
+
+async def _encode_batches(
+    batches: AsyncIterator[Sequence[T]],
+    model: type[BaseModel],
+    stream_format: StreamFormat,
+) -> AsyncIterator[bytes]:
+    # One write per batch rather than per row
+    if stream_format is StreamFormat.NDJSON:
+        async for batch in batches:
+            yield b"".join(to_json(model.model_validate(row)) + b"\n" for row in batch)
+        return
+
+    yield b"["
+    separator = b""
+    async for batch in batches:
+        yield separator + b",".join(to_json(model.model_validate(row)) for row in batch)
+        separator = b","
+    yield b"]"
+
+
+def streaming_json_response(
+    batches: AsyncIterator[Sequence[T]],
+    model: type[BaseModel],
+    stream_format: StreamFormat,
+) -> StreamingResponse:
+    """Response writing each batch of rows as soon as it is read, serialized as model"""
+    media_type = (
+        NDJSON_MEDIA_TYPE
+        if stream_format is StreamFormat.NDJSON
+        else "application/json"
+    )
+    return StreamingResponse(
+        _encode_batches(batches, model, stream_format), media_type=media_type
+    )
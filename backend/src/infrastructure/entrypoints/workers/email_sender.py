@@ -0,0 +1,24 @@
+"""
+Email sender worker. Delivers emails enqueued by EmailNotificator.
+Run from the backend directory: python -m src.infrastructure.entrypoints.workers.email_sender
+"""
+
+import asyncio
+
+from src.infrastructure.cache.redis.email_queue import RedisEmailQueue
+from src.infrastructure.dependencies import create_email_sender
+from src.shared.logger import setup_logging
+
+
+async def main():
+    setup_logging("email_sender")
+
+    sender = create_email_sender(RedisEmailQueue())
+    try:
+        await sender.run()
+    finally:
+        sender.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,38 @@
+"""
+Outbox relay worker. Dispatches domain events stored by committed units of work.
+Run from the backend directory: python -m src.infrastructure.entrypoints.workers.outbox_relay
+"""
+
+import asyncio
+
+from sqlalchemy.orm import clear_mappers
+
+from src.infrastructure.database.sqlalchemy.database_manager import wait_for_database
+from src.infrastructure.database.sqlalchemy.orm import start_sqlalchemy_mappers
+from src.infrastructure.database.sqlalchemy.unit_of_work import (
+    SQLAlchemyAsyncUnitOfWork,
+)
+from src.infrastructure.dependencies import (
+    create_messagebus_factory,
+    create_outbox_relay,
+    setup_messagebus_dependencies,
+)
+from src.shared.logger import setup_logging
+
+
+async def main():
+    setup_logging("outbox")
+    start_sqlalchemy_mappers()
+    await wait_for_database()
+
+    dependencies = setup_messagebus_dependencies()
+    relay = create_outbox_relay(dependencies, create_messagebus_factory(dependencies))
+    try:
+        await relay.run()
+    finally:
+        await SQLAlchemyAsyncUnitOfWork.get_engine().dispose()
+        clear_mappers()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -12,113 +12,146 @@ from src.modules.users.domain.commands import (
     CreateUser,
     DeactivateUser,
     GenerateAuthToken,
+    RefreshAuthToken,
     ResendActivationCode,
 )
 from src.modules.users.domain.model import User
-from src.shared.application.exceptions import CodeVerificationError
-from src.shared.application.uow import UnitOfWork
+from src.shared.application.exceptions import CodeVerificationError, TokenException
+from src.shared.application.uow import AsyncUnitOfWork
 from src.shared.domain.commands import Command
 from src.shared.ports.activation_code_storage import ActivationCodeStorage
 from src.shared.utils.activation_codes.activation_code_generator import (
     ActivationCodeGenerator,
 )
 from src.shared.utils.auth.password_manager import PasswordManager
-from src.shared.utils.auth.token_manager import TokenManager
+from src.shared.utils.auth.token_manager import TokenManager, TokenType
 from src.shared.utils.notifications.notificator import Notificator
 
 
-def handle_create_user(
+async def handle_create_user(
     command: CreateUser,
-    uow: UnitOfWork,
+    uow: AsyncUnitOfWork,
     password_manager: PasswordManager,
 ):
-    with uow:
-        uow.user_repository.assert_user_does_not_exist(command.username)
-        PasswordManager.assert_password_valid(
-            command.password, user_inputs=[command.username, command.email]
-        )
-        NameValidator.validate(command.username)
+    await password_manager.assert_password_valid(
+        command.password, user_inputs=[command.username, command.email]
+    )
+    NameValidator.validate(command.username)
+    # Hash before opening the unit of work so no connection is held while waiting
+    password_hash = await password_manager.hash_password(command.password)
 
+    async with uow:
+        await uow.user_repository.assert_user_does_not_exist(command.username)
         user = User(
             username=command.username.lower(),
             email=command.email.lower(),
-            password_hash=password_manager.hash_password(command.password),
+            password_hash=password_hash,
         )
         uow.user_repository.add(user)
 
-        uow.commit()
+        await uow.commit()
 
 
-def handle_generate_auth_token(
+async def handle_generate_auth_token(
     command: GenerateAuthToken,
-    uow: UnitOfWork,
+    uow: AsyncUnitOfWork,
     password_manager: PasswordManager,
     token_manager: TokenManager,
 ):
-    with uow:
-        user = uow.user_repository.get(command.username.lower())
-    password_manager.assert_passwords_match(command.password, user.password_hash)
+    async with uow.as_read_only() as read_only_uow:
+        user = await read_only_uow.user_repository.get(command.username.lower())
+    new_password_hash = await password_manager.assert_passwords_match(
+        command.password, user.password_hash
+    )
+    if new_password_hash:
+        await handler_utils.upgrade_password_hash(
+            uow=uow,
+            username=user.username,
+            old_password_hash=user.password_hash,
+            new_password_hash=new_password_hash,
+        )
 
-    token = token_manager.generate_token(
-        username=user.username,
+    return handler_utils.issue_auth_tokens(
+        user=user,
+        token_manager=token_manager,
         token_lifetime=command.token_lifetime,
+        refresh_token_lifetime=command.refresh_token_lifetime,
     )
 
-    return token
+
+async def handle_refresh_auth_token(
+    command: RefreshAuthToken,
+    uow: AsyncUnitOfWork,
+    token_manager: TokenManager,
+):
+    claims = token_manager.get_claims_from_token(
+        command.refresh_token, token_type=TokenType.REFRESH
+    )
+    async with uow:
+        user = await uow.user_repository.get(claims.username)
+    if user.token_generation != claims.token_generation:
+        raise TokenException("Token has been revoked")
+
+    return handler_utils.issue_auth_tokens(
+        user=user,
+        token_manager=token_manager,
+        token_lifetime=command.token_lifetime,
+        refresh_token_lifetime=command.refresh_token_lifetime,
+    )
 
 
-def handle_change_password_without_old_password(
-    command: ChangePasswordWithoutOldPassword, uow: UnitOfWork, password_manager
+async def handle_change_password_without_old_password(
+    command: ChangePasswordWithoutOldPassword, uow: AsyncUnitOfWork, password_manager
 ):
-    with uow:
-        user = uow.user_repository.get(command.username)
-        handler_utils.change_user_password(
+    async with uow:
+        user = await uow.user_repository.get(command.username)
+        await handler_utils.change_user_password(
             user=user,
             password_manager=password_manager,
             new_password=command.new_password,
         )
-        uow.commit()
+        await uow.commit()
 
 
-def handle_change_password_with_old_password(
+async def handle_change_password_with_old_password(
     command: ChangePasswordWithOldPassword,
-    uow: UnitOfWork,
+    uow: AsyncUnitOfWork,
     password_manager: PasswordManager,
 ):
-    with uow:
-        user = uow.user_repository.get(command.username)
-        password_manager.assert_passwords_match(
+    async with uow:
+        user = await uow.user_repository.get(command.username)
+        await password_manager.assert_passwords_match(
             command.old_password, user.password_hash
         )
-        handler_utils.change_user_password(
+        await handler_utils.change_user_password(
             user=user,
             new_password=command.new_password,
             password_manager=password_manager,
         )
-        uow.commit()
+        await uow.commit()
 
 
-def handle_change_user_email(command: ChangeEmail, uow: UnitOfWork):
-    with uow:
-        user = uow.user_repository.get(command.username)
+async def handle_change_user_email(command: ChangeEmail, uow: AsyncUnitOfWork):
+    async with uow:
+        user = await uow.user_repository.get(command.username)
         user.change_email(command.new_email)
-        uow.commit()
+        await uow.commit()
 
 
-def handle_activate_user(command: ActivateUser, uow: UnitOfWork):
-    with uow:
-        user = uow.user_repository.get(command.username)
+async def handle_activate_user(command: ActivateUser, uow: AsyncUnitOfWork):
+    async with uow:
+        user = await uow.user_repository.get(command.username)
         user.activate()
-        uow.commit()
+        await uow.commit()
 
 
-def handle_activate_user_with_code(
+async def handle_activate_user_with_code(
     command: ActivateUserWithCode,
-    uow: UnitOfWork,
+    uow: AsyncUnitOfWork,
     activation_code_storage: ActivationCodeStorage,
 ):
-    with uow:
-        user = uow.user_repository.get(command.username)
+    async with uow:
+        user = await uow.user_repository.get(command.username)
         stored_code = activation_code_storage.get_activation_code(
             username=user.username
         )
@@ -128,22 +161,22 @@ def handle_activate_user_with_code(
         activation_code_storage.save_activation_code(username=user.username, code="")
         user.activate()
 
-        uow.commit()
+        await uow.commit()
 
 
-def handle_resend_activation_code(
+async def handle_resend_activation_code(
     command: ResendActivationCode,
-    uow: UnitOfWork,
+    uow: AsyncUnitOfWork,
     notificator: Notificator,
     activation_code_generator: ActivationCodeGenerator,
     activation_code_storage: ActivationCodeStorage,
     password_manager: PasswordManager,
 ):
-    with uow:
-        user = uow.user_repository.get_inactive_user(command.username)
-    password_manager.assert_passwords_match(command.password, user.password_hash)
+    async with uow:
+        user = await uow.user_repository.get_inactive_user(command.username)
+    await password_manager.assert_passwords_match(command.password, user.password_hash)
 
-    send_new_activation_code(
+    await send_new_activation_code(
         user=user,
         activation_code_generator=activation_code_generator,
         activation_code_storage=activation_code_storage,
@@ -151,16 +184,17 @@ def handle_resend_activation_code(
     )
 
 
-def handle_deactivate_user(command: DeactivateUser, uow: UnitOfWork):
-    with uow:
-        user = uow.user_repository.get(command.username)
+async def handle_deactivate_user(command: DeactivateUser, uow: AsyncUnitOfWork):
+    async with uow:
+        user = await uow.user_repository.get(command.username)
         user.deactivate()
-        uow.commit()
+        await uow.commit()
 
 
 USER_COMMAND_HANDLERS: dict[type[Command], callable] = {
     CreateUser: handle_create_user,
     GenerateAuthToken: handle_generate_auth_token,
+    RefreshAuthToken: handle_refresh_auth_token,
     ActivateUserWithCode: handle_activate_user_with_code,
     ChangePasswordWithoutOldPassword: handle_change_password_without_old_password,
     ChangePasswordWithOldPassword: handle_change_password_with_old_password,
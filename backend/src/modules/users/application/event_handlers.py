@@ -6,25 +6,26 @@ from src.modules.users.domain.events import (
     UserCreated,
     UserDeactivated,
 )
-from src.shared.application.uow import UnitOfWork
+from src.shared.application.uow import AsyncUnitOfWork
 from src.shared.domain.events import DomainEvent
 from src.shared.ports.activation_code_storage import ActivationCodeStorage
+from src.shared.ports.cache import Cache
 from src.shared.utils.activation_codes.activation_code_generator import (
     ActivationCodeGenerator,
 )
 from src.shared.utils.notifications.notificator import Notificator
 
 
-def handle_user_created(
+async def handle_user_created(
     event: UserCreated,
-    uow: UnitOfWork,
+    uow: AsyncUnitOfWork,
     notificator: Notificator,
     activation_code_generator: ActivationCodeGenerator,
     activation_code_storage: ActivationCodeStorage,
 ):
-    with uow:
-        user = uow.user_repository.get(event.username)
-    send_new_activation_code(
+    async with uow:
+        user = await uow.user_repository.get(event.username)
+    await send_new_activation_code(
         user=user,
         activation_code_generator=activation_code_generator,
         activation_code_storage=activation_code_storage,
@@ -32,10 +33,25 @@ def handle_user_created(
     )
 
 
+async def handle_user_changed(
+    event: PasswordChanged | EmailChanged | UserActivated | UserDeactivated,
+    user_cache: Cache,
+):
+    await user_cache.invalidate(event.username)
+
+
+# Cache invalidation also runs right after commit in the process that made the change
+USER_COMMITTED_EVENT_HANDLERS: dict[type[DomainEvent], list[callable]] = {
+    PasswordChanged: [handle_user_changed],
+    EmailChanged: [handle_user_changed],
+    UserActivated: [handle_user_changed],
+    UserDeactivated: [handle_user_changed],
+}
+
 USER_EVENT_HANDLERS: dict[type[DomainEvent], list[callable]] = {
     UserCreated: [handle_user_created],
-    PasswordChanged: [],
-    EmailChanged: [],
-    UserActivated: [],
-    UserDeactivated: [],
+    PasswordChanged: [handle_user_changed],
+    EmailChanged: [handle_user_changed],
+    UserActivated: [handle_user_changed],
+    UserDeactivated: [handle_user_changed],
 }
@@ -1,11 +1,23 @@
+import datetime
+
 from src.config import settings
 from src.modules.users.domain.model import User
 from src.shared.application.exceptions import UserInvalidName
+from src.shared.application.uow import AsyncUnitOfWork
 from src.shared.ports.activation_code_storage import ActivationCodeStorage
 from src.shared.utils.activation_codes.activation_code_generator import (
     ActivationCodeGenerator,
 )
-from src.shared.utils.auth.password_manager import PasswordManager
+from src.shared.utils.auth.password_manager import (
+    PasswordManager,
+    password_hash_metrics,
+)
+from src.shared.utils.auth.token_manager import (
+    AuthTokens,
+    TokenClaims,
+    TokenManager,
+    TokenType,
+)
 from src.shared.utils.notifications.notificator import Notificator
 
 
@@ -47,7 +59,7 @@ class NameValidator:
             )
 
 
-def send_new_activation_code(
+async def send_new_activation_code(
     user: User,
     activation_code_generator: ActivationCodeGenerator,
     activation_code_storage: ActivationCodeStorage,
@@ -57,14 +69,46 @@ def send_new_activation_code(
     activation_code_storage.save_activation_code(
         username=user.username, code=activation_code
     )
-    notificator.send_activation_code(recipient=user, activation_code=activation_code)
+    await notificator.send_activation_code(
+        recipient=user, activation_code=activation_code
+    )
 
 
-def change_user_password(
+async def change_user_password(
     user: User, password_manager: PasswordManager, new_password: str
 ):
-    password_manager.assert_password_valid(
+    await password_manager.assert_password_valid(
         new_password, user_inputs=[user.username, user.email]
     )
-    new_password_hash = password_manager.hash_password(new_password)
+    new_password_hash = await password_manager.hash_password(new_password)
     user.change_password_hash(new_password_hash)
+
+
+async def upgrade_password_hash(
+    uow: AsyncUnitOfWork, username: str, old_password_hash: str, new_password_hash: str
+):
+    """Stores a hash made with current hashing parameters, unless the password changed"""
+    async with uow:
+        user = await uow.user_repository.get(username)
+        if user.password_hash != old_password_hash:
+            return
+        user.upgrade_password_hash(new_password_hash)
+        await uow.commit()
+    password_hash_metrics.record_rehash()
+
+
+def issue_auth_tokens(
+    user: User,
+    token_manager: TokenManager,
+    token_lifetime: None | datetime.timedelta,
+    refresh_token_lifetime: None | datetime.timedelta,
+) -> AuthTokens:
+    return AuthTokens(
+        access_token=token_manager.generate_token(
+            TokenClaims.from_user(user), token_lifetime=token_lifetime
+        ),
+        refresh_token=token_manager.generate_token(
+            TokenClaims.from_user(user, token_type=TokenType.REFRESH),
+            token_lifetime=refresh_token_lifetime,
+        ),
+    )
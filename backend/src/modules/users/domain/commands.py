@@ -16,6 +16,14 @@ class GenerateAuthToken(Command):
     username: str
     password: str
     token_lifetime: None | datetime.timedelta
+    refresh_token_lifetime: None | datetime.timedelta = None
+
+
+@dataclass(frozen=True)
+class RefreshAuthToken(Command):
+    refresh_token: str
+    token_lifetime: None | datetime.timedelta
+    refresh_token_lifetime: None | datetime.timedelta = None
 
 
 @dataclass(frozen=True)
@@ -18,6 +18,7 @@ class User(AggregateRoot):
     password_hash: str
     is_active: bool = field(default=False)
     is_superuser: bool = field(default=False)
+    token_generation: int = field(default=0)
 
     def __post_init__(self):
         self._add_event(UserCreated(username=self.username, email=self.email))
@@ -25,8 +26,13 @@ class User(AggregateRoot):
     def change_password_hash(self, password_hash: str):
         """Setter for password hash"""
         self.password_hash = password_hash
+        self.revoke_tokens()
         self._add_event(PasswordChanged(self.username))
 
+    def upgrade_password_hash(self, password_hash: str):
+        """Replaces the hash with a stronger hash of the same password"""
+        self.password_hash = password_hash
+
     def change_email(self, email: str):
         self.email = email
         self._add_event(EmailChanged(self.username))
@@ -41,4 +47,9 @@ class User(AggregateRoot):
         if not self.is_active:
             raise UserAlreadyDeactivated(self.username)
         self.is_active = False
+        self.revoke_tokens()
         self._add_event(UserDeactivated(self.username))
+
+    def revoke_tokens(self):
+        """Invalidates issued refresh tokens, access tokens stay valid until they expire"""
+        self.token_generation += 1
@@ -1,8 +1,10 @@
 from fastapi import APIRouter
-from starlette.requests import Request
 from starlette.status import HTTP_200_OK
 
-from src.infrastructure.entrypoints.fastapi.dependencies import CurrentAdminDependency
+from src.infrastructure.entrypoints.fastapi.dependencies import (
+    CurrentAdminDependency,
+    MessagebusDependency,
+)
 from src.modules.users.domain.commands import (
     ActivateUser,
     ChangeEmail,
@@ -18,47 +20,47 @@ users_admin_router = APIRouter(prefix="/admin/users", tags=["admin_user_commands
 
 
 @users_admin_router.patch("/{username}/activate", status_code=HTTP_200_OK)
-def activate_user(
+async def activate_user(
     username: str,
     _admin: CurrentAdminDependency,
-    request: Request,
+    messagebus: MessagebusDependency,
 ):
     command = ActivateUser(username=username)
-    request.app.state.messagebus.handle(command)
+    await messagebus.handle(command)
 
 
 @users_admin_router.patch("/{username}/deactivate", status_code=HTTP_200_OK)
-def deactivate_user(
+async def deactivate_user(
     username: str,
     _admin: CurrentAdminDependency,
-    request: Request,
+    messagebus: MessagebusDependency,
 ):
     command = DeactivateUser(username=username)
-    request.app.state.messagebus.handle(command)
+    await messagebus.handle(command)
 
 
 @users_admin_router.patch("/{username}/password", status_code=HTTP_200_OK)
-def change_password(
+async def change_password(
     username: str,
     password_data: ChangePasswordWithoutOldPasswordRequest,
     _admin: CurrentAdminDependency,
-    request: Request,
+    messagebus: MessagebusDependency,
 ):
     command = ChangePasswordWithoutOldPassword(
         username=username, new_password=password_data.new_password
     )
-    request.app.state.messagebus.handle(command)
+    await messagebus.handle(command)
 
 
 @users_admin_router.patch("/{username}/email", status_code=HTTP_200_OK)
-def change_email(
+async def change_email(
     username: str,
     email_data: ChangeEmailRequest,
     _admin: CurrentAdminDependency,
-    request: Request,
+    messagebus: MessagebusDependency,
 ):
     command = ChangeEmail(
         username=username,
         new_email=email_data.new_email,
     )
-    request.app.state.messagebus.handle(command)
+    await messagebus.handle(command)
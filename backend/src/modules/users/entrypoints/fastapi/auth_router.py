@@ -1,3 +1,4 @@
+from dataclasses import asdict
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Form
@@ -6,16 +7,19 @@ from starlette.requests import Request
 from starlette.status import HTTP_200_OK
 
 from src.config import settings
+from src.infrastructure.entrypoints.fastapi.dependencies import MessagebusDependency
 from src.infrastructure.entrypoints.fastapi.limiter import limiter
 from src.modules.users.domain.commands import (
     ActivateUserWithCode,
     CreateUser,
     GenerateAuthToken,
+    RefreshAuthToken,
     ResendActivationCode,
 )
 from src.modules.users.entrypoints.fastapi.schemas import (
     ActivateUserWithCodeRequest,
     LoginUserResponse,
+    RefreshAuthTokenRequest,
 )
 
 users_auth_router = APIRouter(prefix="/auth", tags=["auth"])
@@ -23,11 +27,12 @@ users_auth_router = APIRouter(prefix="/auth", tags=["auth"])
 
 @users_auth_router.post("/register", status_code=HTTP_200_OK)
 @limiter.limit("5/minute")
-def register(
+async def register(
     username: Annotated[str, Form()],
     email: Annotated[str, Form()],
     password: Annotated[str, Form()],
     request: Request,
+    messagebus: MessagebusDependency,
 ):
     command = CreateUser(
         username=username,
@@ -35,35 +40,63 @@ def register(
         password=password,
     )
 
-    request.app.state.messagebus.handle(command)
+    await messagebus.handle(command)
 
 
 @users_auth_router.post("/login", response_model=LoginUserResponse)
 @limiter.limit("5/minute")
-def login(form_data: Annotated[OAuth2PasswordRequestForm, Depends()], request: Request):
+async def login(
+    form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+    request: Request,
+    messagebus: MessagebusDependency,
+):
     command = GenerateAuthToken(
         username=form_data.username,
         password=form_data.password,
-        token_lifetime=settings.auth_token_lifetime,
+        token_lifetime=settings.access_token_lifetime,
+        refresh_token_lifetime=settings.refresh_token_lifetime,
     )
-    auth_token = request.app.state.messagebus.handle(command)
+    auth_tokens = await messagebus.handle(command)
+
+    return LoginUserResponse(**asdict(auth_tokens), token_type="bearer")
 
-    return {"access_token": auth_token, "token_type": "bearer"}
+
+@users_auth_router.post("/refresh", response_model=LoginUserResponse)
+@limiter.limit("30/minute")
+async def refresh(
+    body_data: RefreshAuthTokenRequest,
+    request: Request,
+    messagebus: MessagebusDependency,
+):
+    command = RefreshAuthToken(
+        refresh_token=body_data.refresh_token,
+        token_lifetime=settings.access_token_lifetime,
+        refresh_token_lifetime=settings.refresh_token_lifetime,
+    )
+    auth_tokens = await messagebus.handle(command)
+
+    return LoginUserResponse(**asdict(auth_tokens), token_type="bearer")
 
 
 @users_auth_router.post("/activate", status_code=HTTP_200_OK)
 @limiter.limit("5/minute")
-def activate_user(body_data: ActivateUserWithCodeRequest, request: Request):
+async def activate_user(
+    body_data: ActivateUserWithCodeRequest,
+    request: Request,
+    messagebus: MessagebusDependency,
+):
     command = ActivateUserWithCode(username=body_data.username, code=body_data.code)
-    request.app.state.messagebus.handle(command)
+    await messagebus.handle(command)
 
 
 @users_auth_router.post("/resend-activation", status_code=HTTP_200_OK)
 @limiter.limit("5/minute")
-def resend_activation_code(
-    form_data: Annotated[OAuth2PasswordRequestForm, Depends()], request: Request
+async def resend_activation_code(
+    form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+    request: Request,
+    messagebus: MessagebusDependency,
 ):
     command = ResendActivationCode(
         username=form_data.username, password=form_data.password
     )
-    request.app.state.messagebus.handle(command)
+    await messagebus.handle(command)
@@ -1,8 +1,10 @@
 from fastapi import APIRouter
-from starlette.requests import Request
 from starlette.status import HTTP_200_OK
 
-from src.infrastructure.entrypoints.fastapi.dependencies import CurrentUserDependency
+from src.infrastructure.entrypoints.fastapi.dependencies import (
+    CurrentUserDependency,
+    MessagebusDependency,
+)
 from src.modules.users.domain.commands import ChangeEmail, ChangePasswordWithOldPassword
 from src.modules.users.entrypoints.fastapi.schemas import (
     ChangeEmailRequest,
@@ -13,27 +15,27 @@ users_command_router = APIRouter(prefix="/users/me", tags=["user_commands"])
 
 
 @users_command_router.patch("/password", status_code=HTTP_200_OK)
-def change_password(
+async def change_password(
     password_data: ChangePasswordByUserRequest,
     current_user: CurrentUserDependency,
-    request: Request,
+    messagebus: MessagebusDependency,
 ):
     command = ChangePasswordWithOldPassword(
         username=current_user.username,
         new_password=password_data.new_password,
         old_password=password_data.old_password,
     )
-    request.app.state.messagebus.handle(command)
+    await messagebus.handle(command)
 
 
 @users_command_router.patch("/email", status_code=HTTP_200_OK)
-def change_email(
+async def change_email(
     email_data: ChangeEmailRequest,
     current_user: CurrentUserDependency,
-    request: Request,
+    messagebus: MessagebusDependency,
 ):
     command = ChangeEmail(
         username=current_user.username,
         new_email=email_data.new_email,
     )
-    request.app.state.messagebus.handle(command)
+    await messagebus.handle(command)
@@ -1,40 +1,127 @@
-from dataclasses import asdict
+from typing import Annotated
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Query
 from starlette.requests import Request
+from starlette.responses import Response
 
-from src.infrastructure.entrypoints.fastapi.dependencies import CurrentUserDependency
+from src.config import settings
+from src.infrastructure.entrypoints.fastapi.dependencies import (
+    CurrentUserDependency,
+    SessionDependency,
+)
+from src.infrastructure.entrypoints.fastapi.etags import (
+    attach_etag,
+    detach_etag,
+    etag_headers,
+    etag_matches,
+    fieldset_etag,
+    make_etag,
+    not_modified,
+)
+from src.infrastructure.entrypoints.fastapi.fieldsets import (
+    FIELDS_DESCRIPTION,
+    sparse_model,
+)
 from src.infrastructure.entrypoints.fastapi.limiter import limiter
+from src.infrastructure.entrypoints.fastapi.pagination import (
+    PageParamsDependency,
+    add_next_page_link,
+)
+from src.infrastructure.entrypoints.fastapi.responses import JSONBytesResponse
+from src.infrastructure.entrypoints.fastapi.streaming import (
+    StreamFormatDependency,
+    stream_with_own_session,
+    streaming_json_response,
+)
 from src.modules.users.entrypoints.fastapi.schemas import (
+    USER_FIELDS,
     PublicUserResponse,
     UserResponse,
 )
 from src.modules.users.queries import user_queries
+from src.shared.application.fieldsets import Fieldset, parse_fieldset
 
 users_query_router = APIRouter(prefix="/users", tags=["user_queries"])
 
 
+def get_user_fieldset(
+    fields: Annotated[str | None, Query(description=FIELDS_DESCRIPTION)] = None,
+) -> Fieldset | None:
+    """FastAPI dependency to read the fields a client wants from a user"""
+    return parse_fieldset(fields, USER_FIELDS) if fields is not None else None
+
+
+UserFieldsetDependency = Annotated[Fieldset | None, Depends(get_user_fieldset)]
+
+
 @users_query_router.get("/me", response_model=UserResponse)
-def get_me(request: Request, current_user: CurrentUserDependency):
-    return UserResponse(**asdict(current_user))
+async def get_me(
+    request: Request,
+    current_user: CurrentUserDependency,
+    fieldset: UserFieldsetDependency,
+):
+    session_factory = request.app.state.dependencies["uow_factory"].session_factory
+
+    async def load_user() -> str:
+        # Own session, as the load is shared with concurrent requests for the user
+        async with session_factory() as session:
+            user = await user_queries.get_user_by_username(
+                session=session, username=current_user.username
+            )
+        payload = UserResponse.model_validate(user).model_dump_json()
+        return attach_etag(make_etag(user.username, user.version), payload)
+
+    user_cache = request.app.state.dependencies["user_cache"]
+    etag, payload = detach_etag(
+        await user_cache.get_or_load(current_user.username, load_user)
+    )
+    etag = fieldset_etag(etag, fieldset)
+    if etag_matches(request, etag):
+        return not_modified(etag, private=True)
+
+    # The cache holds whole users, so a fieldset only narrows the payload
+    if fieldset is not None:
+        model = sparse_model(UserResponse, fieldset.fields)
+        payload = model.model_validate_json(payload).model_dump_json()
+    return JSONBytesResponse(content=payload, headers=etag_headers(etag, private=True))
 
 
 @limiter.limit("5/minute")
 @users_query_router.get("/", response_model=list[PublicUserResponse])
-def get_users(request: Request):
-    session = request.app.state.messagebus.uow.session_factory()
-    users = user_queries.get_all_users(session=session)
+async def get_users(
+    request: Request,
+    response: Response,
+    session: SessionDependency,
+    page_params: PageParamsDependency,
+    stream_format: StreamFormatDependency,
+):
+    if stream_format is not None:
+        batches = stream_with_own_session(
+            request,
+            user_queries.stream_all_users(
+                batch_size=settings.pagination_stream_batch_size,
+                cursor=page_params.cursor,
+            ),
+        )
+        return streaming_json_response(batches, PublicUserResponse, stream_format)
+
+    page = await user_queries.get_all_users(
+        session=session, limit=page_params.limit, cursor=page_params.cursor
+    )
+    add_next_page_link(request, response, page)
 
-    return [PublicUserResponse(**asdict(user)) for user in users]
+    return [PublicUserResponse(username=user.username) for user in page.items]
 
 
 @limiter.limit("5/minute")
 @users_query_router.get("/{username}", response_model=PublicUserResponse)
-def get_user(
+async def get_user(
     username: str,
     request: Request,
+    session: SessionDependency,
 ):
-    session = request.app.state.messagebus.uow.session_factory()
-    user = user_queries.get_user_by_username(session=session, username=username)
+    user = await user_queries.get_public_user_by_username(
+        session=session, username=username
+    )
 
-    return PublicUserResponse(**asdict(user))
+    return PublicUserResponse(username=user.username)
@@ -1,19 +1,32 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class LoginUserResponse(BaseModel):
     access_token: str
+    refresh_token: str
     token_type: str
 
 
+class RefreshAuthTokenRequest(BaseModel):
+    refresh_token: str
+
+
 class UserResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     username: str
     email: str
     is_active: bool
     is_superuser: bool
 
 
+# Fields a client can pick with the fields parameter
+USER_FIELDS = {name: () for name in UserResponse.model_fields}
+
+
 class PublicUserResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     username: str
 
 
@@ -1,18 +1,57 @@
-from sqlalchemy import select
-from sqlalchemy.orm import Session, load_only
+from typing import AsyncIterator, Callable, Sequence
 
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+
+from src.infrastructure.database.sqlalchemy.pagination import (
+    fetch_page,
+    stream_batches,
+)
 from src.modules.users.domain.model import User
 from src.shared.application.exceptions import UserNotFound
+from src.shared.application.pagination import Page, decode_cursor
+
+
+def _all_users_stmt(cursor: str | None) -> Select:
+    """Users ordered by username, starting after the cursor."""
+    stmt = select(User).options(load_only(User.username)).order_by(User.username)
+    if cursor is not None:
+        (username,) = decode_cursor(cursor, str)
+        stmt = stmt.filter(User.username > username)
+    return stmt
+
+
+async def get_all_users(
+    session: AsyncSession, limit: int, cursor: str | None = None
+) -> Page[User]:
+    """SQLAlchemy query to get a page of users ordered by username."""
+
+    stmt = _all_users_stmt(cursor)
+    return await fetch_page(session, stmt, limit, lambda user: (user.username,))
 
 
-def get_all_users(session: Session) -> list[User]:
-    stmt = select(User).options(load_only(User.username))
-    users = session.scalars(stmt).all()
-    return users
+def stream_all_users(
+    batch_size: int, cursor: str | None = None
+) -> Callable[[AsyncSession], AsyncIterator[Sequence[User]]]:
+    """
+    SQLAlchemy query to stream batches of all users ordered by username.
+    The cursor is decoded right away, so an invalid one fails before streaming starts.
+    """
+
+    stmt = _all_users_stmt(cursor)
+    return lambda session: stream_batches(session, stmt, batch_size)
+
+
+async def get_user_by_username(session: AsyncSession, username: str) -> User:
+    user = await session.get(User, username)
+    if user is None:
+        raise UserNotFound(username)
+    return user
 
 
-def get_user_by_username(session: Session, username: str) -> User:
-    user = session.get(
+async def get_public_user_by_username(session: AsyncSession, username: str) -> User:
+    user = await session.get(
         User,
         username,
         options=[load_only(User.username)],
@@ -14,18 +14,18 @@ from src.modules.wishlists.domain.model import (
     Wishlist,
     WishlistItem,
 )
-from src.shared.application.uow import UnitOfWork
+from src.shared.application.uow import AsyncUnitOfWork
 from src.shared.domain.commands import Command
 from src.shared.utils.generators.uuid_generator import UUIDGenerator
 
 
-def handle_create_wishlist(
+async def handle_create_wishlist(
     command: CreateWishlist,
-    uow: UnitOfWork,
+    uow: AsyncUnitOfWork,
     uuid_generator: UUIDGenerator,
 ):
-    with uow:
-        _user = uow.user_repository.get(command.owner_username)
+    async with uow:
+        _user = await uow.user_repository.get(command.owner_username)
         wishlist = Wishlist(
             uuid=uuid_generator.generate(),
             owner_username=command.owner_username,
@@ -33,23 +33,25 @@ def handle_create_wishlist(
             items=[],
         )
         uow.wishlist_repository.add(wishlist)
-        uow.commit()
+        await uow.commit()
 
 
-def handle_change_wishlist_name(command: ChangeWishlistName, uow: UnitOfWork):
-    with uow:
-        wishlist = uow.wishlist_repository.get(command.uuid)
+async def handle_change_wishlist_name(
+    command: ChangeWishlistName, uow: AsyncUnitOfWork
+):
+    async with uow:
+        wishlist = await uow.wishlist_repository.get(command.uuid)
         wishlist.change_name(command.new_name)
-        uow.commit()
+        await uow.commit()
 
 
-def handle_add_wishlist_item(
+async def handle_add_wishlist_item(
     command: AddWishlistItem,
-    uow: UnitOfWork,
+    uow: AsyncUnitOfWork,
     uuid_generator: UUIDGenerator,
 ):
-    with uow:
-        wishlist = uow.wishlist_repository.get(command.wishlist_uuid)
+    async with uow:
+        wishlist = await uow.wishlist_repository.get(command.wishlist_uuid)
         item = WishlistItem(
             uuid=uuid_generator.generate(),
             wishlist_uuid=wishlist.uuid,
@@ -59,46 +61,48 @@ def handle_add_wishlist_item(
             priority=Priority(command.priority),
         )
         wishlist.add_item(item)
-        uow.commit()
+        await uow.commit()
 
 
-def handle_remove_wishlist_item(command: RemoveWishlistItem, uow: UnitOfWork):
-    with uow:
-        wishlist = uow.wishlist_repository.get(command.wishlist_uuid)
+async def handle_remove_wishlist_item(
+    command: RemoveWishlistItem, uow: AsyncUnitOfWork
+):
+    async with uow:
+        wishlist = await uow.wishlist_repository.get(command.wishlist_uuid)
         wishlist.remove_item(command.item_uuid)
-        uow.commit()
+        await uow.commit()
 
 
-def handle_mark_wishlist_item_as_purchased(
-    command: MarkWishlistItemAsPurchased, uow: UnitOfWork
+async def handle_mark_wishlist_item_as_purchased(
+    command: MarkWishlistItemAsPurchased, uow: AsyncUnitOfWork
 ):
-    with uow:
-        wishlist = uow.wishlist_repository.get(command.wishlist_uuid)
+    async with uow:
+        wishlist = await uow.wishlist_repository.get(command.wishlist_uuid)
         wishlist.mark_item_as_purchased(item_uuid=command.item_uuid)
-        uow.commit()
+        await uow.commit()
 
 
-def handle_mark_wishlist_item_as_not_purchased(
-    command: MarkWishlistItemAsNotPurchased, uow: UnitOfWork
+async def handle_mark_wishlist_item_as_not_purchased(
+    command: MarkWishlistItemAsNotPurchased, uow: AsyncUnitOfWork
 ):
-    with uow:
-        wishlist = uow.wishlist_repository.get(command.wishlist_uuid)
+    async with uow:
+        wishlist = await uow.wishlist_repository.get(command.wishlist_uuid)
         wishlist.mark_item_as_not_purchased(item_uuid=command.item_uuid)
-        uow.commit()
+        await uow.commit()
 
 
-def handle_archive_wishlist(command: ArchiveWishlist, uow: UnitOfWork):
-    with uow:
-        wishlist = uow.wishlist_repository.get(command.uuid)
+async def handle_archive_wishlist(command: ArchiveWishlist, uow: AsyncUnitOfWork):
+    async with uow:
+        wishlist = await uow.wishlist_repository.get(command.uuid)
         wishlist.archive()
-        uow.commit()
+        await uow.commit()
 
 
-def handle_unarchive_wishlist(command: UnarchiveWishlist, uow: UnitOfWork):
-    with uow:
-        wishlist = uow.wishlist_repository.get(command.uuid)
+async def handle_unarchive_wishlist(command: UnarchiveWishlist, uow: AsyncUnitOfWork):
+    async with uow:
+        wishlist = await uow.wishlist_repository.get(command.uuid)
         wishlist.unarchive()
-        uow.commit()
+        await uow.commit()
 
 
 WISHLIST_COMMAND_HANDLERS: dict[type[Command], callable] = {
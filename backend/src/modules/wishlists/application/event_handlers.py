@@ -9,14 +9,44 @@ from src.modules.wishlists.domain.events import (
     WishlistUnarchived,
 )
 from src.shared.domain.events import DomainEvent
+from src.shared.ports.cache import Cache
+
+
+async def handle_wishlist_changed(
+    event: WishlistNameChanged | WishlistArchived | WishlistUnarchived,
+    wishlist_cache: Cache,
+):
+    await wishlist_cache.invalidate(str(event.uuid))
+
+
+async def handle_wishlist_item_changed(
+    event: WishlistItemAdded
+    | WishlistItemRemoved
+    | WishlistItemMarkedAsPurchased
+    | WishlistItemMarkedAsNotPurchased,
+    wishlist_cache: Cache,
+):
+    await wishlist_cache.invalidate(str(event.wishlist_uuid))
+
+
+# Cache invalidation also runs right after commit in the process that made the change
+WISHLIST_COMMITTED_EVENT_HANDLERS: dict[type[DomainEvent], list[callable]] = {
+    WishlistNameChanged: [handle_wishlist_changed],
+    WishlistItemAdded: [handle_wishlist_item_changed],
+    WishlistItemRemoved: [handle_wishlist_item_changed],
+    WishlistItemMarkedAsPurchased: [handle_wishlist_item_changed],
+    WishlistItemMarkedAsNotPurchased: [handle_wishlist_item_changed],
+    WishlistArchived: [handle_wishlist_changed],
+    WishlistUnarchived: [handle_wishlist_changed],
+}
 
 WISHLIST_EVENT_HANDLERS: dict[type[DomainEvent], list[callable]] = {
     WishlistCreated: [],
-    WishlistNameChanged: [],
-    WishlistItemAdded: [],
-    WishlistItemRemoved: [],
-    WishlistItemMarkedAsPurchased: [],
-    WishlistItemMarkedAsNotPurchased: [],
-    WishlistArchived: [],
-    WishlistUnarchived: [],
+    WishlistNameChanged: [handle_wishlist_changed],
+    WishlistItemAdded: [handle_wishlist_item_changed],
+    WishlistItemRemoved: [handle_wishlist_item_changed],
+    WishlistItemMarkedAsPurchased: [handle_wishlist_item_changed],
+    WishlistItemMarkedAsNotPurchased: [handle_wishlist_item_changed],
+    WishlistArchived: [handle_wishlist_changed],
+    WishlistUnarchived: [handle_wishlist_changed],
 }
@@ -55,28 +55,38 @@ class Wishlist(AggregateRoot):
     items: list[WishlistItem] = field(default_factory=list, compare=False)
     is_archived: bool = field(default=False)
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    # Bumped by every change to the wishlist or its items, for optimistic locking
+    # and entity tags
+    version: int = field(default=1, compare=False)
 
     def __post_init__(self):
         self._add_event(WishlistCreated(uuid=self.uuid, name=self.name))
 
+    def _bump_version(self):
+        self.version += 1
+
     def change_name(self, name: str):
         self.name = name
+        self._bump_version()
         self._add_event(WishlistNameChanged(self.uuid, self.name))
 
     def archive(self):
         if self.is_archived:
             raise WishlistAlreadyArchived(self.uuid)
         self.is_archived = True
+        self._bump_version()
         self._add_event(WishlistArchived(self.uuid))
 
     def unarchive(self):
         if not self.is_archived:
             raise WishlistNotArchived(self.uuid)
         self.is_archived = False
+        self._bump_version()
         self._add_event(WishlistUnarchived(self.uuid))
 
     def add_item(self, item: WishlistItem):
         self.items.append(item)
+        self._bump_version()
         self._add_event(
             WishlistItemAdded(
                 item_uuid=item.uuid,
@@ -97,6 +107,7 @@ class Wishlist(AggregateRoot):
     def remove_item(self, item_uuid: UUID):
         item = self.__find_item(item_uuid)
         self.items.remove(item)
+        self._bump_version()
         self._add_event(
             WishlistItemRemoved(item_uuid=item_uuid, wishlist_uuid=self.uuid)
         )
@@ -106,6 +117,7 @@ class Wishlist(AggregateRoot):
         if item.is_purchased:
             raise WishlistItemAlreadyPurchased(item.uuid)
         item.is_purchased = True
+        self._bump_version()
         self._add_event(
             WishlistItemMarkedAsPurchased(item_uuid=item_uuid, wishlist_uuid=self.uuid)
         )
@@ -115,6 +127,7 @@ class Wishlist(AggregateRoot):
         if not item.is_purchased:
             raise WishlistItemNotPurchased(item.uuid)
         item.is_purchased = False
+        self._bump_version()
         self._add_event(
             WishlistItemMarkedAsNotPurchased(
                 item_uuid=item_uuid, wishlist_uuid=self.uuid
@@ -1,56 +1,291 @@
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
+from starlette.responses import Response
 
-from src.infrastructure.entrypoints.fastapi.dependencies import CurrentUserDependency
-from src.modules.wishlists.entrypoints.fastapi.schemas import WishlistResponse
+from src.config import settings
+from src.infrastructure.entrypoints.fastapi.dependencies import (
+    CurrentUserDependency,
+    SessionDependency,
+)
+from src.infrastructure.entrypoints.fastapi.etags import (
+    attach_etag,
+    detach_etag,
+    etag_headers,
+    etag_matches,
+    fieldset_etag,
+    make_etag,
+    not_modified,
+    page_etag,
+)
+from src.infrastructure.entrypoints.fastapi.fieldsets import FIELDS_DESCRIPTION
+from src.infrastructure.entrypoints.fastapi.pagination import (
+    PageParams,
+    PageParamsDependency,
+    add_next_page_link,
+)
+from src.infrastructure.entrypoints.fastapi.responses import JSONBytesResponse
+from src.infrastructure.entrypoints.fastapi.streaming import (
+    StreamFormatDependency,
+    stream_with_own_session,
+    streaming_json_response,
+)
+from src.modules.wishlists.entrypoints.fastapi.schemas import (
+    WISHLIST_FIELDS,
+    BatchGetWishlistResponse,
+    BatchGetWishlistsRequest,
+    WishlistResponse,
+    WishlistSummaryResponse,
+    dump_batch_get_json,
+    dump_wishlist_json,
+    dump_wishlist_summaries_json,
+    dump_wishlists_json,
+    narrow_wishlist_json,
+    sparse_wishlist_model,
+)
 from src.modules.wishlists.queries import wishlist_queries
+from src.shared.application.fieldsets import Fieldset, parse_fieldset
 
 wishlists_query_router = APIRouter(prefix="/wishlists", tags=["wishlist_queries"])
 
 
+def get_wishlist_fieldset(
+    fields: Annotated[str | None, Query(description=FIELDS_DESCRIPTION)] = None,
+) -> Fieldset | None:
+    """FastAPI dependency to read the fields a client wants from each wishlist"""
+    return parse_fieldset(fields, WISHLIST_FIELDS) if fields is not None else None
+
+
+WishlistFieldsetDependency = Annotated[Fieldset | None, Depends(get_wishlist_fieldset)]
+
+
+async def check_page_not_modified(
+    request: Request,
+    session: AsyncSession,
+    username: str,
+    page_params: PageParams,
+    fieldset: Fieldset | None,
+    archived: bool = False,
+    private: bool = True,
+) -> Response | None:
+    """Answers If-None-Match with 304 when the page is unchanged, without loading items"""
+    if "if-none-match" not in request.headers:
+        return None
+
+    versions = await wishlist_queries.get_wishlist_versions_owned_by(
+        session=session,
+        username=username,
+        limit=page_params.limit,
+        cursor=page_params.cursor,
+        archived=archived,
+    )
+    etag = fieldset_etag(page_etag(versions), fieldset)
+    if etag_matches(request, etag):
+        return not_modified(etag, private=private)
+    return None
+
+
 @wishlists_query_router.get("/archived")
-def get_current_user_archived_wishlists(
+async def get_current_user_archived_wishlists(
     request: Request,
+    session: SessionDependency,
     current_user: CurrentUserDependency,
+    page_params: PageParamsDependency,
+    fieldset: WishlistFieldsetDependency,
 ) -> list[WishlistResponse]:
-    session = request.app.state.messagebus.uow.session_factory()
+    not_modified_response = await check_page_not_modified(
+        request,
+        session,
+        current_user.username,
+        page_params,
+        fieldset,
+        archived=True,
+    )
+    if not_modified_response is not None:
+        return not_modified_response
+
+    page = await wishlist_queries.get_archived_wishlists_owned_by(
+        session=session,
+        username=current_user.username,
+        limit=page_params.limit,
+        cursor=page_params.cursor,
+        fieldset=fieldset,
+    )
+    etag = fieldset_etag(page_etag(page), fieldset)
+    response = JSONBytesResponse(
+        content=dump_wishlists_json(page.items, fieldset),
+        headers=etag_headers(etag, private=True),
+    )
+    add_next_page_link(request, response, page)
+
+    return response
+
+
+async def get_summaries_response(
+    request: Request,
+    session: AsyncSession,
+    username: str,
+    page_params: PageParams,
+    private: bool = True,
+) -> Response:
+    page = await wishlist_queries.get_wishlist_summaries_owned_by(
+        session=session,
+        username=username,
+        limit=page_params.limit,
+        cursor=page_params.cursor,
+    )
+    # Counts change only with items, which bump the wishlist version
+    etag = page_etag(page)
+    if etag_matches(request, etag):
+        return not_modified(etag, private=private)
+
+    response = JSONBytesResponse(
+        content=dump_wishlist_summaries_json(page.items),
+        headers=etag_headers(etag, private=private),
+    )
+    add_next_page_link(request, response, page)
+    return response
 
-    wishlists = wishlist_queries.get_archived_wishlists_owned_by(
-        session=session, username=current_user.username
+
+@wishlists_query_router.get("/summaries")
+async def get_current_user_wishlist_summaries(
+    request: Request,
+    session: SessionDependency,
+    current_user: CurrentUserDependency,
+    page_params: PageParamsDependency,
+) -> list[WishlistSummaryResponse]:
+    return await get_summaries_response(
+        request, session, current_user.username, page_params
     )
 
-    return [WishlistResponse.from_dataclass(wishlist) for wishlist in wishlists]
+
+@wishlists_query_router.post("/batch-get")
+async def batch_get_wishlists(
+    batch_data: BatchGetWishlistsRequest, session: SessionDependency
+) -> list[BatchGetWishlistResponse]:
+    wishlists = await wishlist_queries.get_wishlists_by_uuids(
+        session=session, uuids=set(batch_data.uuids)
+    )
+    return JSONBytesResponse(content=dump_batch_get_json(batch_data.uuids, wishlists))
 
 
 @wishlists_query_router.get("/{uuid}")
-def get_wishlist(uuid: UUID, request: Request) -> WishlistResponse:
-    session = request.app.state.messagebus.uow.session_factory()
-    wishlist = wishlist_queries.get_wishlist_by_uuid(session=session, uuid=uuid)
+async def get_wishlist(
+    uuid: UUID, request: Request, fieldset: WishlistFieldsetDependency
+) -> WishlistResponse:
+    session_factory = request.app.state.dependencies["uow_factory"].session_factory
 
-    return WishlistResponse.from_dataclass(wishlist)
+    async def load_wishlist() -> str:
+        # Own session, as the load is shared with concurrent requests for the wishlist
+        async with session_factory() as session:
+            wishlist = await wishlist_queries.get_wishlist_by_uuid(
+                session=session, uuid=uuid
+            )
+        payload = dump_wishlist_json(wishlist)
+        return attach_etag(make_etag(wishlist.uuid, wishlist.version), payload)
+
+    wishlist_cache = request.app.state.dependencies["wishlist_cache"]
+    etag, payload = detach_etag(
+        await wishlist_cache.get_or_load(str(uuid), load_wishlist)
+    )
+    etag = fieldset_etag(etag, fieldset)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    # The cache holds whole wishlists, so a fieldset only narrows the payload
+    if fieldset is not None:
+        payload = narrow_wishlist_json(payload, fieldset)
+    return JSONBytesResponse(content=payload, headers=etag_headers(etag))
 
 
 @wishlists_query_router.get("/")
-def get_current_user_wishlists(
+async def get_current_user_wishlists(
     request: Request,
+    session: SessionDependency,
     current_user: CurrentUserDependency,
+    page_params: PageParamsDependency,
+    fieldset: WishlistFieldsetDependency,
 ) -> list[WishlistResponse]:
-    session = request.app.state.messagebus.uow.session_factory()
+    not_modified_response = await check_page_not_modified(
+        request, session, current_user.username, page_params, fieldset
+    )
+    if not_modified_response is not None:
+        return not_modified_response
 
-    wishlists = wishlist_queries.get_wishlists_owned_by(
-        session=session, username=current_user.username
+    page = await wishlist_queries.get_wishlists_owned_by(
+        session=session,
+        username=current_user.username,
+        limit=page_params.limit,
+        cursor=page_params.cursor,
+        fieldset=fieldset,
+    )
+    etag = fieldset_etag(page_etag(page), fieldset)
+    response = JSONBytesResponse(
+        content=dump_wishlists_json(page.items, fieldset),
+        headers=etag_headers(etag, private=True),
     )
+    add_next_page_link(request, response, page)
 
-    return [WishlistResponse.from_dataclass(wishlist) for wishlist in wishlists]
+    return response
 
 
 @wishlists_query_router.get("/user/{username}")
-def get_wishlists_by_user(username: str, request: Request) -> list[WishlistResponse]:
-    session = request.app.state.messagebus.uow.session_factory()
-    wishlists = wishlist_queries.get_wishlists_owned_by(
-        session=session, username=username
+async def get_wishlists_by_user(
+    username: str,
+    request: Request,
+    session: SessionDependency,
+    page_params: PageParamsDependency,
+    stream_format: StreamFormatDependency,
+    fieldset: WishlistFieldsetDependency,
+) -> list[WishlistResponse]:
+    if stream_format is not None:
+        batches = stream_with_own_session(
+            request,
+            wishlist_queries.stream_wishlists_owned_by(
+                username=username,
+                batch_size=settings.pagination_stream_batch_size,
+                cursor=page_params.cursor,
+                fieldset=fieldset,
+            ),
+        )
+        model = (
+            WishlistResponse if fieldset is None else sparse_wishlist_model(fieldset)
+        )
+        return streaming_json_response(batches, model, stream_format)
+
+    not_modified_response = await check_page_not_modified(
+        request, session, username, page_params, fieldset, private=False
+    )
+    if not_modified_response is not None:
+        return not_modified_response
+
+    page = await wishlist_queries.get_wishlists_owned_by(
+        session=session,
+        username=username,
+        limit=page_params.limit,
+        cursor=page_params.cursor,
+        fieldset=fieldset,
     )
+    etag = fieldset_etag(page_etag(page), fieldset)
+    response = JSONBytesResponse(
+        content=dump_wishlists_json(page.items, fieldset),
+        headers=etag_headers(etag),
+    )
+    add_next_page_link(request, response, page)
+
+    return response
+
 
-    return [WishlistResponse.from_dataclass(wishlist) for wishlist in wishlists]
+@wishlists_query_router.get("/user/{username}/summaries")
+async def get_wishlist_summaries_by_user(
+    username: str,
+    request: Request,
+    session: SessionDependency,
+    page_params: PageParamsDependency,
+) -> list[WishlistSummaryResponse]:
+    return await get_summaries_response(
+        request, session, username, page_params, private=False
+    )
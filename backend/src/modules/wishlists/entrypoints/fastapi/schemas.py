@@ -1,12 +1,26 @@
-from dataclasses import asdict
+from datetime import datetime
+from functools import lru_cache
+from typing import Annotated, Iterable
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, TypeAdapter
+from sqlalchemy import Row
 
-from src.modules.wishlists.domain.model import MeasurementUnit, Priority
+from src.config import settings
+from src.infrastructure.entrypoints.fastapi.fieldsets import sparse_model
+from src.modules.wishlists.domain.model import MeasurementUnit, Priority, Wishlist
+from src.shared.application.exceptions import WishlistNotFound
+from src.shared.application.fieldsets import Fieldset
+
+# isoformat keeps the +00:00 offset clients already parse
+IsoformatDatetime = Annotated[
+    datetime, PlainSerializer(datetime.isoformat, return_type=str)
+]
 
 
 class WishlistItemResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     uuid: UUID
     wishlist_uuid: UUID
     name: str
@@ -15,31 +29,101 @@ class WishlistItemResponse(BaseModel):
     priority: Priority
     is_purchased: bool
 
-    @classmethod
-    def from_dataclass(cls, wishlist_item):
-        return cls(**asdict(wishlist_item))
-
 
 class WishlistResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     uuid: UUID
     owner_username: str
     name: str
     items: list[WishlistItemResponse]
     is_archived: bool
-    created_at: str
-
-    @classmethod
-    def from_dataclass(cls, wishlist):
-        return cls(
-            uuid=wishlist.uuid,
-            owner_username=wishlist.owner_username,
-            name=wishlist.name,
-            items=[
-                WishlistItemResponse.from_dataclass(item) for item in wishlist.items
-            ],
-            is_archived=wishlist.is_archived,
-            created_at=wishlist.created_at.isoformat(),
-        )
+    created_at: IsoformatDatetime
+
+
+class WishlistSummaryResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    uuid: UUID
+    name: str
+    created_at: IsoformatDatetime
+    item_count: int
+    purchased_count: int
+
+
+class BatchGetWishlistResponse(BaseModel):
+    """A requested wishlist, or the error if it could not be returned"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    uuid: UUID
+    wishlist: WishlistResponse | None
+    error: str | None
+
+
+# Fields a client can pick with the fields parameter, with the fields of items
+WISHLIST_FIELDS = {name: () for name in WishlistResponse.model_fields} | {
+    "items": tuple(WishlistItemResponse.model_fields)
+}
+
+wishlists_adapter = TypeAdapter(list[WishlistResponse])
+wishlist_summaries_adapter = TypeAdapter(list[WishlistSummaryResponse])
+batch_get_adapter = TypeAdapter(list[BatchGetWishlistResponse])
+
+
+def sparse_wishlist_model(fieldset: Fieldset) -> type[BaseModel]:
+    item_fields = fieldset.nested_fields("items") or WishlistItemResponse.model_fields
+    item_model = sparse_model(WishlistItemResponse, item_fields)
+    return sparse_model(WishlistResponse, fieldset.fields, items=list[item_model])
+
+
+@lru_cache(maxsize=256)
+def sparse_wishlists_adapter(fieldset: Fieldset) -> TypeAdapter:
+    return TypeAdapter(list[sparse_wishlist_model(fieldset)])
+
+
+def dump_wishlist_json(wishlist: Wishlist) -> str:
+    """Reads the wishlist and its items once and serializes them in pydantic-core"""
+    return WishlistResponse.model_validate(wishlist).model_dump_json()
+
+
+def dump_wishlists_json(
+    wishlists: Iterable[Wishlist], fieldset: Fieldset | None = None
+) -> bytes:
+    adapter = (
+        wishlists_adapter if fieldset is None else sparse_wishlists_adapter(fieldset)
+    )
+    return adapter.dump_json(adapter.validate_python(wishlists, from_attributes=True))
+
+
+def dump_batch_get_json(uuids: Iterable[UUID], wishlists: Iterable[Wishlist]) -> bytes:
+    """One entry per requested UUID, in request order, reporting missing wishlists"""
+    wishlists_by_uuid = {wishlist.uuid: wishlist for wishlist in wishlists}
+    entries = [
+        {
+            "uuid": uuid,
+            "wishlist": wishlists_by_uuid.get(uuid),
+            "error": None
+            if uuid in wishlists_by_uuid
+            else str(WishlistNotFound(uuid=uuid)),
+        }
+        for uuid in uuids
+    ]
+    return batch_get_adapter.dump_json(
+        batch_get_adapter.validate_python(entries, from_attributes=True)
+    )
+
+
+def narrow_wishlist_json(payload: str, fieldset: Fieldset) -> str:
+    """Keeps only the fieldset of an already serialized wishlist"""
+    model = sparse_wishlist_model(fieldset)
+    return model.model_validate_json(payload).model_dump_json()
+
+
+def dump_wishlist_summaries_json(summaries: Iterable[Row]) -> bytes:
+    return wishlist_summaries_adapter.dump_json(
+        wishlist_summaries_adapter.validate_python(summaries, from_attributes=True)
+    )
 
 
 class CreateWishlistRequest(BaseModel):
@@ -57,6 +141,12 @@ class AddWishlistItemRequest(BaseModel):
     priority: Priority
 
 
+class BatchGetWishlistsRequest(BaseModel):
+    uuids: list[UUID] = Field(
+        min_length=1, max_length=settings.wishlist_batch_get_max_size
+    )
+
+
 class RemoveWishlistItemRequest(BaseModel):
     item_uuid: UUID
 
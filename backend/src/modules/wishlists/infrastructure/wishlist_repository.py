@@ -7,22 +7,23 @@ from src.shared.ports.repository import BaseRepository
 
 class WishlistRepository(BaseRepository[Wishlist]):
     @abc.abstractmethod
-    def _list_all(self) -> list[Wishlist]: ...
-    def list_all(self) -> list[Wishlist]:
-        wishlists = self._list_all()
+    async def _list_all(self) -> list[Wishlist]: ...
+
+    async def list_all(self) -> list[Wishlist]:
+        wishlists = await self._list_all()
         self.seen.update(wishlists)
         return wishlists
 
     @abc.abstractmethod
-    def _list_owned_by(self, username: str) -> list[Wishlist]: ...
+    async def _list_owned_by(self, username: str) -> list[Wishlist]: ...
 
-    def list_owned_by(self, username: str) -> list[Wishlist]:
-        wishlists = self._list_owned_by(username)
+    async def list_owned_by(self, username: str) -> list[Wishlist]:
+        wishlists = await self._list_owned_by(username)
         self.seen.update(wishlists)
         return wishlists
 
     @abc.abstractmethod
-    def _get(self, uuid: UUID) -> Wishlist: ...
+    async def _get(self, uuid: UUID) -> Wishlist: ...
 
     @abc.abstractmethod
     def _add(self, user: Wishlist): ...
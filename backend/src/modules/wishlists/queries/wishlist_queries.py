@@ -1,36 +1,195 @@
+from datetime import datetime
+from typing import AsyncIterator, Callable, Collection, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, Select, false, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, selectinload
 
-from src.modules.wishlists.domain.model import Wishlist
+from src.infrastructure.database.sqlalchemy.pagination import (
+    fetch_page,
+    stream_batches,
+)
+from src.modules.wishlists.domain.model import Wishlist, WishlistItem
 from src.shared.application.exceptions import WishlistNotFound
+from src.shared.application.fieldsets import Fieldset
+from src.shared.application.pagination import Page, decode_cursor
 
 
-def get_wishlist_by_uuid(session: Session, uuid: UUID) -> Wishlist:
-    """SQLAlchemy query to get a wishlist by its UUID."""
+async def get_wishlist_by_uuid(session: AsyncSession, uuid: UUID) -> Wishlist:
+    """SQLAlchemy query to get a wishlist with its items by its UUID."""
 
-    wishlist = session.get(Wishlist, uuid)
+    wishlist = await session.get(Wishlist, uuid, options=[selectinload(Wishlist.items)])
     if wishlist is None:
         raise WishlistNotFound(uuid=uuid)
     return wishlist
 
 
-def get_wishlists_owned_by(session: Session, username: str) -> list[Wishlist]:
-    """SQLAlchemy query to get all unarchived wishlists owned by a user."""
+async def get_wishlists_by_uuids(
+    session: AsyncSession, uuids: Collection[UUID]
+) -> Sequence[Wishlist]:
+    """
+    SQLAlchemy query to get the wishlists with the given UUIDs and their items,
+    one query for the wishlists and one for the items. Missing UUIDs are skipped.
+    """
 
-    wishlists = session.scalars(
+    result = await session.scalars(
         select(Wishlist)
-        .filter_by(owner_username=username, is_archived=False)
-        .order_by(Wishlist.created_at.desc())
-    ).all()
-    return wishlists
+        .filter(Wishlist.uuid.in_(uuids))
+        .options(selectinload(Wishlist.items))
+    )
+    return result.all()
 
 
-def get_archived_wishlists_owned_by(session: Session, username: str) -> list[Wishlist]:
-    """SQLAlchemy query to get all archived wishlists owned by a user."""
+async def get_wishlist_owner_username(session: AsyncSession, uuid: UUID) -> str:
+    """SQLAlchemy query to get the username of a wishlist owner."""
 
-    wishlists = session.scalars(
-        select(Wishlist).filter_by(owner_username=username, is_archived=True)
-    ).all()
-    return wishlists
+    owner_username = await session.scalar(
+        select(Wishlist.owner_username).filter_by(uuid=uuid)
+    )
+    if owner_username is None:
+        raise WishlistNotFound(uuid=uuid)
+    return owner_username
+
+
+def _owned_by_page_stmt(
+    username: str, cursor: str | None, archived: bool, *columns
+) -> Select:
+    """Wishlists owned by a user in keyset order, starting after the cursor."""
+    stmt = (
+        select(*columns)
+        .filter_by(owner_username=username)
+        .order_by(Wishlist.created_at.desc(), Wishlist.uuid.desc())
+    )
+    if archived:
+        stmt = stmt.filter_by(is_archived=True)
+    else:
+        # Literal false lets the planner match the partial index on active wishlists
+        stmt = stmt.filter(Wishlist.is_archived == false())
+    if cursor is not None:
+        created_at, uuid = decode_cursor(cursor, datetime.fromisoformat, UUID)
+        stmt = stmt.filter(
+            tuple_(Wishlist.created_at, Wishlist.uuid) < tuple_(created_at, uuid)
+        )
+    return stmt
+
+
+def _wishlist_load_options(fieldset: Fieldset | None) -> list:
+    """Load only the columns of the fieldset, and the items only if it includes them."""
+    if fieldset is None:
+        return [selectinload(Wishlist.items)]
+
+    # Keyset and ETag columns are needed whatever the client asked for
+    columns = {"uuid", "created_at", "version"} | (fieldset.fields - {"items"})
+    options = [load_only(*(getattr(Wishlist, column) for column in columns))]
+    if "items" in fieldset.fields:
+        items = selectinload(Wishlist.items)
+        if item_columns := fieldset.nested_fields("items"):
+            items = items.load_only(
+                *(getattr(WishlistItem, column) for column in item_columns)
+            )
+        options.append(items)
+    return options
+
+
+def _wishlist_keyset(wishlist: Wishlist | Row) -> tuple[datetime, UUID]:
+    return wishlist.created_at, wishlist.uuid
+
+
+async def get_wishlists_owned_by(
+    session: AsyncSession,
+    username: str,
+    limit: int,
+    cursor: str | None = None,
+    fieldset: Fieldset | None = None,
+) -> Page[Wishlist]:
+    """SQLAlchemy query to get a page of unarchived wishlists owned by a user."""
+
+    stmt = _owned_by_page_stmt(username, cursor, False, Wishlist).options(
+        *_wishlist_load_options(fieldset)
+    )
+    return await fetch_page(session, stmt, limit, _wishlist_keyset)
+
+
+def stream_wishlists_owned_by(
+    username: str,
+    batch_size: int,
+    cursor: str | None = None,
+    fieldset: Fieldset | None = None,
+) -> Callable[[AsyncSession], AsyncIterator[Sequence[Wishlist]]]:
+    """
+    SQLAlchemy query to stream batches of unarchived wishlists owned by a user.
+    Items are loaded with one query per batch. The cursor is decoded right away,
+    so an invalid one fails before streaming starts.
+    """
+
+    stmt = _owned_by_page_stmt(username, cursor, False, Wishlist).options(
+        *_wishlist_load_options(fieldset)
+    )
+    return lambda session: stream_batches(session, stmt, batch_size)
+
+
+async def get_archived_wishlists_owned_by(
+    session: AsyncSession,
+    username: str,
+    limit: int,
+    cursor: str | None = None,
+    fieldset: Fieldset | None = None,
+) -> Page[Wishlist]:
+    """SQLAlchemy query to get a page of archived wishlists owned by a user."""
+
+    stmt = _owned_by_page_stmt(username, cursor, True, Wishlist).options(
+        *_wishlist_load_options(fieldset)
+    )
+    return await fetch_page(session, stmt, limit, _wishlist_keyset)
+
+
+async def get_wishlist_versions_owned_by(
+    session: AsyncSession,
+    username: str,
+    limit: int,
+    cursor: str | None = None,
+    archived: bool = False,
+) -> Page[Row]:
+    """
+    SQLAlchemy query to get uuids and versions of the wishlists on a page of
+    get_wishlists_owned_by or get_archived_wishlists_owned_by, without their items.
+    """
+
+    stmt = _owned_by_page_stmt(
+        username, cursor, archived, Wishlist.uuid, Wishlist.version, Wishlist.created_at
+    )
+    return await fetch_page(session, stmt, limit, _wishlist_keyset, scalars=False)
+
+
+async def get_wishlist_summaries_owned_by(
+    session: AsyncSession,
+    username: str,
+    limit: int,
+    cursor: str | None = None,
+    archived: bool = False,
+) -> Page[Row]:
+    """
+    SQLAlchemy query to get a page of wishlists owned by a user with their item counts,
+    aggregated in the database instead of loading the items.
+    """
+
+    stmt = (
+        _owned_by_page_stmt(
+            username,
+            cursor,
+            archived,
+            Wishlist.uuid,
+            Wishlist.name,
+            Wishlist.created_at,
+            Wishlist.version,
+            func.count(WishlistItem.uuid).label("item_count"),
+            func.count(WishlistItem.uuid)
+            .filter(WishlistItem.is_purchased)
+            .label("purchased_count"),
+        )
+        .outerjoin(WishlistItem, WishlistItem.wishlist_uuid == Wishlist.uuid)
+        # Grouping in keyset order lets the index scan feed the aggregation directly
+        .group_by(Wishlist.created_at, Wishlist.uuid)
+    )
+    return await fetch_page(session, stmt, limit, _wishlist_keyset, scalars=False)
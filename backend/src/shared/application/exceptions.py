@@ -25,11 +25,20 @@ class Forbidden(ApplicationException):
     pass
 
 
+class BadRequestException(ApplicationException):
+    pass
+
+
 class TokenException(ApplicationException):
     def __init__(self, message: str):
         super().__init__(message)
 
 
+class ConcurrentModification(ConflictException):
+    def __init__(self, error_message: str = "Data was modified by another request"):
+        super().__init__(error_message)
+
+
 class UserNotAuthorized(Forbidden):
     def __init__(self, username: str):
         super().__init__(
@@ -119,3 +128,13 @@ class WishlistItemAlreadyPurchased(ConflictException):
 class WishlistItemNotPurchased(ConflictException):
     def __init__(self, uuid: UUID):
         super().__init__(f"Wishlist item '{uuid}' is not purchased")
+
+
+class InvalidCursor(BadRequestException):
+    def __init__(self, cursor: str):
+        super().__init__(f"Cursor '{cursor}' is invalid")
+
+
+class InvalidFields(BadRequestException):
+    def __init__(self, fields: str):
+        super().__init__(f"Fields '{fields}' are invalid")
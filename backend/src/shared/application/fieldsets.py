@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from typing import Collection, Mapping
+
+from src.shared.application.exceptions import InvalidFields
+
+
+@dataclass(frozen=True)
+class Fieldset:
+    """Fields a client asked for, fields of nested objects as paths like items.name."""
+
+    paths: frozenset[str]
+
+    @property
+    def fields(self) -> frozenset[str]:
+        return frozenset(path.partition(".")[0] for path in self.paths)
+
+    def nested_fields(self, field: str) -> frozenset[str] | None:
+        """Fields picked inside a nested object, None if all of them are wanted."""
+        prefix = f"{field}."
+        nested = frozenset(
+            path.removeprefix(prefix) for path in self.paths if path.startswith(prefix)
+        )
+        return nested or None
+
+
+def parse_fieldset(value: str, allowed: Mapping[str, Collection[str]]) -> Fieldset:
+    """
+    Parse a comma separated fields parameter. Allowed maps every field to the fields
+    of its nested object, empty for plain fields.
+    """
+    paths = frozenset(path.strip() for path in value.split(",") if path.strip())
+    if not paths:
+        raise InvalidFields(value)
+    for path in paths:
+        field, separator, nested = path.partition(".")
+        if field not in allowed or (separator and nested not in allowed[field]):
+            raise InvalidFields(value)
+    return Fieldset(paths)
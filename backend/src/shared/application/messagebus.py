@@ -1,35 +1,73 @@
+import asyncio
 import logging
-from typing import Any
+import random
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
 
-from src.shared.application.exceptions import ApplicationException
-from src.shared.application.uow import UnitOfWork
+from src.shared.application.exceptions import (
+    ApplicationException,
+    ConcurrentModification,
+)
+from src.shared.application.uow import AsyncUnitOfWork
 from src.shared.domain.commands import Command
 from src.shared.domain.events import DomainEvent
 
 # Dependencies should be injected in handlers by bootstrap script (see src/bootstrap.py)
-# So we don't need to pass any dependencies to handlers. Usage: handler_name(message)
+# So we don't need to pass any dependencies to handlers. Usage: await handler_name(message)
 
 logger = logging.getLogger("messagebus")
 
+Handler = Callable[[Any], Awaitable[Any]]
 
-class Messagebus:
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often a command is retried after losing a race with a concurrent change."""
+
+    attempts: int = 1
+    base_delay: float = 0.01
+    max_delay: float = 0.5
+
+    def delay(self, attempt: int) -> float:
+        """Exponential backoff with full jitter, so conflicting retries spread out."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+class AsyncMessagebus:
     def __init__(
         self,
-        uow: UnitOfWork,
-        command_handlers: dict[type[Command], callable],
-        event_handlers: dict[type[DomainEvent], list[callable]],
+        uow: AsyncUnitOfWork,
+        command_handlers: dict[type[Command], Handler],
+        event_handlers: dict[type[DomainEvent], list[Handler]],
         dependencies: dict[str, object],
+        retry_policy: RetryPolicy = RetryPolicy(),
+        committed_event_handlers: dict[type[DomainEvent], list[Handler]] = None,
     ):
         self.uow = uow
         self.command_handlers = command_handlers
         self.event_handlers = event_handlers
+        self.committed_event_handlers = committed_event_handlers or {}
         self.dependencies = dependencies
+        self.retry_policy = retry_policy
         self.queue = []
 
-    def _handle_command(self, command: Command) -> Any:
+    async def _run_command_handler(self, command_handler: Handler, command: Command):
+        """Runs a command handler again (in a fresh unit of work) on concurrent modification."""
+        for attempt in range(1, self.retry_policy.attempts + 1):
+            try:
+                return await command_handler(command)
+            except ConcurrentModification:
+                if attempt == self.retry_policy.attempts:
+                    raise
+                logger.info(
+                    f"Command {command} conflicted with a concurrent change, retrying"
+                )
+                await asyncio.sleep(self.retry_policy.delay(attempt))
+
+    async def _handle_command(self, command: Command) -> Any:
         try:
             command_handler = self.command_handlers[type(command)]
-            result = command_handler(command)
+            result = await self._run_command_handler(command_handler, command)
             self.queue.extend(self.uow.collect_new_events())
             logger.info(
                 f"Command {command} handled successfully by {command_handler.__name__}"
@@ -42,10 +80,10 @@ class Messagebus:
             logger.exception(f"Failed to handle command {command}. Exception: {e}")
             raise e
 
-    def _handle_event(self, event: DomainEvent):
+    async def _handle_event(self, event: DomainEvent, raise_on_error: bool):
         for event_handler in self.event_handlers[type(event)]:
             try:
-                event_handler(event)
+                await event_handler(event)
                 self.queue.extend(self.uow.collect_new_events())
                 logger.info(
                     f"Event {event} handled successfully by {event_handler.__name__}"
@@ -58,21 +96,47 @@ class Messagebus:
                 logger.exception(
                     f"Failed to handle event {event} by {event_handler.__name__}. Exception: {e}"
                 )
-                continue
+                if raise_on_error:
+                    raise e
 
-    def handle(self, message: Command | DomainEvent):
+    async def _handle_committed_events(self):
+        """
+        Runs committed event handlers in this process as soon as the events are stored,
+        instead of waiting for the outbox relay (which runs the event handlers later).
+        """
+        while self.uow.committed_events:
+            event = self.uow.committed_events.pop(0)
+            for handler in self.committed_event_handlers.get(type(event), []):
+                try:
+                    await handler(event)
+                except Exception as e:
+                    logger.exception(
+                        f"Failed to handle committed event {event} by {handler.__name__}. Exception: {e}"
+                    )
+
+    async def handle(
+        self, message: Command | DomainEvent, raise_on_error: bool = False
+    ):
         """
         Handles all messages in the queue.
         This should be the only result, because there should be a single command in the messagebus queue
+        Unexpected event handler errors are only logged, unless raise_on_error is set
+        (the outbox relay retries such events). Rejections by ApplicationException are final.
         """
         self.queue = [message]
         result = None
-        while self.queue:
-            message = self.queue.pop(0)
-            if isinstance(message, Command):
-                result = self._handle_command(message)
-            elif isinstance(message, DomainEvent):
-                self._handle_event(message)
-            else:
-                raise Exception(f"Unknown message type in messagebus: {type(message)}")
+        try:
+            while self.queue:
+                message = self.queue.pop(0)
+                if isinstance(message, Command):
+                    result = await self._handle_command(message)
+                elif isinstance(message, DomainEvent):
+                    await self._handle_event(message, raise_on_error)
+                else:
+                    raise Exception(
+                        f"Unknown message type in messagebus: {type(message)}"
+                    )
+        finally:
+            # Also after a failure, changes committed before it must not be served stale
+            await self._handle_committed_events()
         return result
@@ -0,0 +1,34 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Sequence, TypeVar
+
+from src.shared.application.exceptions import InvalidCursor
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    """A slice of a keyset-ordered result and the cursor of the next slice."""
+
+    items: Sequence[T]
+    next_cursor: str | None = None
+
+
+def encode_cursor(*values: Any) -> str:
+    """Pack keyset values into an opaque URL-safe cursor."""
+    payload = json.dumps(values, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> tuple:
+    """Unpack a cursor, parsing every keyset value with the matching parser."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError(cursor)
+        return tuple(parse(value) for parse, value in zip(parsers, values))
+    except (binascii.Error, UnicodeError, TypeError, ValueError):
+        raise InvalidCursor(cursor)
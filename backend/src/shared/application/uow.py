@@ -1,5 +1,5 @@
 import abc
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from src.modules.users.infrastructure.user_repository import UserRepository
@@ -8,30 +8,47 @@ if TYPE_CHECKING:
     )
 
 
-class UnitOfWork(abc.ABC):
-    user_repository: "UserRepository"
-    wishlist_repository: "WishlistRepository"
+class AsyncUnitOfWork(abc.ABC):
+    user_repository: Optional["UserRepository"]
+    wishlist_repository: Optional["WishlistRepository"]
 
-    def __init__(self):
+    def __init__(self, read_only: bool = False):
         self.committed = None  # used only in tests
+        self.read_only = read_only
+        # Repositories may be created on enter, a unit of work left unused has none
+        self.user_repository = None
+        self.wishlist_repository = None
+        # Events made durable by commit (stored for the outbox relay), for handlers
+        # that must also see them in the committing process, like cache invalidation
+        self.committed_events = []
 
     @abc.abstractmethod
-    def _commit(self): ...
+    def as_read_only(self) -> "AsyncUnitOfWork":
+        """Returns a unit of work over the same storage for handlers that never write."""
 
-    def commit(self):
-        self._commit()
+    @abc.abstractmethod
+    async def _commit(self): ...
+
+    async def commit(self):
+        if self.read_only:
+            raise RuntimeError("Read-only unit of work can't be committed")
+        await self._commit()
 
     def collect_new_events(self):
+        if self.read_only:
+            return
         for repository in (self.user_repository, self.wishlist_repository):
+            if repository is None:
+                continue
             for aggregate in repository.seen:
                 while aggregate.events:
                     yield aggregate.events.pop(0)
 
     @abc.abstractmethod
-    def _rollback(self): ...
+    async def _rollback(self): ...
 
-    def __enter__(self):
+    async def __aenter__(self):
         return self
 
-    def __exit__(self, *args):
-        self._rollback()
+    async def __aexit__(self, *args):
+        await self._rollback()
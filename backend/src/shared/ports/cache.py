@@ -0,0 +1,29 @@
+import abc
+from typing import Awaitable, Callable
+
+
+class Cache(abc.ABC):
+    """
+    Serialized values shared between processes, such as query responses.
+    Keys are scoped to the cache, so callers pass plain identifiers.
+    """
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> str | None:
+        pass
+
+    @abc.abstractmethod
+    async def get_or_load(self, key: str, load: Callable[[], Awaitable[str]]) -> str:
+        """Returns the cached value, or loads and caches it on a miss"""
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: str) -> None:
+        pass
+
+    @abc.abstractmethod
+    async def invalidate(self, key: str) -> None:
+        """Removes the value from the cache in every process"""
+
+    @abc.abstractmethod
+    def snapshot(self) -> dict:
+        """Returns hit, miss and eviction counters"""
@@ -0,0 +1,45 @@
+import abc
+import json
+from dataclasses import asdict, dataclass, field, replace
+from uuid import uuid4
+
+
+@dataclass(frozen=True)
+class EmailMessage:
+    recipient: str
+    subject: str
+    body: str
+    attempts: int = 0
+    id: str = field(default_factory=lambda: uuid4().hex)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), sort_keys=True)
+
+    @classmethod
+    def from_json(cls, payload: str | bytes) -> "EmailMessage":
+        return cls(**json.loads(payload))
+
+    def next_attempt(self) -> "EmailMessage":
+        return replace(self, attempts=self.attempts + 1)
+
+
+class EmailQueue(abc.ABC):
+    @abc.abstractmethod
+    def enqueue(self, message: EmailMessage) -> None:
+        """Add a message to the queue"""
+
+    @abc.abstractmethod
+    def claim(self, count: int) -> list[EmailMessage]:
+        """Take up to count messages for delivery, keeping them until acknowledged"""
+
+    @abc.abstractmethod
+    def ack(self, messages: list[EmailMessage]) -> None:
+        """Remove delivered (or abandoned) messages"""
+
+    @abc.abstractmethod
+    def retry(self, message: EmailMessage, delay: float) -> None:
+        """Put a claimed message back to be delivered again after delay seconds"""
+
+    @abc.abstractmethod
+    def requeue_unacknowledged(self) -> int:
+        """Return messages claimed by a stopped sender back to the queue"""
@@ -11,10 +11,10 @@ class BaseRepository(abc.ABC, Generic[T]):
         self.seen: set[T] = set()
 
     @abc.abstractmethod
-    def _get(self, identifier) -> Optional[T]: ...
+    async def _get(self, identifier) -> Optional[T]: ...
 
-    def get(self, identifier) -> Optional[T]:
-        item = self._get(identifier)
+    async def get(self, identifier) -> Optional[T]:
+        item = await self._get(identifier)
         if item:
             self.seen.add(item)
         return item
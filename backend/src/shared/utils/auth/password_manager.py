@@ -1,53 +1,181 @@
 import abc
-import logging
+import asyncio
+from collections import Counter
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, TypeVar
 
 from passlib.context import CryptContext
-from zxcvbn import zxcvbn
 
-from src.shared.application.exceptions import (
-    PasswordValidationError,
-    PasswordVerificationError,
+from src.config import settings
+from src.shared.application.exceptions import PasswordVerificationError
+from src.shared.utils.auth.password_strength import (
+    assert_password_strong,
+    prefilter_password,
 )
 
-logger = logging.getLogger(__name__)
+T = TypeVar("T")
+
+
+class PasswordHashMetrics:
+    """Counters of password verifications, outdated hashes found and hashes upgraded."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.verifications = 0
+        self.outdated_hashes: Counter[str] = Counter()
+        self.rehashes = 0
+
+    def record_verification(self, outdated_scheme: str | None = None) -> None:
+        self.verifications += 1
+        if outdated_scheme is not None:
+            self.outdated_hashes[outdated_scheme] += 1
+
+    def record_rehash(self) -> None:
+        self.rehashes += 1
+
+    def snapshot(self) -> dict:
+        return {
+            "verifications": self.verifications,
+            "outdated_hashes": sum(self.outdated_hashes.values()),
+            "outdated_hashes_by_scheme": dict(self.outdated_hashes),
+            "rehashes": self.rehashes,
+        }
+
+
+password_hash_metrics = PasswordHashMetrics()
 
 
 class PasswordManager(abc.ABC):
-    @staticmethod
-    def assert_password_valid(password: str, user_inputs: list | None = None):
-        """Raises PasswordValidationError if the password does not meet the validation rules"""
-        if len(password) < 8:
-            raise PasswordValidationError("Password must be at least 8 characters long")
+    """
+    Hashing runs in the executor (the event loop's default thread pool when None).
+    At most max_concurrency operations are submitted at once, later ones wait their turn.
+    """
 
-        results = zxcvbn(password, user_inputs=user_inputs)
-        if results["score"] < 3:
-            feedback = results["feedback"]["warning"] or "Password too weak"
-            raise PasswordValidationError(feedback)
+    def __init__(self, executor: Executor | None = None, max_concurrency: int = 8):
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self._admission: asyncio.Semaphore | None = None
+        self._admission_loop: asyncio.AbstractEventLoop | None = None
+
+    async def assert_password_valid(
+        self, password: str, user_inputs: list | None = None
+    ):
+        """Raises PasswordValidationError if the password does not meet the validation rules"""
+        prefilter_password(password, user_inputs=user_inputs)
+        await self._run(
+            assert_password_strong,
+            password,
+            user_inputs,
+            settings.password_strength_max_analyzed_length,
+        )
 
     @abc.abstractmethod
-    def hash_password(self, password: str) -> str: ...
+    async def hash_password(self, password: str) -> str: ...
 
     @abc.abstractmethod
-    def verify_password(cls, password: str, password_hash: str) -> bool: ...
+    async def verify_and_update(
+        self, password: str, password_hash: str
+    ) -> tuple[bool, str | None]:
+        """Verifies the password, returns a new hash if the given one is outdated"""
+
+    async def verify_password(self, password: str, password_hash: str) -> bool:
+        is_valid, _ = await self.verify_and_update(password, password_hash)
+        return is_valid
 
-    def assert_passwords_match(self, password: str, password_hash: str):
-        if not self.verify_password(password, password_hash):
+    async def assert_passwords_match(
+        self, password: str, password_hash: str
+    ) -> str | None:
+        """Raises PasswordVerificationError on mismatch, returns a new hash if outdated"""
+        is_valid, new_hash = await self.verify_and_update(password, password_hash)
+        if not is_valid:
             raise PasswordVerificationError
+        return new_hash
 
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
 
-class Argon2PasswordManager(PasswordManager):
-    def __init__(self):
-        self.pwd_context = CryptContext(
-            schemes=["argon2", "hex_sha256"], default="argon2", deprecated="auto"
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        """Run func in the executor once admitted, func must be picklable for process pools"""
+        async with self._get_admission():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+
+    def _get_admission(self) -> asyncio.Semaphore:
+        # A semaphore waits on the loop it was first contended in
+        loop = asyncio.get_running_loop()
+        if self._admission_loop is not loop:
+            self._admission = asyncio.Semaphore(self.max_concurrency)
+            self._admission_loop = loop
+        return self._admission
+
+
+@dataclass(frozen=True)
+class Argon2Parameters:
+    time_cost: int = 3
+    memory_cost: int = 65536
+    parallelism: int = 4
+
+    @classmethod
+    def from_settings(cls) -> "Argon2Parameters":
+        return cls(
+            time_cost=settings.password_hashing_time_cost,
+            memory_cost=settings.password_hashing_memory_cost,
+            parallelism=settings.password_hashing_parallelism,
         )
 
-    def hash_password(self, password: str) -> str:
-        return self.pwd_context.hash(password)
 
-    def verify_password(self, password: str, password_hash: str) -> bool:
-        is_valid, new_hash = self.pwd_context.verify_and_update(password, password_hash)
+@lru_cache
+def get_crypt_context(parameters: Argon2Parameters) -> CryptContext:
+    return CryptContext(
+        schemes=["argon2", "hex_sha256"],
+        default="argon2",
+        deprecated="auto",
+        argon2__rounds=parameters.time_cost,
+        argon2__memory_cost=parameters.memory_cost,
+        argon2__parallelism=parameters.parallelism,
+    )
+
+
+def argon2_hash(
+    password: str, parameters: Argon2Parameters = Argon2Parameters()
+) -> str:
+    return get_crypt_context(parameters).hash(password)
+
+
+def argon2_verify_and_update(
+    password: str,
+    password_hash: str,
+    parameters: Argon2Parameters = Argon2Parameters(),
+) -> tuple[bool, str | None]:
+    return get_crypt_context(parameters).verify_and_update(password, password_hash)
+
+
+class Argon2PasswordManager(PasswordManager):
+    def __init__(
+        self,
+        parameters: Argon2Parameters = Argon2Parameters(),
+        executor: Executor | None = None,
+        max_concurrency: int = 8,
+    ):
+        super().__init__(executor=executor, max_concurrency=max_concurrency)
+        self.parameters = parameters
+
+    async def hash_password(self, password: str) -> str:
+        return await self._run(argon2_hash, password, self.parameters)
+
+    async def verify_and_update(
+        self, password: str, password_hash: str
+    ) -> tuple[bool, str | None]:
+        is_valid, new_hash = await self._run(
+            argon2_verify_and_update, password, password_hash, self.parameters
+        )
+        outdated_scheme = None
         if new_hash:
-            logger.warning(
-                f"Password hash needs to be updated (old_hash={password_hash}, new_hash={new_hash})"
-            )
-        return is_valid
+            outdated_scheme = get_crypt_context(self.parameters).identify(password_hash)
+        password_hash_metrics.record_verification(outdated_scheme)
+        return is_valid, new_hash
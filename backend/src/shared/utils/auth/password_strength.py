@@ -0,0 +1,48 @@
+from zxcvbn import zxcvbn
+from zxcvbn.frequency_lists import FREQUENCY_LISTS
+
+from src.shared.application.exceptions import PasswordValidationError
+
+MIN_LENGTH = 8
+MIN_SCORE = 3
+# zxcvbn counts at most 10 guesses per character, so no password of this length or
+# shorter reaches MIN_SCORE (10**8 guesses)
+MAX_ALWAYS_WEAK_LENGTH = 8
+# zxcvbn refuses to analyze longer passwords
+ZXCVBN_MAX_LENGTH = 72
+
+# Most common passwords long enough to pass the length checks,
+# taken from the zxcvbn frequency list, which ranks each of them far below MIN_SCORE
+COMMON_PASSWORDS = frozenset(
+    password
+    for password in FREQUENCY_LISTS["passwords"][:10000]
+    if len(password) > MAX_ALWAYS_WEAK_LENGTH
+)
+
+
+def prefilter_password(password: str, user_inputs: list | None = None) -> None:
+    """Cheap checks rejecting passwords zxcvbn would reject anyway"""
+    if len(password) < MIN_LENGTH:
+        raise PasswordValidationError(
+            f"Password must be at least {MIN_LENGTH} characters long"
+        )
+    if len(password) <= MAX_ALWAYS_WEAK_LENGTH:
+        raise PasswordValidationError("Password too weak")
+
+    lowered = password.lower()
+    if lowered in COMMON_PASSWORDS:
+        raise PasswordValidationError("This is a very common password")
+    if user_inputs and lowered in (str(value).lower() for value in user_inputs):
+        raise PasswordValidationError("Password must not match your user details")
+
+
+def assert_password_strong(
+    password: str, user_inputs: list | None = None, max_length: int = 32
+) -> None:
+    """Full zxcvbn analysis of the first max_length characters of the password"""
+    results = zxcvbn(
+        password[: min(max_length, ZXCVBN_MAX_LENGTH)], user_inputs=user_inputs
+    )
+    if results["score"] < MIN_SCORE:
+        feedback = results["feedback"]["warning"] or "Password too weak"
+        raise PasswordValidationError(feedback)
@@ -1,30 +1,81 @@
 import abc
 import datetime
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING
 
 import jwt
 
 from src.config import settings
 from src.shared.application.exceptions import TokenException
 
+if TYPE_CHECKING:
+    from src.modules.users.domain.model import User
+
+
+class TokenType(StrEnum):
+    ACCESS = "access"
+    REFRESH = "refresh"
+
+
+@dataclass(frozen=True)
+class TokenClaims:
+    """
+    Identity carried by a token. Access tokens are trusted without a database lookup
+    until they expire, refresh tokens are checked against the user's token generation.
+    """
+
+    username: str
+    is_active: bool = False
+    is_superuser: bool = False
+    token_generation: int = 0
+    token_type: TokenType = TokenType.ACCESS
+
+    @classmethod
+    def from_user(
+        cls, user: "User", token_type: TokenType = TokenType.ACCESS
+    ) -> "TokenClaims":
+        return cls(
+            username=user.username,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+            token_generation=user.token_generation,
+            token_type=token_type,
+        )
+
+
+@dataclass(frozen=True)
+class AuthTokens:
+    access_token: str
+    refresh_token: str
+
 
 class TokenManager(abc.ABC):
     @staticmethod
     @abc.abstractmethod
     def generate_token(
-        username: str, token_lifetime: None | datetime.timedelta = None
+        claims: TokenClaims, token_lifetime: None | datetime.timedelta = None
     ) -> str: ...
 
     @staticmethod
     @abc.abstractmethod
-    def get_username_from_token(token: str) -> str: ...
+    def get_claims_from_token(
+        token: str, token_type: TokenType = TokenType.ACCESS
+    ) -> TokenClaims: ...
 
 
 class JWTManager(TokenManager):
     @staticmethod
     def generate_token(
-        username: str, token_lifetime: None | datetime.timedelta = None
+        claims: TokenClaims, token_lifetime: None | datetime.timedelta = None
     ) -> str:
-        payload = {"username": username}
+        payload = {
+            "username": claims.username,
+            "is_active": claims.is_active,
+            "is_superuser": claims.is_superuser,
+            "token_generation": claims.token_generation,
+            "type": claims.token_type.value,
+        }
         if token_lifetime:
             payload["exp"] = datetime.datetime.now(datetime.UTC) + token_lifetime
         token = jwt.encode(
@@ -51,6 +102,16 @@ class JWTManager(TokenManager):
         return token_payload
 
     @classmethod
-    def get_username_from_token(cls, token: str) -> str:
+    def get_claims_from_token(
+        cls, token: str, token_type: TokenType = TokenType.ACCESS
+    ) -> TokenClaims:
         token_payload = cls.__decode_token(token)
-        return token_payload["username"]
+        if token_payload.get("type") != token_type:
+            raise TokenException(f"Token type is not {token_type}: {token}")
+        return TokenClaims(
+            username=token_payload["username"],
+            is_active=token_payload["is_active"],
+            is_superuser=token_payload["is_superuser"],
+            token_generation=token_payload["token_generation"],
+            token_type=token_type,
+        )
@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import smtplib
+import ssl
+from email.message import EmailMessage as MIMEMessage
+from typing import Callable
+
+from src.config import settings
+from src.shared.ports.email_queue import EmailMessage, EmailQueue
+
+logger = logging.getLogger("email_sender")
+
+SMTPConnectionFactory = Callable[[], smtplib.SMTP]
+
+
+def create_smtp_connection_factory(
+    host: str = None,
+    port: int = None,
+    username: str | None = None,
+    password: str | None = None,
+    use_tls: bool = None,
+    use_ssl: bool = None,
+    timeout: float = None,
+) -> SMTPConnectionFactory:
+    """Factory of connected and authenticated SMTP clients, defaults from settings"""
+    host = host or settings.smtp_host
+    port = port or settings.smtp_port
+    username = username if username is not None else settings.smtp_username
+    password = password if password is not None else settings.smtp_password
+    use_tls = use_tls if use_tls is not None else settings.smtp_use_tls
+    use_ssl = use_ssl if use_ssl is not None else settings.smtp_use_ssl
+    timeout = timeout or settings.smtp_timeout_seconds
+
+    def connect() -> smtplib.SMTP:
+        if use_ssl:
+            smtp = smtplib.SMTP_SSL(
+                host, port, timeout=timeout, context=ssl.create_default_context()
+            )
+        else:
+            smtp = smtplib.SMTP(host, port, timeout=timeout)
+        try:
+            if use_tls and not use_ssl:
+                smtp.starttls(context=ssl.create_default_context())
+            if username:
+                smtp.login(username, password or "")
+        except BaseException:
+            smtp.close()
+            raise
+        return smtp
+
+    return connect
+
+
+class EmailSender:
+    """
+    Delivers queued emails over a pool of persistent SMTP connections.
+    Each connection is used by one worker thread at a time, failed messages are
+    retried with exponential backoff until max_attempts is reached.
+    """
+
+    def __init__(
+        self,
+        email_queue: EmailQueue,
+        connection_factory: SMTPConnectionFactory,
+        sender_address: str,
+        pool_size: int = 2,
+        batch_size: int = 50,
+        max_attempts: int = 5,
+        retry_base_delay: float = 5.0,
+        poll_interval: float = 1.0,
+    ):
+        self.email_queue = email_queue
+        self.connection_factory = connection_factory
+        self.sender_address = sender_address
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.poll_interval = poll_interval
+        self._connections: list[smtplib.SMTP | None] = [None] * pool_size
+
+    async def send_batch(self) -> int:
+        """Deliver one batch of queued emails, return the number of claimed emails"""
+        messages = await asyncio.to_thread(self.email_queue.claim, self.batch_size)
+        if not messages:
+            return 0
+
+        pool_size = len(self._connections)
+        chunks = [messages[slot::pool_size] for slot in range(pool_size)]
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._send_chunk, slot, chunk)
+                for slot, chunk in enumerate(chunks)
+                if chunk
+            )
+        )
+
+        delivered, abandoned = [], []
+        for chunk_delivered, chunk_failed in results:
+            delivered.extend(chunk_delivered)
+            for message in chunk_failed:
+                if message.attempts + 1 >= self.max_attempts:
+                    logger.error(
+                        f"Dropping email {message.id} to {message.recipient} "
+                        f"after {message.attempts + 1} attempts"
+                    )
+                    abandoned.append(message)
+                else:
+                    delay = self.retry_base_delay * 2**message.attempts
+                    await asyncio.to_thread(self.email_queue.retry, message, delay)
+
+        await asyncio.to_thread(self.email_queue.ack, delivered + abandoned)
+        return len(messages)
+
+    async def run(self) -> None:
+        requeued = await asyncio.to_thread(self.email_queue.requeue_unacknowledged)
+        if requeued:
+            logger.info(f"Requeued {requeued} unacknowledged emails")
+
+        while True:
+            try:
+                claimed = await self.send_batch()
+            except Exception as e:
+                logger.exception(f"Email sender failed: {e}")
+                claimed = 0
+            if claimed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    def close(self) -> None:
+        for slot in range(len(self._connections)):
+            self._disconnect(slot)
+
+    def _send_chunk(
+        self, slot: int, messages: list[EmailMessage]
+    ) -> tuple[list[EmailMessage], list[EmailMessage]]:
+        delivered, failed = [], []
+        for message in messages:
+            try:
+                self._send(slot, message)
+            except (smtplib.SMTPException, OSError) as e:
+                logger.warning(f"Failed to send email {message.id}: {e}")
+                self._disconnect(slot)
+                failed.append(message)
+            else:
+                delivered.append(message)
+        return delivered, failed
+
+    def _send(self, slot: int, message: EmailMessage) -> None:
+        mime_message = self._build_mime_message(message)
+        connection = self._connections[slot]
+        if connection is not None:
+            try:
+                connection.send_message(mime_message)
+                return
+            except smtplib.SMTPServerDisconnected:
+                # Idle connections are closed by the server, reconnect once
+                self._disconnect(slot)
+
+        connection = self._connections[slot] = self.connection_factory()
+        connection.send_message(mime_message)
+
+    def _disconnect(self, slot: int) -> None:
+        connection, self._connections[slot] = self._connections[slot], None
+        if connection is None:
+            return
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.close()
+
+    def _build_mime_message(self, message: EmailMessage) -> MIMEMessage:
+        mime_message = MIMEMessage()
+        mime_message["From"] = self.sender_address
+        mime_message["To"] = message.recipient
+        mime_message["Subject"] = message.subject
+        mime_message.set_content(message.body)
+        return mime_message
@@ -1,18 +1,18 @@
 import abc
-from smtplib import SMTP
+import asyncio
 
-from src.config import settings
 from src.modules.users.domain.model import User
+from src.shared.ports.email_queue import EmailMessage, EmailQueue
 
 
 class Notificator(abc.ABC):
     @abc.abstractmethod
-    def send_notification(
+    async def send_notification(
         self, recipient: "User", subject: str, message: str
     ) -> None: ...
 
-    def send_activation_code(self, recipient: "User", activation_code: str):
-        self.send_notification(
+    async def send_activation_code(self, recipient: "User", activation_code: str):
+        await self.send_notification(
             recipient=recipient,
             subject="WannaBuyThis Account activation",
             message=f"Activation code: {activation_code}",
@@ -20,10 +20,16 @@ class Notificator(abc.ABC):
 
 
 class EmailNotificator(Notificator):
-    def send_notification(self, recipient: "User", subject: str, message: str) -> None:
-        with SMTP(settings.smtp_host) as smtp:
-            smtp.sendmail(
-                from_addr=settings.smtp_sender,
-                to_addrs=[recipient.email],
-                msg=f"Subject: {subject}\n\n{message}".encode(),
-            )
+    """Enqueues emails, the email sender worker delivers them"""
+
+    def __init__(self, email_queue: EmailQueue):
+        self.email_queue = email_queue
+
+    async def send_notification(
+        self, recipient: "User", subject: str, message: str
+    ) -> None:
+        # The queue client is blocking, keep its round trip off the event loop
+        await asyncio.to_thread(
+            self.email_queue.enqueue,
+            EmailMessage(recipient=recipient.email, subject=subject, body=message),
+        )
@@ -1,15 +1,21 @@
+import os
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import StaticPool, create_engine
-from sqlalchemy.orm import clear_mappers, sessionmaker
+from fakeredis import FakeAsyncRedis
+from sqlalchemy import NullPool, StaticPool
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import clear_mappers
 
 from src import bootstrap
+from src.infrastructure.cache.two_tier_cache import TwoTierCache
 from src.infrastructure.database.sqlalchemy.orm import (
     mapper_registry,
     start_sqlalchemy_mappers,
 )
-from src.infrastructure.database.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
+from src.infrastructure.database.sqlalchemy.unit_of_work import (
+    SQLAlchemyAsyncUnitOfWork,
+)
 from src.modules.users.domain.model import User
 from src.modules.wishlists.domain.model import (
     MeasurementUnit,
@@ -20,13 +26,18 @@ from src.modules.wishlists.domain.model import (
 from src.shared.utils.activation_codes.activation_code_generator import (
     RandomActivationCodeGenerator,
 )
-from src.shared.utils.auth.password_manager import Argon2PasswordManager
+from src.shared.utils.auth.password_manager import Argon2PasswordManager, argon2_hash
 from src.shared.utils.auth.token_manager import JWTManager
 from src.shared.utils.generators.uuid_generator import DefaultUUIDGenerator
 from tests.fakes import FakeActivationCodeStorage, FakeNotificator, FakeUnitOfWork
 
 
 # General purpose fixtures
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
 @pytest.fixture
 def valid_password():
     return "StrongPassword123!"
@@ -73,7 +84,7 @@ def user(email, valid_password):
     return User(
         username="testuser",
         email=email,
-        password_hash=Argon2PasswordManager().hash_password(valid_password),
+        password_hash=argon2_hash(valid_password),
         is_active=True,
     )
 
@@ -83,7 +94,7 @@ def admin_user(admin_email, valid_password):
     return User(
         username="admin",
         email=admin_email,
-        password_hash=Argon2PasswordManager().hash_password(valid_password),
+        password_hash=argon2_hash(valid_password),
         is_active=True,
         is_superuser=True,
     )
@@ -158,6 +169,35 @@ def populated_wishlist(user, purchased_banana_item, apple_item, wishlist_name):
     return populated_wishlist
 
 
+@pytest.fixture
+def populated_wishlists(user, measurement_unit, priority):
+    """Three active and one archived wishlist, each with two items"""
+    wishlists = []
+    for number in range(4):
+        wishlist_uuid = uuid4()
+        items = [
+            WishlistItem(
+                uuid=uuid4(),
+                wishlist_uuid=wishlist_uuid,
+                name=f"Item {number}-{item_number}",
+                quantity=1,
+                measurement_unit=measurement_unit,
+                priority=priority,
+            )
+            for item_number in range(2)
+        ]
+        wishlists.append(
+            Wishlist(
+                uuid=wishlist_uuid,
+                owner_username=user.username,
+                name=f"Wishlist {number}",
+                items=items,
+                is_archived=number == 3,
+            )
+        )
+    return wishlists
+
+
 @pytest.fixture
 def archived_wishlist(wishlist):
     wishlist.is_archived = True
@@ -173,44 +213,74 @@ def prepare_mappers():
 
 
 @pytest.fixture
-def sqlite_database_engine(prepare_mappers):
-    engine = create_engine(
-        "sqlite://",
+async def sqlite_database_engine(anyio_backend, prepare_mappers):
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
-    mapper_registry.metadata.create_all(engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(mapper_registry.metadata.create_all)
     yield engine
-    mapper_registry.metadata.drop_all(engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(mapper_registry.metadata.drop_all)
+    await engine.dispose()
 
 
 @pytest.fixture
 def sqlite_session_factory(sqlite_database_engine):
-    yield sessionmaker(bind=sqlite_database_engine)
+    yield async_sessionmaker(bind=sqlite_database_engine, expire_on_commit=False)
+
+
+@pytest.fixture
+async def sqlite_session(anyio_backend, sqlite_session_factory):
+    async with sqlite_session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+async def postgres_database_engine(anyio_backend, prepare_mappers):
+    """
+    PostgreSQL database for behaviour SQLite does not reproduce, such as asyncpg type
+    encoding and query plans. Skipped unless TEST_POSTGRES_DSN points to an asyncpg
+    URI of a disposable database.
+    """
+    dsn = os.environ.get("TEST_POSTGRES_DSN")
+    if not dsn:
+        pytest.skip("TEST_POSTGRES_DSN is not set")
+    engine = create_async_engine(dsn, poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(mapper_registry.metadata.drop_all)
+        await conn.run_sync(mapper_registry.metadata.create_all)
+    yield engine
+    async with engine.begin() as conn:
+        await conn.run_sync(mapper_registry.metadata.drop_all)
+    await engine.dispose()
 
 
 @pytest.fixture
-def sqlite_session(sqlite_session_factory):
-    session = sqlite_session_factory()
-    yield session
-    session.close()
+def postgres_session_factory(postgres_database_engine):
+    yield async_sessionmaker(bind=postgres_database_engine, expire_on_commit=False)
 
 
 @pytest.fixture
 def sqlalchemy_uow(sqlite_session_factory):
-    return SQLAlchemyUnitOfWork(sqlite_session_factory)
+    return SQLAlchemyAsyncUnitOfWork(sqlite_session_factory)
 
 
 # Messagebus fixture
 @pytest.fixture
 def messagebus():
     dependencies = bootstrap.create_dependencies_dict(
-        uow=FakeUnitOfWork(),
+        uow_factory=FakeUnitOfWork,
         password_manager=Argon2PasswordManager(),
         uuid_generator=DefaultUUIDGenerator(),
         activation_code_generator=RandomActivationCodeGenerator(),
         activation_code_storage=FakeActivationCodeStorage(),
         token_manager=JWTManager(),
         notificator=FakeNotificator(),
+        user_cache=TwoTierCache("user", FakeAsyncRedis()),
+        wishlist_cache=TwoTierCache("wishlist", FakeAsyncRedis()),
     )
-    return bootstrap.initialize_messagebus(dependencies=dependencies)
+    messagebus_factory = bootstrap.initialize_messagebus(dependencies=dependencies)
+    return messagebus_factory()
@@ -1,25 +1,31 @@
 import pytest
+from fakeredis import FakeAsyncRedis
 from fastapi.testclient import TestClient
+from sqlalchemy import NullPool, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
+from src.infrastructure.cache.two_tier_cache import TwoTierCache
+from src.infrastructure.database.sqlalchemy.orm import mapper_registry
 from src.infrastructure.entrypoints.fastapi.app import create_app
-from src.shared.utils.auth.token_manager import JWTManager
+from src.shared.application.messagebus import RetryPolicy
+from src.shared.utils.auth.token_manager import JWTManager, TokenClaims
 
 
 def add_authorization_header_to_client(client: TestClient, user) -> None:
-    token = JWTManager.generate_token(username=user.username)
+    token = JWTManager.generate_token(TokenClaims.from_user(user))
     client.headers = {"Authorization": f"Bearer {token}"}
 
 
-def add_user_to_db(client: TestClient, user) -> None:
-    with client.app.state.messagebus.uow as uow:
+async def add_user_to_db(client: TestClient, user) -> None:
+    async with client.app.state.dependencies["uow_factory"]() as uow:
         uow.user_repository.add(user)
-        uow.commit()
+        await uow.commit()
 
 
-def add_wishlist_to_db(client: TestClient, wishlist) -> None:
-    with client.app.state.messagebus.uow as uow:
+async def add_wishlist_to_db(client: TestClient, wishlist) -> None:
+    async with client.app.state.dependencies["uow_factory"]() as uow:
         uow.wishlist_repository.add(wishlist)
-        uow.commit()
+        await uow.commit()
 
 
 @pytest.fixture(scope="session")
@@ -29,7 +35,14 @@ def fastapi_app():
 
 @pytest.fixture
 def fastapi_app_with_test_database(fastapi_app, sqlite_session_factory):
-    fastapi_app.state.messagebus.uow.session_factory = sqlite_session_factory
+    uow_factory = fastapi_app.state.dependencies["uow_factory"]
+    uow_factory.session_factory = sqlite_session_factory
+    # Fresh caches per test, since the app is shared by the whole session
+    cache_redis_client = FakeAsyncRedis()
+    for name in ("user", "wishlist"):
+        fastapi_app.state.dependencies[f"{name}_cache"] = TwoTierCache(
+            name, cache_redis_client
+        )
     return fastapi_app
 
 
@@ -39,75 +52,154 @@ def client(fastapi_app_with_test_database) -> TestClient:
 
 
 @pytest.fixture
-def user_client(client: TestClient, user) -> TestClient:
+async def sqlite_file_session_factory(anyio_backend, prepare_mappers, tmp_path):
+    """Session factory for a file database, so every session gets its own connection."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'test.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+        poolclass=NullPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(mapper_registry.metadata.create_all)
+    yield async_sessionmaker(bind=engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+def concurrent_client(
+    fastapi_app, sqlite_file_session_factory, monkeypatch
+) -> TestClient:
+    """Test client backed by a database that can serve concurrent requests."""
+    uow_factory = fastapi_app.state.dependencies["uow_factory"]
+    uow_factory.session_factory = sqlite_file_session_factory
+    # SQLite serializes all writers, so conflicting commands may need many attempts
+    monkeypatch.setattr(
+        fastapi_app.state.messagebus_factory,
+        "retry_policy",
+        RetryPolicy(attempts=100, base_delay=0.01, max_delay=0.1),
+    )
+    return TestClient(fastapi_app)
+
+
+@pytest.fixture
+async def user_client(anyio_backend, client: TestClient, user) -> TestClient:
     """Test client with a signed-in user."""
-    add_user_to_db(client, user)
+    await add_user_to_db(client, user)
     add_authorization_header_to_client(client, user)
     return client
 
 
 @pytest.fixture
-def admin_client(client: TestClient, admin_user) -> TestClient:
+async def concurrent_user_with_populated_wishlist_client(
+    anyio_backend, concurrent_client: TestClient, user, populated_wishlist
+) -> TestClient:
+    """Concurrent test client with a signed-in user containing their populated wishlist."""
+    await add_user_to_db(concurrent_client, user)
+    await add_wishlist_to_db(concurrent_client, populated_wishlist)
+    add_authorization_header_to_client(concurrent_client, user)
+    return concurrent_client
+
+
+@pytest.fixture
+async def admin_client(anyio_backend, client: TestClient, admin_user) -> TestClient:
     """Test client with a signed-in admin."""
-    add_user_to_db(client, admin_user)
+    await add_user_to_db(client, admin_user)
     add_authorization_header_to_client(client, admin_user)
     return client
 
 
 @pytest.fixture
-def client_with_user(client: TestClient, user) -> TestClient:
+async def client_with_user(anyio_backend, client: TestClient, user) -> TestClient:
     """Test client containing a user in the database."""
-    add_user_to_db(client, user)
+    await add_user_to_db(client, user)
     return client
 
 
 @pytest.fixture
-def client_with_populated_wishlist(
-    client_with_user: TestClient, populated_wishlist
+async def client_with_users(
+    anyio_backend, client_with_user: TestClient, admin_user
+) -> TestClient:
+    """Test client containing a user and an admin in the database."""
+    await add_user_to_db(client_with_user, admin_user)
+    return client_with_user
+
+
+@pytest.fixture
+async def client_with_populated_wishlist(
+    anyio_backend, client_with_user: TestClient, populated_wishlist
 ) -> TestClient:
     """Test client containing a user and their populated wishlist in the database."""
-    add_wishlist_to_db(client_with_user, populated_wishlist)
+    await add_wishlist_to_db(client_with_user, populated_wishlist)
     return client_with_user
 
 
 @pytest.fixture
-def user_with_populated_wishlist_client(
-    user_client: TestClient, populated_wishlist
+async def user_with_populated_wishlist_client(
+    anyio_backend, user_client: TestClient, populated_wishlist
 ) -> TestClient:
     """Test client with a signed-in user containing their populated wishlist in the database."""
-    add_wishlist_to_db(user_client, populated_wishlist)
+    await add_wishlist_to_db(user_client, populated_wishlist)
     return user_client
 
 
 @pytest.fixture
-def user_with_archived_wishlist_client(
-    user_client: TestClient, archived_wishlist
+async def user_with_populated_wishlists_client(
+    anyio_backend, user_client: TestClient, populated_wishlists
+) -> TestClient:
+    """Test client with a signed-in user containing several populated wishlists in the database."""
+    for wishlist in populated_wishlists:
+        await add_wishlist_to_db(user_client, wishlist)
+    return user_client
+
+
+@pytest.fixture
+def executed_statements(sqlite_database_engine) -> list[str]:
+    """SQL statements executed against the test database once the fixture is requested."""
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(
+        sqlite_database_engine.sync_engine, "before_cursor_execute", record_statement
+    )
+    yield statements
+    event.remove(
+        sqlite_database_engine.sync_engine, "before_cursor_execute", record_statement
+    )
+
+
+@pytest.fixture
+async def user_with_archived_wishlist_client(
+    anyio_backend, user_client: TestClient, archived_wishlist
 ) -> TestClient:
     """Test client with a signed-in user containing their archived wishlist in the database."""
-    add_wishlist_to_db(user_client, archived_wishlist)
+    await add_wishlist_to_db(user_client, archived_wishlist)
     return user_client
 
 
 @pytest.fixture
-def admin_client_contains_deactivated_user(
-    admin_client: TestClient, deactivated_user
+async def admin_client_contains_deactivated_user(
+    anyio_backend, admin_client: TestClient, deactivated_user
 ) -> TestClient:
     """Test client with a signed-in admin containing a deactivated user in the database."""
-    add_user_to_db(admin_client, deactivated_user)
+    await add_user_to_db(admin_client, deactivated_user)
     return admin_client
 
 
 @pytest.fixture
-def admin_client_contains_activated_user(
-    admin_client: TestClient, activated_user
+async def admin_client_contains_activated_user(
+    anyio_backend, admin_client: TestClient, activated_user
 ) -> TestClient:
     """Test client with a signed-in admin containing an activated user in the database."""
-    add_user_to_db(admin_client, activated_user)
+    await add_user_to_db(admin_client, activated_user)
     return admin_client
 
 
 @pytest.fixture
-def client_with_deactivated_user(client: TestClient, deactivated_user) -> TestClient:
+async def client_with_deactivated_user(
+    anyio_backend, client: TestClient, deactivated_user
+) -> TestClient:
     """Test client containing a deactivated user in the database."""
-    add_user_to_db(client, deactivated_user)
+    await add_user_to_db(client, deactivated_user)
     return client
@@ -0,0 +1,31 @@
+class TestFastAPIMetricsRoutes:
+    DATABASE_POOL_URL = "/admin/metrics/database-pool"
+    PASSWORD_HASHING_URL = "/admin/metrics/password-hashing"
+    USER_CACHE_URL = "/admin/metrics/user-cache"
+    WISHLIST_CACHE_URL = "/admin/metrics/wishlist-cache"
+
+    def test_get_database_pool_metrics(self, admin_client):
+        response = admin_client.get(self.DATABASE_POOL_URL)
+        assert response.status_code == 200
+        assert {"checked_out", "idle", "overflow", "max_wait_seconds"} <= set(
+            response.json()
+        )
+
+    def test_get_database_pool_metrics_not_admin(self, user_client):
+        response = user_client.get(self.DATABASE_POOL_URL)
+        assert response.status_code == 403
+
+    def test_get_password_hashing_metrics(self, admin_client):
+        response = admin_client.get(self.PASSWORD_HASHING_URL)
+        assert response.status_code == 200
+        assert {"verifications", "outdated_hashes", "rehashes"} <= set(response.json())
+
+    def test_get_user_cache_metrics(self, admin_client):
+        response = admin_client.get(self.USER_CACHE_URL)
+        assert response.status_code == 200
+        assert {"hits", "misses", "evictions", "hit_ratio"} <= set(response.json())
+
+    def test_get_wishlist_cache_metrics(self, admin_client):
+        response = admin_client.get(self.WISHLIST_CACHE_URL)
+        assert response.status_code == 200
+        assert {"hits", "misses", "evictions", "hit_ratio"} <= set(response.json())
@@ -0,0 +1,64 @@
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from src.infrastructure.entrypoints.fastapi.session_leak_detector import (
+    SessionLeakDetectorMiddleware,
+)
+
+LEAK_DETECTOR_LOGGER = "src.infrastructure.entrypoints.fastapi.session_leak_detector"
+
+
+def collect_started_sessions(client: TestClient, url: str) -> set[Session]:
+    sessions = set()
+
+    def on_begin(session, transaction, connection):
+        sessions.add(session)
+
+    event.listen(Session, "after_begin", on_begin)
+    try:
+        response = client.get(url)
+    finally:
+        event.remove(Session, "after_begin", on_begin)
+    assert response.status_code == 200
+    return sessions
+
+
+class TestFastAPIRequestSession:
+    def test_authenticated_query_uses_one_session(
+        self, user_with_populated_wishlist_client
+    ):
+        sessions = collect_started_sessions(
+            user_with_populated_wishlist_client, "/wishlists/"
+        )
+        assert len(sessions) == 1
+
+    def test_request_session_is_closed(
+        self, caplog, user_with_populated_wishlist_client
+    ):
+        with caplog.at_level(logging.WARNING, logger=LEAK_DETECTOR_LOGGER):
+            user_with_populated_wishlist_client.get("/wishlists/")
+        assert not caplog.records
+
+
+class TestSessionLeakDetectorMiddleware:
+    def test_leaked_session_is_logged(self, caplog, sqlite_session_factory):
+        app = FastAPI()
+        app.add_middleware(SessionLeakDetectorMiddleware)
+        leaked_sessions = []
+
+        @app.get("/leak")
+        async def leak():
+            session = sqlite_session_factory()
+            await session.execute(text("SELECT 1"))
+            leaked_sessions.append(session)
+
+        with caplog.at_level(logging.WARNING, logger=LEAK_DETECTOR_LOGGER):
+            TestClient(app).get("/leak")
+
+        assert "1 database session(s) still open at the end of GET /leak" in (
+            caplog.text
+        )
@@ -1,3 +1,11 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.infrastructure.dependencies import create_outbox_relay
+
+
 class TestFastAPIUsersAdminRoutes:
     ADMIN_PATH = "/admin/users"
     ACTIVATE = "activate"
@@ -39,15 +47,14 @@ class TestFastAPIUsersAdminRoutes:
 class TestFastAPIUsersAuthRoutes:
     AUTH_REGISTER_URL = "/auth/register"
     AUTH_LOGIN_URL = "/auth/login"
+    AUTH_REFRESH_URL = "/auth/refresh"
     AUTH_ACTIVATE_URL = "/auth/activate"
     AUTH_RESEND_ACTIVATION_URL = "/auth/resend-activation"
 
     @staticmethod
     def _create_code(client, user):
-        generator = client.app.state.messagebus.dependencies[
-            "activation_code_generator"
-        ]
-        storage = client.app.state.messagebus.dependencies["activation_code_storage"]
+        generator = client.app.state.dependencies["activation_code_generator"]
+        storage = client.app.state.dependencies["activation_code_storage"]
         code = generator.create_code()
         storage.save_activation_code(username=user.username, code=code)
         return code
@@ -61,10 +68,51 @@ class TestFastAPIUsersAuthRoutes:
         response = client.post(url=self.AUTH_REGISTER_URL, data=form_data)
         assert response.status_code == 200
 
+    @pytest.mark.anyio
+    async def test_register_defers_activation_email_to_outbox(
+        self, client, valid_password, capsys
+    ):
+        form_data = {
+            "username": "username",
+            "email": "email",
+            "password": valid_password,
+        }
+        response = client.post(url=self.AUTH_REGISTER_URL, data=form_data)
+        assert response.status_code == 200
+        assert "Fake notificator" not in capsys.readouterr().out
+
+        relay = create_outbox_relay(
+            client.app.state.dependencies, client.app.state.messagebus_factory
+        )
+        assert await relay.relay_batch() == 1
+        assert "Fake notificator" in capsys.readouterr().out
+
     def test_login(self, user_client, user, valid_password):
         form_data = {"username": user.username, "password": valid_password}
         response = user_client.post(url=self.AUTH_LOGIN_URL, data=form_data)
         assert response.status_code == 200
+        assert {"access_token", "refresh_token"} <= set(response.json())
+
+    def test_refresh(self, user_client, user, valid_password):
+        form_data = {"username": user.username, "password": valid_password}
+        login_response = user_client.post(url=self.AUTH_LOGIN_URL, data=form_data)
+
+        response = user_client.post(
+            url=self.AUTH_REFRESH_URL,
+            json={"refresh_token": login_response.json()["refresh_token"]},
+        )
+        assert response.status_code == 200
+        assert response.json()["access_token"]
+
+    def test_refresh_with_access_token(self, user_client, user, valid_password):
+        form_data = {"username": user.username, "password": valid_password}
+        login_response = user_client.post(url=self.AUTH_LOGIN_URL, data=form_data)
+
+        response = user_client.post(
+            url=self.AUTH_REFRESH_URL,
+            json={"refresh_token": login_response.json()["access_token"]},
+        )
+        assert response.status_code == 401
 
     def test_activate(self, client_with_deactivated_user, deactivated_user):
         code = self._create_code(
@@ -117,11 +165,136 @@ class TestFastAPIUsersQueryRoutes:
         assert response.status_code == 200
         assert response.json()["username"] == user.username
 
+    def test_get_me_with_fields(self, user_client, user):
+        response = user_client.get(
+            self.GET_CURRENT_USER_URL, params={"fields": "username,is_active"}
+        )
+        assert response.status_code == 200
+        assert response.json() == {"username": user.username, "is_active": True}
+
+    def test_get_me_etag_differs_per_fieldset(self, user_client):
+        full_etag = user_client.get(self.GET_CURRENT_USER_URL).headers["ETag"]
+
+        narrowed = user_client.get(
+            self.GET_CURRENT_USER_URL,
+            params={"fields": "email"},
+            headers={"If-None-Match": full_etag},
+        )
+
+        assert narrowed.status_code == 200
+        assert narrowed.headers["ETag"] != full_etag
+
+    def test_get_me_with_unknown_field(self, user_client):
+        response = user_client.get(
+            self.GET_CURRENT_USER_URL, params={"fields": "password_hash"}
+        )
+        assert response.status_code == 400
+
+    def test_get_me_not_modified(self, user_client):
+        etag = user_client.get(self.GET_CURRENT_USER_URL).headers["ETag"]
+
+        response = user_client.get(
+            self.GET_CURRENT_USER_URL, headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.headers["Cache-Control"] == "private, no-cache"
+
+    def test_get_me_modified_after_email_changed(self, user_client, user, new_email):
+        etag = user_client.get(self.GET_CURRENT_USER_URL).headers["ETag"]
+        body = {"username": user.username, "new_email": new_email}
+        user_client.patch("/users/me/email", json=body)
+
+        response = user_client.get(
+            self.GET_CURRENT_USER_URL, headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["email"] == new_email
+
+    def test_get_me_served_from_cache(self, user_client, user, executed_statements):
+        user_client.get(self.GET_CURRENT_USER_URL)
+        executed_statements.clear()
+
+        response = user_client.get(self.GET_CURRENT_USER_URL)
+        assert response.status_code == 200
+        assert response.json()["username"] == user.username
+        assert executed_statements == []
+
+    @pytest.mark.anyio
+    async def test_get_me_burst_loaded_once_in_own_session(
+        self, user_client, user, executed_statements
+    ):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=user_client.app),
+            base_url="http://test",
+            headers=user_client.headers,
+        ) as client:
+            responses = await asyncio.gather(
+                *(client.get(self.GET_CURRENT_USER_URL) for _ in range(20))
+            )
+
+        assert {response.status_code for response in responses} == {200}
+        assert {response.json()["username"] for response in responses} == {
+            user.username
+        }
+        assert len(executed_statements) == 1
+
     def test_get_users(self, user_client):
         response = user_client.get(self.GET_USERS_URL)
         assert response.status_code == 200
         assert len(response.json()) > 0
 
+    def test_paginate_users(self, client_with_users, user, admin_user):
+        response = client_with_users.get(self.GET_USERS_URL, params={"limit": 1})
+        assert response.status_code == 200
+        assert response.json() == [{"username": admin_user.username}]
+
+        response = client_with_users.get(response.links["next"]["url"])
+        assert response.status_code == 200
+        assert response.json() == [{"username": user.username}]
+        assert "next" not in response.links
+
+    def test_stream_users_as_ndjson(self, client_with_users, user, admin_user):
+        response = client_with_users.get(
+            self.GET_USERS_URL,
+            params={"limit": 1},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.text.splitlines() == [
+            f'{{"username":"{admin_user.username}"}}',
+            f'{{"username":"{user.username}"}}',
+        ]
+
+    def test_stream_users_as_json_array_after_cursor(
+        self, client_with_users, user, admin_user
+    ):
+        first_page = client_with_users.get(self.GET_USERS_URL, params={"limit": 1})
+
+        response = client_with_users.get(
+            first_page.links["next"]["url"] + "&stream=true"
+        )
+        assert response.status_code == 200
+        assert response.json() == [{"username": user.username}]
+
+    def test_get_users_with_invalid_cursor(self, client_with_user):
+        response = client_with_user.get(
+            self.GET_USERS_URL, params={"cursor": "not a cursor"}
+        )
+        assert response.status_code == 400
+
+    def test_stream_users_with_invalid_cursor(self, client_with_user):
+        response = client_with_user.get(
+            self.GET_USERS_URL, params={"stream": True, "cursor": "not a cursor"}
+        )
+        assert response.status_code == 400
+
+    def test_get_users_above_max_page_size(self, client_with_user):
+        response = client_with_user.get(self.GET_USERS_URL, params={"limit": 10_000})
+        assert response.status_code == 422
+
     def test_get_user(self, client_with_user, user):
         url = f"{self.GET_USERS_URL}/{user.username}"
         response = client_with_user.get(url)
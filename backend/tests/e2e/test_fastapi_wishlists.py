@@ -1,8 +1,21 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from src.config import settings
 from src.modules.wishlists.domain.model import MeasurementUnit, Priority
 
 GET_WISHLIST_URL = "/wishlists"
 GET_CURRENT_USER_WISHLISTS_URL = "/wishlists"
 GET_WISHLIST_BY_USERNAME_URL = "/wishlists/user"
+GET_ARCHIVED_WISHLISTS_URL = "/wishlists/archived"
+GET_CURRENT_USER_WISHLIST_SUMMARIES_URL = "/wishlists/summaries"
+BATCH_GET_WISHLISTS_URL = "/wishlists/batch-get"
 CREATE_WISHLIST_URL = "/wishlists/create"
 CHANGE_WISHLIST_NAME_PATH = "/wishlists/change-name/"
 ARCHIVE_WISHLIST_PATH = "/wishlists/archive/"
@@ -104,3 +117,582 @@ class TestFastAPIWishlistsQueryRoutes:
         response = client_with_populated_wishlist.get(url)
         assert response.status_code == 200
         assert response.json()[0]["name"] == populated_wishlist.name
+
+
+class TestFastAPIWishlistsSparseFieldsets:
+    def test_get_current_user_wishlists_with_fields(
+        self, user_with_populated_wishlists_client, executed_statements
+    ):
+        response = user_with_populated_wishlists_client.get(
+            GET_CURRENT_USER_WISHLISTS_URL,
+            params={"fields": "name,items.name,items.is_purchased"},
+        )
+
+        assert response.status_code == 200
+        for wishlist in response.json():
+            assert wishlist.keys() == {"name", "items"}
+            assert [item.keys() for item in wishlist["items"]] == [
+                {"name", "is_purchased"}
+            ] * 2
+        wishlists_statement, items_statement = executed_statements
+        assert "wishlists.is_archived," not in wishlists_statement
+        assert "wishlist_items.quantity" not in items_statement
+
+    def test_get_wishlists_without_items_skips_items_query(
+        self, user_with_populated_wishlists_client, user, executed_statements
+    ):
+        url = f"{GET_WISHLIST_BY_USERNAME_URL}/{user.username}"
+        response = user_with_populated_wishlists_client.get(
+            url, params={"fields": "uuid,name"}
+        )
+
+        assert response.status_code == 200
+        assert [wishlist.keys() for wishlist in response.json()] == [
+            {"uuid", "name"}
+        ] * 3
+        assert len(executed_statements) == 1
+
+    def test_paginate_wishlists_with_fields(self, user_with_populated_wishlists_client):
+        client = user_with_populated_wishlists_client
+        first_page = client.get(
+            GET_CURRENT_USER_WISHLISTS_URL, params={"limit": 2, "fields": "name"}
+        )
+
+        second_page = client.get(first_page.links["next"]["url"])
+
+        assert second_page.status_code == 200
+        assert second_page.json() == [{"name": "Wishlist 0"}]
+
+    def test_get_wishlist_with_fields(
+        self, client_with_populated_wishlist, populated_wishlist
+    ):
+        url = f"{GET_WISHLIST_URL}/{populated_wishlist.uuid}"
+        response = client_with_populated_wishlist.get(
+            url, params={"fields": "name,items.is_purchased"}
+        )
+
+        assert response.status_code == 200
+        wishlist = response.json()
+        assert wishlist.keys() == {"name", "items"}
+        assert sorted(item["is_purchased"] for item in wishlist["items"]) == [
+            False,
+            True,
+        ]
+
+    def test_stream_wishlists_with_fields(
+        self, user_with_populated_wishlists_client, user
+    ):
+        url = f"{GET_WISHLIST_BY_USERNAME_URL}/{user.username}"
+        response = user_with_populated_wishlists_client.get(
+            url, params={"stream": True, "fields": "created_at"}
+        )
+
+        assert response.status_code == 200
+        assert [wishlist.keys() for wishlist in response.json()] == [{"created_at"}] * 3
+
+    def test_wishlist_list_etag_differs_per_fieldset(
+        self, user_with_populated_wishlists_client
+    ):
+        client = user_with_populated_wishlists_client
+        full_etag = client.get(GET_CURRENT_USER_WISHLISTS_URL).headers["ETag"]
+        narrowed_etag = client.get(
+            GET_CURRENT_USER_WISHLISTS_URL, params={"fields": "name,created_at"}
+        ).headers["ETag"]
+
+        full = client.get(
+            GET_CURRENT_USER_WISHLISTS_URL, headers={"If-None-Match": narrowed_etag}
+        )
+        narrowed = client.get(
+            GET_CURRENT_USER_WISHLISTS_URL,
+            params={"fields": "name,created_at"},
+            headers={"If-None-Match": full_etag},
+        )
+        reordered = client.get(
+            GET_CURRENT_USER_WISHLISTS_URL,
+            params={"fields": "created_at,name"},
+            headers={"If-None-Match": narrowed_etag},
+        )
+
+        assert narrowed_etag != full_etag
+        assert full.status_code == 200
+        assert narrowed.status_code == 200
+        assert narrowed.headers["ETag"] == narrowed_etag
+        assert reordered.status_code == 304
+
+    def test_wishlist_etag_differs_per_fieldset(
+        self, client_with_populated_wishlist, populated_wishlist
+    ):
+        url = f"{GET_WISHLIST_URL}/{populated_wishlist.uuid}"
+        full_etag = client_with_populated_wishlist.get(url).headers["ETag"]
+
+        narrowed = client_with_populated_wishlist.get(
+            url, params={"fields": "name"}, headers={"If-None-Match": full_etag}
+        )
+        narrowed_again = client_with_populated_wishlist.get(
+            url,
+            params={"fields": "name"},
+            headers={"If-None-Match": narrowed.headers["ETag"]},
+        )
+
+        assert narrowed.status_code == 200
+        assert narrowed.headers["ETag"] != full_etag
+        assert narrowed_again.status_code == 304
+
+    def test_get_wishlists_with_unknown_field(
+        self, user_with_populated_wishlists_client
+    ):
+        response = user_with_populated_wishlists_client.get(
+            GET_CURRENT_USER_WISHLISTS_URL, params={"fields": "name,items.price"}
+        )
+
+        assert response.status_code == 400
+
+
+class TestFastAPIWishlistSummaries:
+    def test_get_current_user_wishlist_summaries(
+        self, user_with_populated_wishlists_client, populated_wishlists
+    ):
+        response = user_with_populated_wishlists_client.get(
+            GET_CURRENT_USER_WISHLIST_SUMMARIES_URL
+        )
+
+        assert response.status_code == 200
+        summaries = response.json()
+        assert len(summaries) == 3
+        assert {summary["uuid"] for summary in summaries} == {
+            str(wishlist.uuid)
+            for wishlist in populated_wishlists
+            if not wishlist.is_archived
+        }
+        assert all(
+            summary.keys()
+            == {"uuid", "name", "created_at", "item_count", "purchased_count"}
+            for summary in summaries
+        )
+        assert {summary["item_count"] for summary in summaries} == {2}
+
+    def test_get_wishlist_summaries_counts_purchased_items(
+        self, user_with_populated_wishlist_client, populated_wishlist, apple_item
+    ):
+        client = user_with_populated_wishlist_client
+        first_response = client.get(GET_CURRENT_USER_WISHLIST_SUMMARIES_URL)
+        assert first_response.json()[0]["purchased_count"] == 1
+        etag = first_response.headers["ETag"]
+        client.post(
+            f"{MARK_WISHLIST_ITEM_AS_PURCHASED}{populated_wishlist.uuid}",
+            json={"item_uuid": apple_item.uuid.hex},
+        )
+
+        response = client.get(
+            GET_CURRENT_USER_WISHLIST_SUMMARIES_URL, headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        (summary,) = response.json()
+        assert summary["item_count"] == 2
+        assert summary["purchased_count"] == 2
+
+    def test_get_wishlist_summaries_in_one_statement(
+        self, user_with_populated_wishlists_client, user, executed_statements
+    ):
+        url = f"{GET_WISHLIST_BY_USERNAME_URL}/{user.username}/summaries"
+        response = user_with_populated_wishlists_client.get(url)
+
+        assert response.status_code == 200
+        assert len(response.json()) == 3
+        assert len(executed_statements) == 1
+
+    def test_get_wishlist_summaries_not_modified(
+        self, user_with_populated_wishlists_client, user
+    ):
+        url = f"{GET_WISHLIST_BY_USERNAME_URL}/{user.username}/summaries"
+        etag = user_with_populated_wishlists_client.get(url).headers["ETag"]
+
+        response = user_with_populated_wishlists_client.get(
+            url, headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+
+    def test_paginate_wishlist_summaries(self, user_with_populated_wishlists_client):
+        client = user_with_populated_wishlists_client
+        full_list = client.get(GET_CURRENT_USER_WISHLISTS_URL).json()
+
+        first_page = client.get(
+            GET_CURRENT_USER_WISHLIST_SUMMARIES_URL, params={"limit": 2}
+        )
+        second_page = client.get(first_page.links["next"]["url"])
+
+        assert "next" not in second_page.links
+        assert [
+            summary["uuid"] for summary in first_page.json() + second_page.json()
+        ] == [wishlist["uuid"] for wishlist in full_list]
+
+
+class TestFastAPIWishlistsBatchGet:
+    def test_batch_get_wishlists_reports_missing_per_entry(
+        self, user_with_populated_wishlists_client, populated_wishlists
+    ):
+        missing_uuid = str(uuid4())
+        uuids = [
+            str(populated_wishlists[1].uuid),
+            missing_uuid,
+            str(populated_wishlists[0].uuid),
+        ]
+
+        response = user_with_populated_wishlists_client.post(
+            BATCH_GET_WISHLISTS_URL, json={"uuids": uuids}
+        )
+
+        assert response.status_code == 200
+        entries = response.json()
+        assert [entry["uuid"] for entry in entries] == uuids
+        assert entries[0]["wishlist"]["name"] == populated_wishlists[1].name
+        assert len(entries[2]["wishlist"]["items"]) == 2
+        assert entries[0]["error"] is None
+        assert entries[1] == {
+            "uuid": missing_uuid,
+            "wishlist": None,
+            "error": f"Wishlist '{missing_uuid}' not found",
+        }
+
+    def test_batch_get_wishlists_in_two_statements(
+        self,
+        user_with_populated_wishlists_client,
+        populated_wishlists,
+        executed_statements,
+    ):
+        uuids = [str(wishlist.uuid) for wishlist in populated_wishlists] * 2
+
+        response = user_with_populated_wishlists_client.post(
+            BATCH_GET_WISHLISTS_URL, json={"uuids": uuids}
+        )
+
+        assert response.status_code == 200
+        assert len(response.json()) == 8
+        assert len(executed_statements) == 2
+
+    @pytest.mark.parametrize("count", [0, settings.wishlist_batch_get_max_size + 1])
+    def test_batch_get_wishlists_size_limits(self, client, count):
+        response = client.post(
+            BATCH_GET_WISHLISTS_URL,
+            json={"uuids": [str(uuid4()) for _ in range(count)]},
+        )
+
+        assert response.status_code == 422
+
+
+class TestFastAPIWishlistsConditionalRequests:
+    def test_get_wishlist_not_modified(
+        self, client_with_populated_wishlist, populated_wishlist
+    ):
+        url = f"{GET_WISHLIST_URL}/{populated_wishlist.uuid}"
+        etag = client_with_populated_wishlist.get(url).headers["ETag"]
+
+        response = client_with_populated_wishlist.get(
+            url, headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+    def test_get_current_user_wishlists_not_modified_without_loading_items(
+        self, user_with_populated_wishlists_client, executed_statements
+    ):
+        client = user_with_populated_wishlists_client
+        etag = client.get(GET_CURRENT_USER_WISHLISTS_URL).headers["ETag"]
+        executed_statements.clear()
+
+        response = client.get(
+            GET_CURRENT_USER_WISHLISTS_URL, headers={"If-None-Match": f"W/{etag}"}
+        )
+
+        assert response.status_code == 304
+        assert len(executed_statements) == 1
+        assert "wishlist_items" not in executed_statements[0]
+
+    def test_get_current_user_wishlists_modified_after_item_added(
+        self, user_with_populated_wishlist_client, populated_wishlist
+    ):
+        client = user_with_populated_wishlist_client
+        etag = client.get(GET_CURRENT_USER_WISHLISTS_URL).headers["ETag"]
+        body = {
+            "name": "Pear",
+            "quantity": 1,
+            "measurement_unit": MeasurementUnit.PIECE,
+            "priority": Priority.MEDIUM,
+        }
+        client.post(f"{ADD_WISHLIST_ITEM_PATH}{populated_wishlist.uuid}", json=body)
+
+        response = client.get(
+            GET_CURRENT_USER_WISHLISTS_URL, headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert len(response.json()[0]["items"]) == 3
+
+    def test_get_wishlist_modified_after_item_added(
+        self, user_with_populated_wishlist_client, populated_wishlist
+    ):
+        client = user_with_populated_wishlist_client
+        url = f"{GET_WISHLIST_URL}/{populated_wishlist.uuid}"
+        etag = client.get(url).headers["ETag"]
+        body = {
+            "name": "Pear",
+            "quantity": 1,
+            "measurement_unit": MeasurementUnit.PIECE,
+            "priority": Priority.MEDIUM,
+        }
+        client.post(f"{ADD_WISHLIST_ITEM_PATH}{populated_wishlist.uuid}", json=body)
+
+        # No outbox relay runs here, the command invalidated the cached wishlist
+        response = client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert len(response.json()["items"]) == 3
+
+    def test_get_wishlists_by_user_etag_differs_between_pages(
+        self, user_with_populated_wishlists_client, user
+    ):
+        url = f"{GET_WISHLIST_BY_USERNAME_URL}/{user.username}"
+        client = user_with_populated_wishlists_client
+        first_page = client.get(url, params={"limit": 1})
+
+        second_page = client.get(
+            first_page.links["next"]["url"],
+            headers={"If-None-Match": first_page.headers["ETag"]},
+        )
+
+        assert second_page.status_code == 200
+        assert second_page.headers["ETag"] != first_page.headers["ETag"]
+
+
+class TestFastAPIWishlistsPagination:
+    def test_paginate_current_user_wishlists(
+        self, user_with_populated_wishlists_client, populated_wishlists
+    ):
+        client = user_with_populated_wishlists_client
+        response = client.get(GET_CURRENT_USER_WISHLISTS_URL, params={"limit": 2})
+        assert response.status_code == 200
+        first_page = [wishlist["uuid"] for wishlist in response.json()]
+        assert len(first_page) == 2
+
+        response = client.get(response.links["next"]["url"])
+        assert response.status_code == 200
+        second_page = [wishlist["uuid"] for wishlist in response.json()]
+        assert "next" not in response.links
+
+        active_wishlists = sorted(
+            (wishlist for wishlist in populated_wishlists if not wishlist.is_archived),
+            key=lambda wishlist: (wishlist.created_at, wishlist.uuid),
+            reverse=True,
+        )
+        assert first_page + second_page == [
+            str(wishlist.uuid) for wishlist in active_wishlists
+        ]
+
+    def test_paginate_wishlists_by_user(
+        self, user_with_populated_wishlists_client, user
+    ):
+        url = f"{GET_WISHLIST_BY_USERNAME_URL}/{user.username}"
+        uuids = []
+        while url:
+            response = user_with_populated_wishlists_client.get(
+                url, params={"limit": 1} if not uuids else None
+            )
+            assert response.status_code == 200
+            uuids += [wishlist["uuid"] for wishlist in response.json()]
+            url = response.links.get("next", {}).get("url")
+
+        assert len(uuids) == len(set(uuids)) == 3
+
+    def test_get_archived_wishlists_with_invalid_cursor(
+        self, user_with_populated_wishlists_client
+    ):
+        response = user_with_populated_wishlists_client.get(
+            GET_ARCHIVED_WISHLISTS_URL, params={"cursor": "bm90IGpzb24"}
+        )
+        assert response.status_code == 400
+
+
+class TestFastAPIWishlistsQueryStatements:
+    """Items are loaded in one batch, so statement counts don't grow with wishlists."""
+
+    def test_get_wishlist(
+        self,
+        user_with_populated_wishlists_client,
+        populated_wishlists,
+        executed_statements,
+    ):
+        url = f"{GET_WISHLIST_URL}/{populated_wishlists[0].uuid}"
+        response = user_with_populated_wishlists_client.get(url)
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == 2
+        assert len(executed_statements) == 2
+
+    def test_get_cached_wishlist(
+        self,
+        user_with_populated_wishlists_client,
+        populated_wishlists,
+        executed_statements,
+    ):
+        url = f"{GET_WISHLIST_URL}/{populated_wishlists[0].uuid}"
+        first_response = user_with_populated_wishlists_client.get(url)
+        executed_statements.clear()
+
+        response = user_with_populated_wishlists_client.get(url)
+
+        assert response.status_code == 200
+        assert response.json() == first_response.json()
+        assert executed_statements == []
+
+    @pytest.mark.anyio
+    async def test_get_wishlist_burst_loaded_once(
+        self,
+        user_with_populated_wishlists_client,
+        populated_wishlists,
+        executed_statements,
+    ):
+        app = user_with_populated_wishlists_client.app
+        url = f"{GET_WISHLIST_URL}/{populated_wishlists[0].uuid}"
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            responses = await asyncio.gather(*(client.get(url) for _ in range(20)))
+
+        assert {response.status_code for response in responses} == {200}
+        assert len(executed_statements) == 2
+
+    def test_get_current_user_wishlists(
+        self, user_with_populated_wishlists_client, executed_statements
+    ):
+        response = user_with_populated_wishlists_client.get(
+            GET_CURRENT_USER_WISHLISTS_URL
+        )
+        assert response.status_code == 200
+        assert len(response.json()) == 3
+        assert len(executed_statements) == 2
+        assert not any("FROM users" in statement for statement in executed_statements)
+
+    def test_get_archived_wishlists(
+        self, user_with_populated_wishlists_client, executed_statements
+    ):
+        response = user_with_populated_wishlists_client.get(GET_ARCHIVED_WISHLISTS_URL)
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        assert len(executed_statements) == 2
+
+    def test_get_wishlists_by_user(
+        self, user_with_populated_wishlists_client, user, executed_statements
+    ):
+        url = f"{GET_WISHLIST_BY_USERNAME_URL}/{user.username}"
+        response = user_with_populated_wishlists_client.get(url)
+        assert response.status_code == 200
+        assert all(len(wishlist["items"]) == 2 for wishlist in response.json())
+        assert len(executed_statements) == 2
+
+
+class TestFastAPIWishlistsStreaming:
+    def test_stream_wishlists_by_user_as_ndjson(
+        self, user_with_populated_wishlists_client, user
+    ):
+        url = f"{GET_WISHLIST_BY_USERNAME_URL}/{user.username}"
+        paged = user_with_populated_wishlists_client.get(url).json()
+
+        response = user_with_populated_wishlists_client.get(
+            url, headers={"Accept": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line) for line in response.text.splitlines()] == paged
+
+    def test_stream_wishlists_by_user_as_json_array(
+        self, user_with_populated_wishlists_client, user
+    ):
+        url = f"{GET_WISHLIST_BY_USERNAME_URL}/{user.username}"
+        paged = user_with_populated_wishlists_client.get(url).json()
+
+        response = user_with_populated_wishlists_client.get(
+            url, params={"stream": True}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == paged
+        assert "ETag" not in response.headers
+
+    def test_stream_wishlists_by_user_ignores_page_size(
+        self, user_with_populated_wishlists_client, user
+    ):
+        url = f"{GET_WISHLIST_BY_USERNAME_URL}/{user.username}"
+        response = user_with_populated_wishlists_client.get(
+            url, params={"stream": True, "limit": 1}
+        )
+
+        assert len(response.json()) == 3
+        assert "next" not in response.links
+
+    def test_stream_wishlists_by_user_loads_items_per_batch(
+        self, user_with_populated_wishlists_client, user, executed_statements
+    ):
+        url = f"{GET_WISHLIST_BY_USERNAME_URL}/{user.username}"
+        with patch.object(settings, "pagination_stream_batch_size", 2):
+            response = user_with_populated_wishlists_client.get(
+                url, params={"stream": True}
+            )
+
+        assert all(len(wishlist["items"]) == 2 for wishlist in response.json())
+        # One wishlist query and an items query for each of the two batches
+        assert len(executed_statements) == 3
+
+    def test_stream_wishlists_by_user_with_invalid_cursor(
+        self, user_with_populated_wishlists_client, user
+    ):
+        url = f"{GET_WISHLIST_BY_USERNAME_URL}/{user.username}"
+
+        response = user_with_populated_wishlists_client.get(
+            url,
+            params={"cursor": "bm90IGpzb24"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 400
+
+    def test_stream_wishlists_by_unknown_user(self, client):
+        response = client.get(
+            f"{GET_WISHLIST_BY_USERNAME_URL}/unknown", params={"stream": True}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+
+class TestFastAPIWishlistsConcurrentCommands:
+    REQUESTS = 40
+    THREADS = 10
+
+    def test_concurrent_add_wishlist_items(
+        self, concurrent_user_with_populated_wishlist_client, populated_wishlist
+    ):
+        client = concurrent_user_with_populated_wishlist_client
+        url = f"{ADD_WISHLIST_ITEM_PATH}{populated_wishlist.uuid}"
+
+        def add_item(number: int) -> int:
+            body = {
+                "name": f"item {number}",
+                "quantity": 1,
+                "measurement_unit": MeasurementUnit.PIECE,
+                "priority": Priority.MEDIUM,
+            }
+            return client.post(url=url, json=body).status_code
+
+        with ThreadPoolExecutor(max_workers=self.THREADS) as executor:
+            status_codes = list(executor.map(add_item, range(self.REQUESTS)))
+
+        assert status_codes == [200] * self.REQUESTS
+        response = client.get(f"{GET_WISHLIST_URL}/{populated_wishlist.uuid}")
+        assert len(response.json()["items"]) == self.REQUESTS + 2
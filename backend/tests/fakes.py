@@ -5,7 +5,7 @@ from src.modules.users.infrastructure.user_repository import UserRepository
 from src.modules.wishlists.domain.model import Wishlist
 from src.modules.wishlists.infrastructure.wishlist_repository import WishlistRepository
 from src.shared.application.exceptions import UserNotFound, WishlistNotFound
-from src.shared.application.uow import UnitOfWork
+from src.shared.application.uow import AsyncUnitOfWork
 from src.shared.ports.activation_code_storage import ActivationCodeStorage
 from src.shared.utils.notifications.notificator import Notificator
 
@@ -15,7 +15,7 @@ class FakeUserRepository(UserRepository):
         super().__init__()
         self._users = users
 
-    def _get(self, username: str) -> User:
+    async def _get(self, username: str) -> User:
         try:
             user = next(user for user in self._users if user.username == username)
         except StopIteration:
@@ -31,39 +31,47 @@ class FakeWishlistRepository(WishlistRepository):
         super().__init__()
         self._wishlists = wishlists
 
-    def _get(self, uuid: UUID) -> Wishlist:
+    async def _get(self, uuid: UUID) -> Wishlist:
         try:
             wishlist = next(wl for wl in self._wishlists if wl.uuid == uuid)
         except StopIteration:
             raise WishlistNotFound(uuid=uuid)
         return wishlist
 
-    def _list_all(self) -> list[Wishlist]:
+    async def _list_all(self) -> list[Wishlist]:
         return list(self._wishlists)
 
-    def _list_owned_by(self, username: str) -> list[Wishlist]:
+    async def _list_owned_by(self, username: str) -> list[Wishlist]:
         return list(wl for wl in self._wishlists if wl.owner_username == username)
 
     def _add(self, wishlist: Wishlist):
         self._wishlists.add(wishlist)
 
 
-class FakeUnitOfWork(UnitOfWork):
-    def __init__(self):
-        super().__init__()
+class FakeUnitOfWork(AsyncUnitOfWork):
+    def __init__(self, read_only: bool = False):
+        super().__init__(read_only=read_only)
         self.user_repository = FakeUserRepository(users=set())
         self.wishlist_repository = FakeWishlistRepository(set())
         self.committed = False
 
-    def _commit(self):
+    def as_read_only(self) -> "FakeUnitOfWork":
+        uow = FakeUnitOfWork(read_only=True)
+        uow.user_repository = self.user_repository
+        uow.wishlist_repository = self.wishlist_repository
+        return uow
+
+    async def _commit(self):
         self.committed = True
 
-    def _rollback(self):
+    async def _rollback(self):
         pass
 
 
 class FakeNotificator(Notificator):
-    def send_notification(self, recipient: "User", subject: str, message: str) -> None:
+    async def send_notification(
+        self, recipient: "User", subject: str, message: str
+    ) -> None:
         print(
             f"Fake notificator: {recipient.username} ({recipient.email}), {subject}, {message}"
         )
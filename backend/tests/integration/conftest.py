@@ -1,9 +1,19 @@
+import socket
+from typing import Iterator
+
 import fakeredis
 import pytest
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
 
 from src.infrastructure.cache.redis.activation_code_storage import (
     RedisActivationCodeStorage,
 )
+from src.infrastructure.cache.redis.email_queue import RedisEmailQueue
+from src.shared.utils.notifications.email_sender import create_smtp_connection_factory
+
+SMTP_USERNAME = "mailer"
+SMTP_PASSWORD = "mailer-password"
 
 
 @pytest.fixture(scope="session")
@@ -18,3 +28,61 @@ def redis_activation_code_storage(
 ) -> RedisActivationCodeStorage:
     """Create a RedisActivationCodeStorage instance using the FakeRedis client."""
     return RedisActivationCodeStorage(redis_client)
+
+
+@pytest.fixture
+def redis_email_queue() -> RedisEmailQueue:
+    """Create a RedisEmailQueue instance using a clean FakeRedis client."""
+    return RedisEmailQueue(fakeredis.FakeRedis())
+
+
+class RecordingSMTPHandler:
+    """aiosmtpd handler keeping received envelopes and the sessions they came from."""
+
+    def __init__(self):
+        self.envelopes = []
+        self.sessions = set()
+
+    async def handle_DATA(self, server, session, envelope):
+        self.envelopes.append(envelope)
+        self.sessions.add(session)
+        return "250 Message accepted for delivery"
+
+
+def authenticate_smtp_user(server, session, envelope, mechanism, auth_data):
+    return AuthResult(
+        success=auth_data.login == SMTP_USERNAME.encode()
+        and auth_data.password == SMTP_PASSWORD.encode(),
+        handled=False,
+    )
+
+
+@pytest.fixture
+def smtp_server() -> Iterator[Controller]:
+    """Run a local aiosmtpd server requiring authentication."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    controller = Controller(
+        RecordingSMTPHandler(),
+        hostname="127.0.0.1",
+        port=port,
+        authenticator=authenticate_smtp_user,
+        auth_require_tls=False,
+    )
+    controller.start()
+    yield controller
+    controller.stop()
+
+
+@pytest.fixture
+def smtp_connection_factory(smtp_server: Controller):
+    return create_smtp_connection_factory(
+        host=smtp_server.hostname,
+        port=smtp_server.port,
+        username=SMTP_USERNAME,
+        password=SMTP_PASSWORD,
+        use_tls=False,
+        use_ssl=False,
+    )
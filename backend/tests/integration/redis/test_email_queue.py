@@ -0,0 +1,70 @@
+from src.shared.ports.email_queue import EmailMessage
+from src.shared.utils.notifications.notificator import EmailNotificator
+
+
+def make_message(number: int = 0) -> EmailMessage:
+    return EmailMessage(
+        recipient=f"user{number}@example.com", subject="Subject", body="Body"
+    )
+
+
+class TestRedisEmailQueue:
+    def test_claim_in_enqueue_order(self, redis_email_queue):
+        messages = [make_message(number) for number in range(3)]
+        for message in messages:
+            redis_email_queue.enqueue(message)
+
+        assert redis_email_queue.claim(2) == messages[:2]
+        assert redis_email_queue.claim(2) == messages[2:]
+        assert redis_email_queue.claim(2) == []
+
+    def test_ack_removes_claimed_messages(self, redis_email_queue):
+        redis_email_queue.enqueue(make_message())
+        claimed = redis_email_queue.claim(1)
+
+        redis_email_queue.ack(claimed)
+
+        assert redis_email_queue.requeue_unacknowledged() == 0
+
+    def test_requeue_unacknowledged(self, redis_email_queue):
+        messages = [make_message(number) for number in range(2)]
+        for message in messages:
+            redis_email_queue.enqueue(message)
+        redis_email_queue.claim(2)
+
+        assert redis_email_queue.requeue_unacknowledged() == 2
+        assert redis_email_queue.claim(2) == messages
+
+    def test_retry_is_delayed(self, redis_email_queue):
+        message = make_message()
+        redis_email_queue.enqueue(message)
+        redis_email_queue.claim(1)
+
+        redis_email_queue.retry(message, delay=60)
+
+        assert redis_email_queue.claim(1) == []
+        assert redis_email_queue.requeue_unacknowledged() == 0
+
+    def test_due_retry_is_claimed_with_next_attempt(self, redis_email_queue):
+        message = make_message()
+        redis_email_queue.enqueue(message)
+        redis_email_queue.claim(1)
+
+        redis_email_queue.retry(message, delay=0)
+
+        assert redis_email_queue.claim(1) == [message.next_attempt()]
+
+
+class TestEmailNotificator:
+    async def test_send_notification_only_enqueues(
+        self, anyio_backend, redis_email_queue, user
+    ):
+        notificator = EmailNotificator(email_queue=redis_email_queue)
+
+        await notificator.send_activation_code(
+            recipient=user, activation_code="12345678"
+        )
+
+        [message] = redis_email_queue.claim(1)
+        assert message.recipient == user.email
+        assert "12345678" in message.body
@@ -0,0 +1,269 @@
+import asyncio
+from uuid import uuid4
+
+import fakeredis
+import pytest
+
+from src.infrastructure.cache.two_tier_cache import INVALIDATION_CHANNEL, TwoTierCache
+
+pytestmark = pytest.mark.anyio
+
+NAMESPACE = "wishlist"
+PAYLOAD = '{"name": "Groceries"}'
+
+
+class CountingLoader:
+    def __init__(self, delay: float = 0.05, error: Exception | None = None):
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return PAYLOAD
+
+
+@pytest.fixture
+def redis_server() -> fakeredis.FakeServer:
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def redis_async_client(redis_server) -> fakeredis.FakeAsyncRedis:
+    return fakeredis.FakeAsyncRedis(server=redis_server)
+
+
+async def wait_until(condition, timeout: float = 1.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not await condition():
+            await asyncio.sleep(0.01)
+
+
+class TestTwoTierCache:
+    async def test_read_through(self, redis_async_client):
+        cache = TwoTierCache(NAMESPACE, redis_async_client, ttl=60)
+        key = str(uuid4())
+
+        assert await cache.get(key) is None
+        await cache.set(key, PAYLOAD)
+
+        assert await cache.get(key) == PAYLOAD
+        assert 0 < await redis_async_client.ttl(f"cache:{NAMESPACE}:{key}") <= 60
+        snapshot = cache.snapshot()
+        assert (snapshot["hits"], snapshot["misses"]) == (1, 1)
+        assert snapshot["hit_ratio"] == 0.5
+
+    async def test_redis_hit_fills_local_cache(self, redis_async_client):
+        writer = TwoTierCache(NAMESPACE, redis_async_client)
+        reader = TwoTierCache(NAMESPACE, redis_async_client)
+        key = str(uuid4())
+        await writer.set(key, PAYLOAD)
+
+        assert await reader.get(key) == PAYLOAD
+        assert await reader.get(key) == PAYLOAD
+
+        snapshot = reader.snapshot()
+        assert (snapshot["redis_hits"], snapshot["local_hits"]) == (1, 1)
+
+    async def test_namespaces_are_separate(self, redis_async_client):
+        key = str(uuid4())
+        await TwoTierCache("user", redis_async_client).set(key, PAYLOAD)
+
+        assert await TwoTierCache(NAMESPACE, redis_async_client).get(key) is None
+
+    async def test_invalidate(self, redis_async_client):
+        cache = TwoTierCache(NAMESPACE, redis_async_client)
+        key = str(uuid4())
+        await cache.set(key, PAYLOAD)
+
+        await cache.invalidate(key)
+
+        assert await cache.get(key) is None
+        assert cache.snapshot()["invalidations"] == 1
+
+    async def test_oversized_payload_not_cached(self, redis_async_client):
+        cache = TwoTierCache(
+            NAMESPACE, redis_async_client, max_entry_bytes=len(PAYLOAD) - 1
+        )
+        key = str(uuid4())
+
+        await cache.set(key, PAYLOAD)
+
+        assert await cache.get(key) is None
+        assert cache.snapshot()["skipped_oversized"] == 1
+
+    async def test_oversized_payload_measured_in_bytes(self, redis_async_client):
+        payload = '{"name": "Подарки"}'
+        cache = TwoTierCache(
+            NAMESPACE, redis_async_client, max_entry_bytes=len(payload.encode()) - 1
+        )
+        key = str(uuid4())
+
+        await cache.set(key, payload)
+
+        assert len(payload) <= cache.max_entry_bytes
+        assert await cache.get(key) is None
+        assert cache.snapshot()["skipped_oversized"] == 1
+
+    async def test_multibyte_payload_round_trips(self, redis_async_client):
+        payload = '{"name": "Подарки 🎁"}'
+        writer = TwoTierCache(NAMESPACE, redis_async_client)
+        reader = TwoTierCache(NAMESPACE, redis_async_client)
+        key = str(uuid4())
+
+        await writer.set(key, payload)
+
+        assert await reader.get(key) == payload
+
+    async def test_oldest_entries_evicted_above_max_entries(self, redis_async_client):
+        cache = TwoTierCache(NAMESPACE, redis_async_client, max_entries=2)
+        keys = [str(uuid4()) for _ in range(3)]
+
+        for key in keys:
+            await cache.set(key, PAYLOAD)
+
+        assert await cache.get(keys[0]) is None
+        assert await cache.get(keys[1]) == PAYLOAD
+        assert await cache.get(keys[2]) == PAYLOAD
+        assert cache.snapshot()["evictions"] == 1
+
+    async def test_unavailable_redis_served_from_local_cache(self, redis_server):
+        redis_server.connected = False
+        cache = TwoTierCache(NAMESPACE, fakeredis.FakeAsyncRedis(server=redis_server))
+        key = str(uuid4())
+
+        assert await cache.get(key) is None
+        await cache.set(key, PAYLOAD)
+
+        assert await cache.get(key) == PAYLOAD
+        assert cache.snapshot()["errors"] == 2
+
+
+class TestTwoTierCacheInvalidationDuringLoad:
+    async def test_value_loaded_before_invalidation_not_stored(
+        self, redis_async_client
+    ):
+        loader = TwoTierCache(NAMESPACE, redis_async_client)
+        writer = TwoTierCache(NAMESPACE, redis_async_client)
+        key = str(uuid4())
+
+        async def load_then_get_invalidated() -> str:
+            # Another process commits a change and invalidates while this one loads
+            await writer.invalidate(key)
+            return PAYLOAD
+
+        assert await loader.get_or_load(key, load_then_get_invalidated) == PAYLOAD
+
+        assert await redis_async_client.get(f"cache:{NAMESPACE}:{key}") is None
+        assert await loader.get(key) is None
+        assert loader.snapshot()["stale_loads"] == 1
+
+    async def test_value_loaded_after_invalidation_stored(self, redis_async_client):
+        cache = TwoTierCache(NAMESPACE, redis_async_client)
+        key = str(uuid4())
+        await cache.invalidate(key)
+
+        assert await cache.get_or_load(key, CountingLoader()) == PAYLOAD
+
+        assert await redis_async_client.get(f"cache:{NAMESPACE}:{key}") is not None
+        assert cache.snapshot()["stale_loads"] == 0
+
+
+class TestTwoTierCacheInvalidationMessages:
+    async def test_invalidation_drops_local_entries_in_other_processes(
+        self, redis_server
+    ):
+        # Separate clients and caches stand in for processes sharing one Redis
+        writer = TwoTierCache(NAMESPACE, fakeredis.FakeAsyncRedis(server=redis_server))
+        reader = TwoTierCache(NAMESPACE, fakeredis.FakeAsyncRedis(server=redis_server))
+        listener = asyncio.create_task(reader.listen_for_invalidations())
+        key = str(uuid4())
+
+        async def subscribed() -> bool:
+            channels = await writer.redis_client.pubsub_numsub(INVALIDATION_CHANNEL)
+            return channels[0][1] == 1
+
+        try:
+            await wait_until(subscribed)
+            await writer.set(key, PAYLOAD)
+            assert await reader.get(key) == PAYLOAD
+
+            await writer.invalidate(key)
+
+            async def dropped() -> bool:
+                return len(reader.local_cache) == 0
+
+            await wait_until(dropped)
+            assert await reader.get(key) is None
+        finally:
+            listener.cancel()
+
+    async def test_other_namespaces_ignored(self, redis_async_client):
+        cache = TwoTierCache(NAMESPACE, redis_async_client)
+        key = str(uuid4())
+        await cache.set(key, PAYLOAD)
+
+        cache._handle_invalidation(f"user:{key}")
+
+        assert len(cache.local_cache) == 1
+
+
+class TestTwoTierCacheCoalescing:
+    async def test_concurrent_misses_load_once(self, redis_async_client):
+        cache = TwoTierCache(NAMESPACE, redis_async_client)
+        load = CountingLoader()
+        key = str(uuid4())
+
+        payloads = await asyncio.gather(
+            *(cache.get_or_load(key, load) for _ in range(10))
+        )
+
+        assert payloads == [PAYLOAD] * 10
+        assert load.calls == 1
+        assert await cache.get(key) == PAYLOAD
+
+    async def test_concurrent_misses_without_coalescing(self, redis_async_client):
+        cache = TwoTierCache(NAMESPACE, redis_async_client, coalesce=False)
+        load = CountingLoader()
+        key = str(uuid4())
+
+        await asyncio.gather(*(cache.get_or_load(key, load) for _ in range(10)))
+
+        assert load.calls == 10
+
+    async def test_processes_wait_for_lock_holder(self, redis_async_client):
+        caches = [
+            TwoTierCache(NAMESPACE, redis_async_client, lock_timeout=1.0)
+            for _ in range(3)
+        ]
+        load = CountingLoader()
+        key = str(uuid4())
+
+        payloads = await asyncio.gather(
+            *(cache.get_or_load(key, load) for cache in caches)
+        )
+
+        assert payloads == [PAYLOAD] * 3
+        assert load.calls == 1
+        assert sum(cache.lock_waits for cache in caches) == 2
+        assert await redis_async_client.exists(f"cache_lock:{NAMESPACE}:{key}") == 0
+
+    async def test_waiters_load_when_lock_holder_fails(self, redis_async_client):
+        holder = TwoTierCache(NAMESPACE, redis_async_client, lock_timeout=1.0)
+        waiter = TwoTierCache(NAMESPACE, redis_async_client, lock_timeout=1.0)
+        failing_load = CountingLoader(error=LookupError("missing"))
+        load = CountingLoader()
+        key = str(uuid4())
+
+        results = await asyncio.gather(
+            holder.get_or_load(key, failing_load),
+            waiter.get_or_load(key, load),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[0], LookupError)
+        assert results[1] == PAYLOAD
+        assert waiter.lock_timeouts == 0
@@ -0,0 +1,122 @@
+import smtplib
+
+import pytest
+
+from src.shared.ports.email_queue import EmailMessage
+from src.shared.utils.notifications.email_sender import (
+    EmailSender,
+    create_smtp_connection_factory,
+)
+from tests.integration.conftest import SMTP_USERNAME
+
+pytestmark = pytest.mark.anyio
+
+
+def enqueue_messages(email_queue, count: int) -> list[EmailMessage]:
+    messages = [
+        EmailMessage(
+            recipient=f"user{number}@example.com",
+            subject=f"Subject {number}",
+            body=f"Body {number}",
+        )
+        for number in range(count)
+    ]
+    for message in messages:
+        email_queue.enqueue(message)
+    return messages
+
+
+@pytest.fixture
+def email_sender(redis_email_queue, smtp_connection_factory):
+    sender = EmailSender(
+        email_queue=redis_email_queue,
+        connection_factory=smtp_connection_factory,
+        sender_address="admin@example.com",
+        pool_size=2,
+        batch_size=10,
+        max_attempts=2,
+        retry_base_delay=0,
+    )
+    yield sender
+    sender.close()
+
+
+class TestEmailSender:
+    async def test_send_batch_delivers_messages(
+        self, anyio_backend, email_sender, redis_email_queue, smtp_server
+    ):
+        messages = enqueue_messages(redis_email_queue, 4)
+
+        assert await email_sender.send_batch() == 4
+
+        envelopes = smtp_server.handler.envelopes
+        assert sorted(envelope.rcpt_tos[0] for envelope in envelopes) == sorted(
+            message.recipient for message in messages
+        )
+        assert all(envelope.mail_from == "admin@example.com" for envelope in envelopes)
+        assert redis_email_queue.requeue_unacknowledged() == 0
+
+    async def test_connections_are_reused_between_batches(
+        self, anyio_backend, email_sender, redis_email_queue, smtp_server
+    ):
+        enqueue_messages(redis_email_queue, 4)
+        await email_sender.send_batch()
+        enqueue_messages(redis_email_queue, 4)
+        await email_sender.send_batch()
+
+        assert len(smtp_server.handler.envelopes) == 8
+        assert len(smtp_server.handler.sessions) == 2
+
+    async def test_reconnects_after_server_disconnect(
+        self, anyio_backend, email_sender, redis_email_queue, smtp_server
+    ):
+        enqueue_messages(redis_email_queue, 1)
+        await email_sender.send_batch()
+        email_sender._connections[0].close()
+
+        enqueue_messages(redis_email_queue, 1)
+        await email_sender.send_batch()
+
+        assert len(smtp_server.handler.envelopes) == 2
+
+    async def test_failed_messages_are_retried_then_dropped(
+        self, anyio_backend, redis_email_queue, smtp_server
+    ):
+        sender = EmailSender(
+            email_queue=redis_email_queue,
+            connection_factory=create_smtp_connection_factory(
+                host=smtp_server.hostname,
+                port=smtp_server.port,
+                username=SMTP_USERNAME,
+                password="wrong-password",
+                use_tls=False,
+                use_ssl=False,
+            ),
+            sender_address="admin@example.com",
+            max_attempts=2,
+            retry_base_delay=0,
+        )
+        [message] = enqueue_messages(redis_email_queue, 1)
+
+        await sender.send_batch()
+        assert redis_email_queue.claim(1) == [message.next_attempt()]
+        redis_email_queue.requeue_unacknowledged()
+
+        await sender.send_batch()
+        assert redis_email_queue.claim(1) == []
+        assert redis_email_queue.requeue_unacknowledged() == 0
+        assert smtp_server.handler.envelopes == []
+
+
+class TestSMTPConnectionFactory:
+    def test_wrong_credentials_are_rejected(self, smtp_server):
+        connect = create_smtp_connection_factory(
+            host=smtp_server.hostname,
+            port=smtp_server.port,
+            username=SMTP_USERNAME,
+            password="wrong-password",
+            use_tls=False,
+            use_ssl=False,
+        )
+        with pytest.raises(smtplib.SMTPAuthenticationError):
+            connect()
@@ -0,0 +1,173 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from src.infrastructure.database.sqlalchemy.outbox import OutboxMessage, OutboxRelay
+from src.infrastructure.database.sqlalchemy.unit_of_work import (
+    SQLAlchemyAsyncUnitOfWork,
+)
+from src.modules.users.domain.events import UserCreated
+from src.modules.wishlists.domain.events import WishlistCreated
+from src.shared.application.messagebus import AsyncMessagebus
+from tests.fakes import FakeUnitOfWork
+
+pytestmark = pytest.mark.anyio
+
+EVENT_TYPES = {"UserCreated": UserCreated, "WishlistCreated": WishlistCreated}
+
+
+async def count_outbox_messages(session_factory) -> int:
+    async with session_factory() as session:
+        return await session.scalar(select(func.count()).select_from(OutboxMessage))
+
+
+def create_relay(
+    session_factory,
+    handled_events: list,
+    fail: type[BaseException] | None = None,
+    max_attempts: int = 3,
+):
+    async def handle_event(event):
+        if fail:
+            raise fail("event handler failed")
+        handled_events.append(event)
+
+    def messagebus_factory():
+        return AsyncMessagebus(
+            uow=FakeUnitOfWork(),
+            command_handlers={},
+            event_handlers={
+                event_type: [handle_event] for event_type in EVENT_TYPES.values()
+            },
+            dependencies={},
+        )
+
+    return OutboxRelay(
+        session_factory=session_factory,
+        messagebus_factory=messagebus_factory,
+        event_types=EVENT_TYPES,
+        batch_size=10,
+        max_attempts=max_attempts,
+    )
+
+
+class TestOutboxMessage:
+    def test_event_round_trip(self):
+        event = WishlistCreated(uuid=uuid4(), name="Birthday")
+
+        message = OutboxMessage.from_event(event)
+
+        assert message.event_type == "WishlistCreated"
+        assert message.to_event(EVENT_TYPES) == event
+
+
+class TestSQLAlchemyUnitOfWorkOutbox:
+    async def test_commit_stores_events(self, sqlalchemy_uow, sqlite_session, user):
+        async with sqlalchemy_uow:
+            sqlalchemy_uow.user_repository.add(user)
+            await sqlalchemy_uow.commit()
+
+        messages = (await sqlite_session.scalars(select(OutboxMessage))).all()
+        assert [message.to_event(EVENT_TYPES) for message in messages] == [
+            UserCreated(username=user.username, email=user.email)
+        ]
+        assert list(sqlalchemy_uow.collect_new_events()) == []
+
+    async def test_commit_stores_events_in_postgres(
+        self, postgres_session_factory, user
+    ):
+        uow = SQLAlchemyAsyncUnitOfWork(postgres_session_factory)
+        async with uow:
+            uow.user_repository.add(user)
+            await uow.commit()
+
+        async with postgres_session_factory() as session:
+            message = await session.scalar(select(OutboxMessage))
+        assert message.to_event(EVENT_TYPES) == UserCreated(
+            username=user.username, email=user.email
+        )
+        assert message.created_at.utcoffset() == timedelta(0)
+
+    async def test_rollback_stores_no_events(
+        self, sqlalchemy_uow, sqlite_session_factory, user
+    ):
+        async with sqlalchemy_uow:
+            sqlalchemy_uow.user_repository.add(user)
+
+        assert await count_outbox_messages(sqlite_session_factory) == 0
+
+
+class TestOutboxRelay:
+    @pytest.fixture
+    async def stored_events(self, anyio_backend, sqlalchemy_uow, user, wishlist):
+        async with sqlalchemy_uow:
+            sqlalchemy_uow.user_repository.add(user)
+            sqlalchemy_uow.wishlist_repository.add(wishlist)
+            await sqlalchemy_uow.commit()
+
+    @pytest.mark.usefixtures("stored_events")
+    async def test_relay_dispatches_and_deletes_messages(
+        self, sqlite_session_factory, user, wishlist
+    ):
+        handled_events = []
+        relay = create_relay(sqlite_session_factory, handled_events)
+
+        assert await relay.relay_batch() == 2
+        assert sorted(type(event).__name__ for event in handled_events) == [
+            "UserCreated",
+            "WishlistCreated",
+        ]
+        assert await count_outbox_messages(sqlite_session_factory) == 0
+
+    @pytest.mark.usefixtures("stored_events")
+    async def test_messages_kept_when_relay_dies(self, sqlite_session_factory):
+        relay = create_relay(sqlite_session_factory, [], fail=SystemExit)
+
+        with pytest.raises(SystemExit):
+            await relay.relay_batch()
+
+        assert await count_outbox_messages(sqlite_session_factory) == 2
+
+    @pytest.mark.usefixtures("stored_events")
+    async def test_messages_kept_when_handler_fails(self, sqlite_session_factory):
+        relay = create_relay(sqlite_session_factory, [], fail=RuntimeError)
+
+        assert await relay.relay_batch() == 2
+
+        async with sqlite_session_factory() as session:
+            messages = (await session.scalars(select(OutboxMessage))).all()
+        assert [message.attempts for message in messages] == [1, 1]
+        assert all(message.next_attempt_at for message in messages)
+        # Failed messages are not retried before their backoff delay
+        assert await relay.relay_batch() == 0
+
+    @pytest.mark.usefixtures("stored_events")
+    async def test_failed_messages_retried_when_due(self, sqlite_session_factory):
+        handled_events = []
+        await create_relay(sqlite_session_factory, [], fail=RuntimeError).relay_batch()
+        relay = create_relay(sqlite_session_factory, handled_events)
+
+        async with sqlite_session_factory() as session:
+            for message in await session.scalars(select(OutboxMessage)):
+                message.next_attempt_at = datetime.now(UTC)
+            await session.commit()
+
+        assert await relay.relay_batch() == 2
+        assert len(handled_events) == 2
+        assert await count_outbox_messages(sqlite_session_factory) == 0
+
+    @pytest.mark.usefixtures("stored_events")
+    async def test_messages_dropped_after_max_attempts(self, sqlite_session_factory):
+        relay = create_relay(
+            sqlite_session_factory, [], fail=RuntimeError, max_attempts=1
+        )
+
+        assert await relay.relay_batch() == 2
+        assert await count_outbox_messages(sqlite_session_factory) == 0
+
+    async def test_relay_batch_on_empty_outbox(self, sqlite_session_factory):
+        relay = create_relay(sqlite_session_factory, [])
+
+        assert await relay.relay_batch() == 0
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.infrastructure.database.sqlalchemy.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    pool_metrics,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def instrumented_engine(anyio_backend, tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    pool_metrics.reset()
+    pool_metrics.listen(engine)
+    yield engine
+    await engine.dispose()
+
+
+class TestPoolMetrics:
+    async def test_checked_out_connection(self, instrumented_engine):
+        async with instrumented_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            snapshot = pool_metrics.snapshot(instrumented_engine.pool)
+
+        assert snapshot["checked_out"] == 1
+        assert snapshot["idle"] == 0
+        assert snapshot["checkouts"] == 1
+
+    async def test_returned_connection(self, instrumented_engine):
+        async with instrumented_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+        snapshot = pool_metrics.snapshot(instrumented_engine.pool)
+        assert snapshot["checked_out"] == 0
+        assert snapshot["idle"] == 1
+        assert snapshot["connects"] == 1
+        assert snapshot["checkins"] == 1
+
+    async def test_checkout_of_free_connection_is_not_a_wait(self, instrumented_engine):
+        for _ in range(2):
+            async with instrumented_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        snapshot = pool_metrics.snapshot(instrumented_engine.pool)
+        assert snapshot["checkouts"] == 2
+        assert snapshot["waits"] == 0
+        assert snapshot["max_wait_seconds"] == 0.0
+
+    async def test_checkout_of_exhausted_pool_is_a_wait(self, instrumented_engine):
+        conn = await instrumented_engine.connect()
+
+        async def release_connection():
+            await asyncio.sleep(0.02)
+            await conn.close()
+
+        release = asyncio.create_task(release_connection())
+        async with instrumented_engine.connect() as second_conn:
+            await second_conn.execute(text("SELECT 1"))
+        await release
+
+        snapshot = pool_metrics.snapshot(instrumented_engine.pool)
+        assert snapshot["waits"] == 1
+        assert snapshot["timeouts"] == 0
+
+    async def test_pool_exhaustion_counted_as_timeout(self, instrumented_engine):
+        async with instrumented_engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                async with instrumented_engine.connect():
+                    pass
+
+        snapshot = pool_metrics.snapshot(instrumented_engine.pool)
+        assert snapshot["timeouts"] == 1
+        assert snapshot["waits"] == 1
+        assert snapshot["max_wait_seconds"] >= 0.1
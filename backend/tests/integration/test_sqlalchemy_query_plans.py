@@ -0,0 +1,208 @@
+import pytest
+from sqlalchemy import event
+
+from src.modules.wishlists.queries import wishlist_queries
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def populated_sqlite_database(
+    anyio_backend, sqlite_session, user, populated_wishlists
+):
+    sqlite_session.add(user)
+    sqlite_session.add_all(populated_wishlists)
+    await sqlite_session.commit()
+
+
+@pytest.fixture
+async def populated_postgres_database(
+    anyio_backend, postgres_session_factory, user, populated_wishlists
+):
+    async with postgres_session_factory() as session:
+        session.add(user)
+        session.add_all(populated_wishlists)
+        await session.commit()
+
+
+async def explain_query(engine, session_factory, query, **kwargs) -> list[str]:
+    """Run a query and return the query plan of every statement it executed."""
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record_statement)
+    try:
+        async with session_factory() as session:
+            await query(session, **kwargs)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record_statement)
+
+    plans = []
+    async with engine.connect() as conn:
+        if engine.dialect.name == "postgresql":
+            # Test tables are tiny, make the planner show the index scans it would use
+            await conn.exec_driver_sql("SET enable_seqscan = off")
+            await conn.exec_driver_sql("SET enable_bitmapscan = off")
+            for statement, parameters in statements:
+                rows = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+                plans.append(" | ".join(row[0] for row in rows))
+        else:
+            for statement, parameters in statements:
+                rows = await conn.exec_driver_sql(
+                    f"EXPLAIN QUERY PLAN {statement}", parameters
+                )
+                plans.append(" | ".join(row.detail for row in rows))
+    return plans
+
+
+@pytest.mark.usefixtures("populated_sqlite_database")
+class TestSQLiteWishlistQueryPlans:
+    """Smoke checks that SQLite can serve the listing queries from their indexes"""
+
+    async def test_get_wishlists_owned_by(
+        self, sqlite_database_engine, sqlite_session_factory, user
+    ):
+        wishlists_plan, items_plan = await explain_query(
+            sqlite_database_engine,
+            sqlite_session_factory,
+            wishlist_queries.get_wishlists_owned_by,
+            username=user.username,
+            limit=2,
+        )
+
+        # Either the composite or the partial index serves this query
+        assert "USING INDEX ix_wishlists_" in wishlists_plan
+        assert "TEMP B-TREE" not in wishlists_plan
+        assert "ix_wishlist_items_wishlist_uuid" in items_plan
+
+    async def test_get_next_page_of_wishlists_owned_by(
+        self, sqlite_database_engine, sqlite_session_factory, user
+    ):
+        async with sqlite_session_factory() as session:
+            first_page = await wishlist_queries.get_wishlists_owned_by(
+                session, username=user.username, limit=1
+            )
+
+        wishlists_plan, items_plan = await explain_query(
+            sqlite_database_engine,
+            sqlite_session_factory,
+            wishlist_queries.get_wishlists_owned_by,
+            username=user.username,
+            limit=1,
+            cursor=first_page.next_cursor,
+        )
+
+        assert "USING INDEX ix_wishlists_" in wishlists_plan
+        assert "TEMP B-TREE" not in wishlists_plan
+
+    async def test_get_archived_wishlists_owned_by(
+        self, sqlite_database_engine, sqlite_session_factory, user
+    ):
+        wishlists_plan, items_plan = await explain_query(
+            sqlite_database_engine,
+            sqlite_session_factory,
+            wishlist_queries.get_archived_wishlists_owned_by,
+            username=user.username,
+            limit=2,
+        )
+
+        assert "ix_wishlists_owner_username_is_archived_created_at" in wishlists_plan
+        assert "TEMP B-TREE" not in wishlists_plan
+        assert "ix_wishlist_items_wishlist_uuid" in items_plan
+
+    async def test_get_wishlist_summaries_owned_by(
+        self, sqlite_database_engine, sqlite_session_factory, user
+    ):
+        (summaries_plan,) = await explain_query(
+            sqlite_database_engine,
+            sqlite_session_factory,
+            wishlist_queries.get_wishlist_summaries_owned_by,
+            username=user.username,
+            limit=2,
+        )
+
+        # Grouping follows the index order, so neither GROUP BY nor ORDER BY sorts
+        assert "USING INDEX ix_wishlists_" in summaries_plan
+        assert "ix_wishlist_items_wishlist_uuid" in summaries_plan
+        assert "TEMP B-TREE" not in summaries_plan
+
+    async def test_get_wishlist_by_uuid(
+        self, sqlite_database_engine, sqlite_session_factory, populated_wishlists
+    ):
+        wishlist_plan, items_plan = await explain_query(
+            sqlite_database_engine,
+            sqlite_session_factory,
+            wishlist_queries.get_wishlist_by_uuid,
+            uuid=populated_wishlists[0].uuid,
+        )
+
+        assert "SCAN" not in wishlist_plan
+        assert "ix_wishlist_items_wishlist_uuid" in items_plan
+
+    async def test_get_wishlists_by_uuids(
+        self, sqlite_database_engine, sqlite_session_factory, populated_wishlists
+    ):
+        wishlists_plan, items_plan = await explain_query(
+            sqlite_database_engine,
+            sqlite_session_factory,
+            wishlist_queries.get_wishlists_by_uuids,
+            uuids=[wishlist.uuid for wishlist in populated_wishlists[:2]],
+        )
+
+        assert "SCAN" not in wishlists_plan
+        assert "ix_wishlist_items_wishlist_uuid" in items_plan
+
+
+@pytest.mark.usefixtures("populated_postgres_database")
+class TestPostgresWishlistQueryPlans:
+    async def test_get_wishlists_owned_by(
+        self, postgres_database_engine, postgres_session_factory, user
+    ):
+        wishlists_plan, items_plan = await explain_query(
+            postgres_database_engine,
+            postgres_session_factory,
+            wishlist_queries.get_wishlists_owned_by,
+            username=user.username,
+            limit=2,
+        )
+
+        assert "ix_wishlists_active_owner_username_created_at_uuid" in wishlists_plan
+        assert "Sort" not in wishlists_plan
+        assert "ix_wishlist_items_wishlist_uuid" in items_plan
+
+    async def test_get_next_page_of_wishlists_owned_by(
+        self, postgres_database_engine, postgres_session_factory, user
+    ):
+        async with postgres_session_factory() as session:
+            first_page = await wishlist_queries.get_wishlists_owned_by(
+                session, username=user.username, limit=1
+            )
+
+        wishlists_plan, items_plan = await explain_query(
+            postgres_database_engine,
+            postgres_session_factory,
+            wishlist_queries.get_wishlists_owned_by,
+            username=user.username,
+            limit=1,
+            cursor=first_page.next_cursor,
+        )
+
+        assert "ix_wishlists_active_owner_username_created_at_uuid" in wishlists_plan
+        assert "Sort" not in wishlists_plan
+
+    async def test_get_archived_wishlists_owned_by(
+        self, postgres_database_engine, postgres_session_factory, user
+    ):
+        wishlists_plan, items_plan = await explain_query(
+            postgres_database_engine,
+            postgres_session_factory,
+            wishlist_queries.get_archived_wishlists_owned_by,
+            username=user.username,
+            limit=2,
+        )
+
+        assert "ix_wishlists_owner_username_is_archived_created_at" in wishlists_plan
+        assert "Sort" not in wishlists_plan
+        assert "ix_wishlist_items_wishlist_uuid" in items_plan
@@ -3,59 +3,66 @@ import uuid
 import pytest
 
 from src.infrastructure.database.sqlalchemy.repositories.user_repository import (
-    SQLAlchemyUserRepository,
+    SQLAlchemyAsyncUserRepository,
 )
 from src.infrastructure.database.sqlalchemy.repositories.wishlist_repository import (
-    SQLAlchemyWishlistRepository,
+    SQLAlchemyAsyncWishlistRepository,
 )
 from src.shared.application.exceptions import UserNotFound, WishlistNotFound
 
+pytestmark = pytest.mark.anyio
+
 
 class TestSQLAlchemyUserRepository:
-    def test_get_user(self, sqlite_session, user):
+    async def test_get_user(self, sqlite_session, user):
         sqlite_session.add(user)
-        sqlite_session.commit()
-        repository = SQLAlchemyUserRepository(sqlite_session)
-        assert repository.get(user.username) is not None
+        await sqlite_session.commit()
+        repository = SQLAlchemyAsyncUserRepository(sqlite_session)
+        assert await repository.get(user.username) is not None
 
-    def test_get_non_existing_user(self, sqlite_session):
-        repository = SQLAlchemyUserRepository(sqlite_session)
+    async def test_get_non_existing_user(self, sqlite_session):
+        repository = SQLAlchemyAsyncUserRepository(sqlite_session)
         with pytest.raises(UserNotFound):
-            repository.get("non-existing-user")
+            await repository.get("non-existing-user")
 
-    def test_add_user(self, sqlite_session, user):
-        repository = SQLAlchemyUserRepository(sqlite_session)
+    async def test_add_user(self, sqlite_session, user):
+        repository = SQLAlchemyAsyncUserRepository(sqlite_session)
         repository.add(user)
-        assert repository.get(user.username) is not None
+        assert await repository.get(user.username) is not None
 
 
 class TestSQLAlchemyWishlistRepository:
-    def test_get_wishlist(self, sqlite_session, wishlist):
+    async def test_get_wishlist(self, sqlite_session, wishlist):
         sqlite_session.add(wishlist)
-        sqlite_session.commit()
-        repository = SQLAlchemyWishlistRepository(sqlite_session)
-        assert repository.get(wishlist.uuid) is not None
+        await sqlite_session.commit()
+        repository = SQLAlchemyAsyncWishlistRepository(sqlite_session)
+        assert await repository.get(wishlist.uuid) is not None
 
-    def test_get_non_existing_wishlist(self, sqlite_session):
-        repository = SQLAlchemyWishlistRepository(sqlite_session)
+    async def test_get_non_existing_wishlist(self, sqlite_session):
+        repository = SQLAlchemyAsyncWishlistRepository(sqlite_session)
         with pytest.raises(WishlistNotFound):
-            repository.get(uuid.uuid4())
+            await repository.get(uuid.uuid4())
 
-    def test_list_all_wishlists(self, sqlite_session, wishlist, populated_wishlist):
+    async def test_list_all_wishlists(
+        self, sqlite_session, wishlist, populated_wishlist
+    ):
         sqlite_session.add_all([wishlist, populated_wishlist])
-        sqlite_session.commit()
-        repository = SQLAlchemyWishlistRepository(sqlite_session)
-        assert repository.list_all() == [wishlist, populated_wishlist]
+        await sqlite_session.commit()
+        repository = SQLAlchemyAsyncWishlistRepository(sqlite_session)
+        assert await repository.list_all() == [wishlist, populated_wishlist]
 
-    def test_list_wishlists_owned_by(
+    async def test_list_wishlists_owned_by(
         self, sqlite_session, user, wishlist, populated_wishlist
     ):
         sqlite_session.add_all([user, wishlist, populated_wishlist])
-        sqlite_session.commit()
-        repository = SQLAlchemyWishlistRepository(sqlite_session)
-        assert repository.list_owned_by(user.username) == [wishlist, populated_wishlist]
+        await sqlite_session.commit()
+        repository = SQLAlchemyAsyncWishlistRepository(sqlite_session)
+        assert await repository.list_owned_by(user.username) == [
+            wishlist,
+            populated_wishlist,
+        ]
 
-    def test_add_wishlist(self, sqlite_session, wishlist):
-        repository = SQLAlchemyWishlistRepository(sqlite_session)
+    async def test_add_wishlist(self, sqlite_session, wishlist):
+        repository = SQLAlchemyAsyncWishlistRepository(sqlite_session)
         repository.add(wishlist)
-        assert repository.get(wishlist.uuid) is not None
+        assert await repository.get(wishlist.uuid) is not None
@@ -0,0 +1,23 @@
+import pytest
+from sqlalchemy import text
+
+from src.infrastructure.database.sqlalchemy.session_tracking import (
+    track_open_sessions,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class TestSessionTracking:
+    async def test_session_holding_connection_is_tracked(self, sqlite_session_factory):
+        session = sqlite_session_factory()
+        with track_open_sessions() as open_sessions:
+            await session.execute(text("SELECT 1"))
+            assert open_sessions == {session.sync_session}
+        await session.close()
+
+    async def test_closed_session_is_not_tracked(self, sqlite_session_factory):
+        with track_open_sessions() as open_sessions:
+            async with sqlite_session_factory() as session:
+                await session.execute(text("SELECT 1"))
+        assert not open_sessions
@@ -1,33 +1,163 @@
 import pytest
 
-from src.shared.application.exceptions import UserNotFound
+from src.infrastructure.database.sqlalchemy.unit_of_work import (
+    SQLAlchemyAsyncUnitOfWork,
+)
+from src.shared.application.exceptions import ConcurrentModification, UserNotFound
+
+pytestmark = pytest.mark.anyio
 
 
 class TestSQLAlchemyUnitOfWork:
-    def test_uow_can_use_repositories(self, sqlalchemy_uow):
-        with sqlalchemy_uow:
+    async def test_uow_can_use_repositories(self, sqlalchemy_uow):
+        async with sqlalchemy_uow:
             assert sqlalchemy_uow.user_repository
             assert sqlalchemy_uow.wishlist_repository
 
-    def test_uow_can_commit(self, sqlalchemy_uow, user):
-        with sqlalchemy_uow:
+    async def test_uow_can_commit(self, sqlalchemy_uow, user):
+        async with sqlalchemy_uow:
             sqlalchemy_uow.user_repository.add(user)
-            sqlalchemy_uow.commit()
+            await sqlalchemy_uow.commit()
+
+        assert await sqlalchemy_uow.user_repository.get(user.username) == user
 
-        assert sqlalchemy_uow.user_repository.get(user.username) == user
+    async def test_uow_can_commit_wishlist_to_postgres(
+        self, postgres_session_factory, user, wishlist
+    ):
+        uow = SQLAlchemyAsyncUnitOfWork(postgres_session_factory)
+        async with uow:
+            uow.user_repository.add(user)
+            uow.wishlist_repository.add(wishlist)
+            await uow.commit()
 
-    def test_uow_rollback_uncommitted_changes(self, sqlalchemy_uow, user):
-        with sqlalchemy_uow:
+        async with SQLAlchemyAsyncUnitOfWork(postgres_session_factory) as uow:
+            stored = await uow.wishlist_repository.get(wishlist.uuid)
+            assert stored.created_at == wishlist.created_at
+
+    async def test_uow_rollback_uncommitted_changes(self, sqlalchemy_uow, user):
+        async with sqlalchemy_uow:
             sqlalchemy_uow.user_repository.add(user)
 
         with pytest.raises(Exception):
-            _user = sqlalchemy_uow.user_repository.get(user.username)
+            _user = await sqlalchemy_uow.user_repository.get(user.username)
 
-    def test_uow_rollback_on_error(self, sqlalchemy_uow, user):
+    async def test_uow_rollback_on_error(self, sqlalchemy_uow, user):
         with pytest.raises(Exception):
-            with sqlalchemy_uow:
+            async with sqlalchemy_uow:
                 sqlalchemy_uow.user_repository.add(user)
                 raise Exception
 
         with pytest.raises(UserNotFound):
-            _user = sqlalchemy_uow.user_repository.get(user.username)
+            _user = await sqlalchemy_uow.user_repository.get(user.username)
+
+
+class TestSQLAlchemyUnitOfWorkOptimisticConcurrency:
+    @pytest.fixture
+    async def stored_wishlist(
+        self, anyio_backend, sqlite_session, user, populated_wishlist
+    ):
+        sqlite_session.add_all([user, populated_wishlist])
+        await sqlite_session.commit()
+        return populated_wishlist
+
+    async def test_concurrent_wishlist_change_is_rejected(
+        self, sqlite_session_factory, stored_wishlist
+    ):
+        first_uow = SQLAlchemyAsyncUnitOfWork(sqlite_session_factory)
+        second_uow = SQLAlchemyAsyncUnitOfWork(sqlite_session_factory)
+
+        async with first_uow, second_uow:
+            first = await first_uow.wishlist_repository.get(stored_wishlist.uuid)
+            second = await second_uow.wishlist_repository.get(stored_wishlist.uuid)
+            first.change_name("first")
+            second.change_name("second")
+
+            await first_uow.commit()
+            with pytest.raises(ConcurrentModification):
+                await second_uow.commit()
+
+    async def test_concurrent_item_changes_are_rejected(
+        self, sqlite_session_factory, stored_wishlist
+    ):
+        first_uow = SQLAlchemyAsyncUnitOfWork(sqlite_session_factory)
+        second_uow = SQLAlchemyAsyncUnitOfWork(sqlite_session_factory)
+        apple_uuid = next(
+            item.uuid for item in stored_wishlist.items if not item.is_purchased
+        )
+
+        async with first_uow, second_uow:
+            first = await first_uow.wishlist_repository.get(stored_wishlist.uuid)
+            second = await second_uow.wishlist_repository.get(stored_wishlist.uuid)
+            first.mark_item_as_purchased(apple_uuid)
+            second.remove_item(apple_uuid)
+
+            await first_uow.commit()
+            with pytest.raises(ConcurrentModification):
+                await second_uow.commit()
+
+    async def test_item_change_bumps_wishlist_version(
+        self, sqlalchemy_uow, stored_wishlist
+    ):
+        async with sqlalchemy_uow:
+            wishlist = await sqlalchemy_uow.wishlist_repository.get(
+                stored_wishlist.uuid
+            )
+            version = wishlist.version
+            wishlist.mark_item_as_not_purchased(
+                next(item.uuid for item in wishlist.items if item.is_purchased)
+            )
+            await sqlalchemy_uow.commit()
+
+        assert wishlist.version == version + 1
+
+    async def test_unchanged_wishlist_keeps_version(
+        self, sqlalchemy_uow, stored_wishlist
+    ):
+        async with sqlalchemy_uow:
+            wishlist = await sqlalchemy_uow.wishlist_repository.get(
+                stored_wishlist.uuid
+            )
+            version = wishlist.version
+            await sqlalchemy_uow.commit()
+
+        assert wishlist.version == version
+
+
+class TestSQLAlchemyReadOnlyUnitOfWork:
+    async def test_read_only_uow_can_read(self, sqlalchemy_uow, sqlite_session, user):
+        sqlite_session.add(user)
+        await sqlite_session.commit()
+
+        async with sqlalchemy_uow.as_read_only() as uow:
+            assert await uow.user_repository.get(user.username) == user
+
+    async def test_read_only_uow_can_not_commit(self, sqlalchemy_uow):
+        async with sqlalchemy_uow.as_read_only() as uow:
+            with pytest.raises(RuntimeError):
+                await uow.commit()
+
+    async def test_read_only_uow_does_not_lock(self, sqlite_session_factory):
+        uow = SQLAlchemyAsyncUnitOfWork(sqlite_session_factory, lock_for_update=True)
+
+        async with uow.as_read_only() as read_only_uow:
+            assert not read_only_uow.user_repository.lock_for_update
+            assert not read_only_uow.wishlist_repository.lock_for_update
+
+    async def test_read_only_uow_uses_read_only_transaction(self, sqlalchemy_uow):
+        async with sqlalchemy_uow.as_read_only() as uow:
+            connection = await uow.session.connection()
+            assert connection.sync_connection.get_execution_options()[
+                "postgresql_readonly"
+            ]
+
+    async def test_read_only_uow_does_not_collect_events(
+        self, sqlalchemy_uow, sqlite_session, user
+    ):
+        sqlite_session.add(user)
+        await sqlite_session.commit()
+
+        async with sqlalchemy_uow.as_read_only() as uow:
+            loaded_user = await uow.user_repository.get(user.username)
+            loaded_user.deactivate()
+
+        assert list(uow.collect_new_events()) == []
@@ -0,0 +1,35 @@
+import pytest
+
+from src import bootstrap
+from tests.fakes import FakeUnitOfWork
+
+pytestmark = pytest.mark.anyio
+
+
+class TestReadOnlyHandlers:
+    @staticmethod
+    def build_handler(monkeypatch, read_only: bool):
+        received = {}
+
+        async def handle_message(message, uow):
+            received["uow"] = uow
+
+        read_only_handlers = {handle_message} if read_only else set()
+        monkeypatch.setattr(bootstrap, "READ_ONLY_HANDLERS", read_only_handlers)
+        handler = bootstrap.build_handler_with_injected_dependencies(
+            handle_message, {"uow": FakeUnitOfWork()}
+        )
+        return handler, received
+
+    async def test_read_only_handler_gets_read_only_uow(self, monkeypatch):
+        handler, received = self.build_handler(monkeypatch, read_only=True)
+        await handler(object())
+        assert received["uow"].read_only
+
+    async def test_handler_gets_writable_uow(self, monkeypatch):
+        handler, received = self.build_handler(monkeypatch, read_only=False)
+        await handler(object())
+        assert not received["uow"].read_only
+
+    def test_resend_activation_code_is_read_only(self):
+        assert bootstrap.handle_resend_activation_code in bootstrap.READ_ONLY_HANDLERS
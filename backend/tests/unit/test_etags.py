@@ -0,0 +1,51 @@
+import pytest
+from starlette.requests import Request
+
+from src.infrastructure.entrypoints.fastapi.etags import (
+    attach_etag,
+    detach_etag,
+    etag_matches,
+    fieldset_etag,
+    make_etag,
+)
+from src.shared.application.fieldsets import Fieldset
+
+ETAG = make_etag("wishlist", 1)
+
+
+def request_with_if_none_match(value: str | None) -> Request:
+    headers = [] if value is None else [(b"if-none-match", value.encode())]
+    return Request({"type": "http", "headers": headers})
+
+
+class TestETags:
+    def test_etag_is_strong_and_changes_with_parts(self):
+        assert ETAG.startswith('"') and ETAG.endswith('"')
+        assert make_etag("wishlist", 2) != ETAG
+
+    @pytest.mark.parametrize(
+        "header",
+        [ETAG, f"W/{ETAG}", f'"other", {ETAG}', "*"],
+    )
+    def test_if_none_match_matches(self, header):
+        assert etag_matches(request_with_if_none_match(header), ETAG)
+
+    @pytest.mark.parametrize("header", [None, '"other"', ETAG.strip('"')])
+    def test_if_none_match_does_not_match(self, header):
+        assert not etag_matches(request_with_if_none_match(header), ETAG)
+
+    def test_attached_etag_detached_from_payload(self):
+        payload = '{"name": "two\\nlines"}'
+        assert detach_etag(attach_etag(ETAG, payload)) == (ETAG, payload)
+
+    def test_fieldset_etag_distinct_from_full_representation(self):
+        fieldset = Fieldset(frozenset({"name", "items.name"}))
+
+        assert fieldset_etag(ETAG, None) == ETAG
+        assert fieldset_etag(ETAG, fieldset) != ETAG
+        assert fieldset_etag(ETAG, fieldset) == fieldset_etag(
+            ETAG, Fieldset(frozenset({"items.name", "name"}))
+        )
+        assert fieldset_etag(ETAG, fieldset) != fieldset_etag(
+            ETAG, Fieldset(frozenset({"name"}))
+        )
@@ -0,0 +1,32 @@
+import pytest
+
+from src.shared.application.exceptions import InvalidFields
+from src.shared.application.fieldsets import parse_fieldset
+
+ALLOWED = {"name": (), "created_at": (), "items": ("name", "is_purchased")}
+
+
+class TestFieldsets:
+    def test_parse_fieldset(self):
+        fieldset = parse_fieldset(" name, items.name ,items.is_purchased", ALLOWED)
+
+        assert fieldset.fields == {"name", "items"}
+        assert fieldset.nested_fields("items") == {"name", "is_purchased"}
+
+    def test_whole_nested_object(self):
+        fieldset = parse_fieldset("items", ALLOWED)
+
+        assert fieldset.fields == {"items"}
+        assert fieldset.nested_fields("items") is None
+
+    def test_order_does_not_matter(self):
+        assert parse_fieldset("name,created_at", ALLOWED) == parse_fieldset(
+            "created_at,name", ALLOWED
+        )
+
+    @pytest.mark.parametrize(
+        "fields", ["", " , ", "owner", "items.quantity", "name.first", "items."]
+    )
+    def test_invalid_fields(self, fields):
+        with pytest.raises(InvalidFields):
+            parse_fieldset(fields, ALLOWED)
@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+
+import pytest
+
+from src.shared.application.exceptions import ConcurrentModification
+from src.shared.application.messagebus import AsyncMessagebus, RetryPolicy
+from src.shared.domain.commands import Command
+from src.shared.domain.events import DomainEvent
+from tests.fakes import FakeUnitOfWork
+
+pytestmark = pytest.mark.anyio
+
+
+@dataclass(frozen=True)
+class ConflictingCommand(Command):
+    conflicts: int
+
+
+def create_messagebus(retry_policy: RetryPolicy) -> tuple[AsyncMessagebus, list]:
+    """Messagebus with a handler losing the first `command.conflicts` races."""
+    calls = []
+
+    async def handle_conflicting_command(command: ConflictingCommand):
+        calls.append(command)
+        if len(calls) <= command.conflicts:
+            raise ConcurrentModification()
+        return len(calls)
+
+    messagebus = AsyncMessagebus(
+        uow=FakeUnitOfWork(),
+        command_handlers={ConflictingCommand: handle_conflicting_command},
+        event_handlers={},
+        dependencies={},
+        retry_policy=retry_policy,
+    )
+    return messagebus, calls
+
+
+@dataclass
+class FailingEvent(DomainEvent):
+    pass
+
+
+def create_failing_event_messagebus() -> AsyncMessagebus:
+    async def handle_failing_event(event: FailingEvent):
+        raise RuntimeError("handler failed")
+
+    return AsyncMessagebus(
+        uow=FakeUnitOfWork(),
+        command_handlers={},
+        event_handlers={FailingEvent: [handle_failing_event]},
+        dependencies={},
+    )
+
+
+class TestMessagebusRetries:
+    async def test_command_retried_after_concurrent_modification(self):
+        messagebus, calls = create_messagebus(RetryPolicy(attempts=3, base_delay=0))
+
+        assert await messagebus.handle(ConflictingCommand(conflicts=2)) == 3
+        assert len(calls) == 3
+
+    async def test_concurrent_modification_raised_when_attempts_exhausted(self):
+        messagebus, calls = create_messagebus(RetryPolicy(attempts=2, base_delay=0))
+
+        with pytest.raises(ConcurrentModification):
+            await messagebus.handle(ConflictingCommand(conflicts=2))
+        assert len(calls) == 2
+
+    def test_retry_delay_is_bounded(self):
+        retry_policy = RetryPolicy(attempts=10, base_delay=0.1, max_delay=0.3)
+
+        assert all(0 <= retry_policy.delay(attempt) <= 0.3 for attempt in range(10))
+
+
+class TestMessagebusEventErrors:
+    async def test_event_handler_error_is_logged(self):
+        messagebus = create_failing_event_messagebus()
+
+        await messagebus.handle(FailingEvent())
+
+    async def test_event_handler_error_raised_on_request(self):
+        messagebus = create_failing_event_messagebus()
+
+        with pytest.raises(RuntimeError):
+            await messagebus.handle(FailingEvent(), raise_on_error=True)
+
+
+class TestMessagebusCommittedEvents:
+    async def test_committed_event_handlers_run_after_command(self):
+        handled = []
+
+        async def handle_committing_command(command: ConflictingCommand):
+            messagebus.uow.committed_events.append(FailingEvent())
+
+        async def handle_committed_event(event: FailingEvent):
+            handled.append(event)
+
+        messagebus = AsyncMessagebus(
+            uow=FakeUnitOfWork(),
+            command_handlers={ConflictingCommand: handle_committing_command},
+            event_handlers={},
+            dependencies={},
+            committed_event_handlers={FailingEvent: [handle_committed_event]},
+        )
+
+        await messagebus.handle(ConflictingCommand(conflicts=0))
+
+        assert handled == [FailingEvent()]
+        assert messagebus.uow.committed_events == []
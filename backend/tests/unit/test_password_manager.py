@@ -0,0 +1,106 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from src.shared.application.exceptions import PasswordVerificationError
+from src.shared.utils.auth.password_manager import (
+    Argon2Parameters,
+    Argon2PasswordManager,
+    PasswordManager,
+    argon2_hash,
+    password_hash_metrics,
+)
+
+pytestmark = pytest.mark.anyio
+
+CHEAP_PARAMETERS = Argon2Parameters(time_cost=1, memory_cost=1024, parallelism=1)
+
+
+class ConcurrencyTrackingPasswordManager(PasswordManager):
+    """Password manager recording how many hashing calls run at the same time."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def _slow_hash(self, password: str) -> str:
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.02)
+        with self._lock:
+            self.running -= 1
+        return password[::-1]
+
+    async def hash_password(self, password: str) -> str:
+        return await self._run(self._slow_hash, password)
+
+    async def verify_and_update(
+        self, password: str, password_hash: str
+    ) -> tuple[bool, str | None]:
+        return await self.hash_password(password) == password_hash, None
+
+
+class TestArgon2PasswordManager:
+    async def test_hash_and_verify_in_process_pool(self):
+        executor = ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        )
+        password_manager = Argon2PasswordManager(
+            parameters=CHEAP_PARAMETERS, executor=executor
+        )
+        try:
+            password_hash = await password_manager.hash_password("password")
+
+            assert "m=1024,t=1,p=1" in password_hash
+            assert await password_manager.verify_password("password", password_hash)
+            with pytest.raises(PasswordVerificationError):
+                await password_manager.assert_passwords_match("wrong", password_hash)
+        finally:
+            password_manager.close()
+
+    async def test_hash_in_default_executor(self):
+        password_manager = Argon2PasswordManager(parameters=CHEAP_PARAMETERS)
+
+        password_hash = await password_manager.hash_password("password")
+
+        assert await password_manager.verify_password("password", password_hash)
+
+    async def test_hash_with_outdated_parameters_is_updated(self):
+        outdated_hash = argon2_hash("password", CHEAP_PARAMETERS)
+        password_manager = Argon2PasswordManager(
+            parameters=Argon2Parameters(time_cost=2, memory_cost=1024, parallelism=1)
+        )
+        outdated_hashes = password_hash_metrics.outdated_hashes["argon2"]
+
+        new_hash = await password_manager.assert_passwords_match(
+            "password", outdated_hash
+        )
+
+        assert "m=1024,t=2,p=1" in new_hash
+        assert password_hash_metrics.outdated_hashes["argon2"] == outdated_hashes + 1
+        assert (
+            await password_manager.assert_passwords_match("password", new_hash) is None
+        )
+
+
+class TestPasswordManagerAdmission:
+    async def test_concurrent_hashing_limited_to_max_concurrency(self):
+        password_manager = ConcurrencyTrackingPasswordManager(
+            executor=ThreadPoolExecutor(max_workers=8), max_concurrency=2
+        )
+        try:
+            hashes = await asyncio.gather(
+                *(password_manager.hash_password(f"password{n}") for n in range(8))
+            )
+        finally:
+            password_manager.close()
+
+        assert hashes == [f"password{n}"[::-1] for n in range(8)]
+        assert password_manager.max_running == 2
@@ -0,0 +1,45 @@
+import pytest
+from zxcvbn import zxcvbn
+
+from src.shared.application.exceptions import PasswordValidationError
+from src.shared.utils.auth.password_manager import Argon2PasswordManager
+from src.shared.utils.auth.password_strength import (
+    COMMON_PASSWORDS,
+    MIN_SCORE,
+    assert_password_strong,
+    prefilter_password,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class TestPasswordPrefilter:
+    @pytest.mark.parametrize(
+        "password", ["short", "Xk9#vQ2!", "qwertyuiop", "PASSWORD1", "testuser123"]
+    )
+    def test_prefilter_rejects(self, password):
+        with pytest.raises(PasswordValidationError):
+            prefilter_password(password, user_inputs=["testuser123"])
+
+    def test_prefilter_passes_strong_password(self, valid_password):
+        prefilter_password(valid_password, user_inputs=["testuser"])
+
+    def test_common_passwords_are_rejected_by_zxcvbn_too(self):
+        for password in COMMON_PASSWORDS:
+            assert zxcvbn(password)["score"] < MIN_SCORE, password
+
+
+class TestPasswordStrength:
+    def test_long_password_is_truncated_for_analysis(self, valid_password):
+        assert_password_strong(valid_password * 20, max_length=32)
+
+    def test_weak_password_rejected(self):
+        with pytest.raises(PasswordValidationError):
+            assert_password_strong("aaaaaaaaaaaa")
+
+    async def test_password_manager_checks_password_in_executor(self, valid_password):
+        password_manager = Argon2PasswordManager()
+
+        await password_manager.assert_password_valid(valid_password)
+        with pytest.raises(PasswordValidationError):
+            await password_manager.assert_password_valid("aaaaaaaaaaaa")
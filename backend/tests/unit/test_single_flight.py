@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure.cache.memory.single_flight import SingleFlight
+
+pytestmark = pytest.mark.anyio
+
+
+class CountingLoader:
+    def __init__(self, result: str = "value", error: Exception | None = None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.error:
+            raise self.error
+        return self.result
+
+
+class TestSingleFlight:
+    async def test_concurrent_loads_shared(self):
+        single_flight = SingleFlight()
+        load = CountingLoader()
+
+        results = await asyncio.gather(
+            *(single_flight.do("key", load) for _ in range(10))
+        )
+
+        assert results == ["value"] * 10
+        assert load.calls == 1
+        assert single_flight.snapshot() == {"loads": 1, "coalesced": 9, "in_flight": 0}
+
+    async def test_sequential_loads_not_shared(self):
+        single_flight = SingleFlight()
+        load = CountingLoader()
+
+        await single_flight.do("key", load)
+        await single_flight.do("key", load)
+
+        assert load.calls == 2
+
+    async def test_different_keys_not_shared(self):
+        single_flight = SingleFlight()
+        load = CountingLoader()
+
+        await asyncio.gather(single_flight.do("a", load), single_flight.do("b", load))
+
+        assert load.calls == 2
+
+    async def test_exception_raised_to_every_caller(self):
+        single_flight = SingleFlight()
+        load = CountingLoader(error=LookupError("missing"))
+
+        results = await asyncio.gather(
+            *(single_flight.do("key", load) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, LookupError) for result in results)
+        assert load.calls == 1
+
+    async def test_cancelled_caller_does_not_cancel_load(self):
+        single_flight = SingleFlight()
+        load = CountingLoader()
+        first = asyncio.ensure_future(single_flight.do("key", load))
+        second = asyncio.ensure_future(single_flight.do("key", load))
+        await asyncio.sleep(0)
+
+        first.cancel()
+
+        assert await second == "value"
+        assert load.calls == 1
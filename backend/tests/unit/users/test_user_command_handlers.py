@@ -1,6 +1,8 @@
 import datetime
 
 import pytest
+from passlib.hash import hex_sha256
+
 from src.modules.users.domain.commands import (
     ActivateUser,
     ActivateUserWithCode,
@@ -10,12 +12,14 @@ from src.modules.users.domain.commands import (
     CreateUser,
     DeactivateUser,
     GenerateAuthToken,
+    RefreshAuthToken,
     ResendActivationCode,
 )
 from src.shared.application.exceptions import (
     CodeVerificationError,
     PasswordValidationError,
     PasswordVerificationError,
+    TokenException,
     UserActive,
     UserAlreadyActive,
     UserAlreadyDeactivated,
@@ -24,22 +28,27 @@ from src.shared.application.exceptions import (
     UserNotActive,
     UserNotFound,
 )
+from src.shared.utils.auth.password_manager import password_hash_metrics
+from src.shared.utils.auth.token_manager import AuthTokens, JWTManager
+
+
+pytestmark = pytest.mark.anyio
 
 
 class TestCreateUser:
-    def test_create_user(self, messagebus, valid_password):
-        messagebus.handle(
+    async def test_create_user(self, messagebus, valid_password):
+        await messagebus.handle(
             CreateUser(
                 username="testuser",
                 email="testemail@example.com",
                 password=valid_password,
             )
         )
-        assert messagebus.uow.user_repository.get("testuser") is not None
+        assert await messagebus.uow.user_repository.get("testuser") is not None
 
-    def test_create_user_invalid_password(self, messagebus, invalid_password):
+    async def test_create_user_invalid_password(self, messagebus, invalid_password):
         with pytest.raises(PasswordValidationError):
-            messagebus.handle(
+            await messagebus.handle(
                 CreateUser(
                     username="testuser",
                     email="testemail@example.com",
@@ -47,10 +56,12 @@ class TestCreateUser:
                 )
             )
 
-    def test_create_user_with_existing_username(self, messagebus, user, valid_password):
+    async def test_create_user_with_existing_username(
+        self, messagebus, user, valid_password
+    ):
         messagebus.uow.user_repository.add(user)
         with pytest.raises(UserExists):
-            messagebus.handle(
+            await messagebus.handle(
                 CreateUser(
                     username=user.username,
                     email="testemail@example.com",
@@ -68,11 +79,11 @@ class TestCreateUser:
             "a b",
         ],
     )
-    def test_create_user_invalid_username(
+    async def test_create_user_invalid_username(
         self, messagebus, forbidden_username, valid_password
     ):
         with pytest.raises(UserInvalidName):
-            messagebus.handle(
+            await messagebus.handle(
                 CreateUser(
                     username=forbidden_username,
                     email="testemail@example.com",
@@ -82,11 +93,11 @@ class TestCreateUser:
 
 
 class TestGenerateAuthToken:
-    def test_generate_auth_token_and_get_username(
+    async def test_generate_auth_token_and_get_username(
         self, messagebus, user, valid_password
     ):
         messagebus.uow.user_repository.add(user)
-        token = messagebus.handle(
+        token = await messagebus.handle(
             GenerateAuthToken(
                 username=user.username,
                 password=valid_password,
@@ -95,7 +106,7 @@ class TestGenerateAuthToken:
         )
         assert token
 
-    def test_inactive_user_allowed_to_generate_auth_token(
+    async def test_inactive_user_allowed_to_generate_auth_token(
         self, messagebus, deactivated_user, valid_password
     ):
         messagebus.uow.user_repository.add(deactivated_user)
@@ -105,13 +116,13 @@ class TestGenerateAuthToken:
             token_lifetime=datetime.timedelta(minutes=1),
         )
 
-        token = messagebus.handle(command)
+        token = await messagebus.handle(command)
 
         assert token
 
-    def test_generate_auth_token_wrong_username(self, messagebus):
+    async def test_generate_auth_token_wrong_username(self, messagebus):
         with pytest.raises(UserNotFound):
-            messagebus.handle(
+            await messagebus.handle(
                 GenerateAuthToken(
                     username="non-existing-user",
                     password="password",
@@ -119,10 +130,10 @@ class TestGenerateAuthToken:
                 )
             )
 
-    def test_generate_auth_token_wrong_password(self, messagebus, user):
+    async def test_generate_auth_token_wrong_password(self, messagebus, user):
         messagebus.uow.user_repository.add(user)
         with pytest.raises(PasswordVerificationError):
-            messagebus.handle(
+            await messagebus.handle(
                 GenerateAuthToken(
                     username=user.username,
                     password="wrong-password",
@@ -130,9 +141,106 @@ class TestGenerateAuthToken:
                 )
             )
 
+    async def test_outdated_password_hash_upgraded_on_login(
+        self, messagebus, user, valid_password
+    ):
+        user.password_hash = hex_sha256.hash(valid_password)
+        messagebus.uow.user_repository.add(user)
+        rehashes = password_hash_metrics.rehashes
+
+        await messagebus.handle(
+            GenerateAuthToken(
+                username=user.username,
+                password=valid_password,
+                token_lifetime=datetime.timedelta(minutes=1),
+            )
+        )
+
+        assert user.password_hash.startswith("$argon2id$")
+        assert messagebus.uow.committed
+        assert password_hash_metrics.rehashes == rehashes + 1
+
+    async def test_current_password_hash_not_rewritten_on_login(
+        self, messagebus, user, valid_password
+    ):
+        password_hash = user.password_hash
+        messagebus.uow.user_repository.add(user)
+
+        await messagebus.handle(
+            GenerateAuthToken(
+                username=user.username,
+                password=valid_password,
+                token_lifetime=datetime.timedelta(minutes=1),
+            )
+        )
+
+        assert user.password_hash == password_hash
+        assert not messagebus.uow.committed
+
+
+class TestRefreshAuthToken:
+    @staticmethod
+    async def login(messagebus, user, password) -> AuthTokens:
+        return await messagebus.handle(
+            GenerateAuthToken(
+                username=user.username,
+                password=password,
+                token_lifetime=datetime.timedelta(minutes=1),
+                refresh_token_lifetime=datetime.timedelta(hours=1),
+            )
+        )
+
+    @staticmethod
+    def refresh(refresh_token: str) -> RefreshAuthToken:
+        return RefreshAuthToken(
+            refresh_token=refresh_token,
+            token_lifetime=datetime.timedelta(minutes=1),
+        )
+
+    async def test_refresh_auth_token(self, messagebus, admin_user, valid_password):
+        messagebus.uow.user_repository.add(admin_user)
+        auth_tokens = await self.login(messagebus, admin_user, valid_password)
+
+        refreshed = await messagebus.handle(self.refresh(auth_tokens.refresh_token))
+
+        claims = JWTManager.get_claims_from_token(refreshed.access_token)
+        assert claims.username == admin_user.username
+        assert claims.is_superuser
+
+    async def test_access_token_cannot_refresh(self, messagebus, user, valid_password):
+        messagebus.uow.user_repository.add(user)
+        auth_tokens = await self.login(messagebus, user, valid_password)
+
+        with pytest.raises(TokenException):
+            await messagebus.handle(self.refresh(auth_tokens.access_token))
+
+    async def test_refresh_token_revoked_by_password_change(
+        self, messagebus, user, valid_password, valid_new_password
+    ):
+        messagebus.uow.user_repository.add(user)
+        auth_tokens = await self.login(messagebus, user, valid_password)
+        await messagebus.handle(
+            ChangePasswordWithoutOldPassword(
+                username=user.username, new_password=valid_new_password
+            )
+        )
+
+        with pytest.raises(TokenException):
+            await messagebus.handle(self.refresh(auth_tokens.refresh_token))
+
+    async def test_refresh_token_revoked_by_deactivation(
+        self, messagebus, activated_user, valid_password
+    ):
+        messagebus.uow.user_repository.add(activated_user)
+        auth_tokens = await self.login(messagebus, activated_user, valid_password)
+        await messagebus.handle(DeactivateUser(username=activated_user.username))
+
+        with pytest.raises(TokenException):
+            await messagebus.handle(self.refresh(auth_tokens.refresh_token))
+
 
 class TestChangePassword:
-    def test_change_password_by_admin(self, messagebus, user, valid_new_password):
+    async def test_change_password_by_admin(self, messagebus, user, valid_new_password):
         messagebus.uow.user_repository.add(user)
         old_password_hash = user.password_hash
         command = ChangePasswordWithoutOldPassword(
@@ -140,11 +248,11 @@ class TestChangePassword:
             new_password=valid_new_password,
         )
 
-        messagebus.handle(command)
+        await messagebus.handle(command)
 
         assert user.password_hash != old_password_hash
 
-    def test_change_password_by_user(
+    async def test_change_password_by_user(
         self, messagebus, user, valid_password, valid_new_password
     ):
         messagebus.uow.user_repository.add(user)
@@ -155,11 +263,11 @@ class TestChangePassword:
             old_password=valid_password,
         )
 
-        messagebus.handle(command)
+        await messagebus.handle(command)
 
         assert user.password_hash != old_password_hash
 
-    def test_change_password_non_existing_user(
+    async def test_change_password_non_existing_user(
         self, messagebus, valid_password, valid_new_password
     ):
         command_for_admin = ChangePasswordWithoutOldPassword(
@@ -174,9 +282,9 @@ class TestChangePassword:
 
         for command in [command_for_admin, command_for_user]:
             with pytest.raises(UserNotFound):
-                messagebus.handle(command)
+                await messagebus.handle(command)
 
-    def test_change_password_wrong_old_password(
+    async def test_change_password_wrong_old_password(
         self, messagebus, user, invalid_password, valid_new_password
     ):
         messagebus.uow.user_repository.add(user)
@@ -187,9 +295,9 @@ class TestChangePassword:
         )
 
         with pytest.raises(PasswordVerificationError):
-            messagebus.handle(command)
+            await messagebus.handle(command)
 
-    def test_change_password_invalid_password(
+    async def test_change_password_invalid_password(
         self, messagebus, user, invalid_password, valid_password
     ):
         messagebus.uow.user_repository.add(user)
@@ -205,36 +313,38 @@ class TestChangePassword:
 
         for command in [command_for_admin, command_for_user]:
             with pytest.raises(PasswordValidationError):
-                messagebus.handle(command)
+                await messagebus.handle(command)
 
 
 class TestChangeEmail:
-    def test_update_email(self, messagebus, user, new_email):
+    async def test_update_email(self, messagebus, user, new_email):
         messagebus.uow.user_repository.add(user)
-        messagebus.handle(ChangeEmail(username=user.username, new_email=new_email))
+        await messagebus.handle(
+            ChangeEmail(username=user.username, new_email=new_email)
+        )
         assert user.email == new_email
 
-    def test_update_email_non_existing_user(self, messagebus, new_email):
+    async def test_update_email_non_existing_user(self, messagebus, new_email):
         with pytest.raises(UserNotFound):
-            messagebus.handle(
+            await messagebus.handle(
                 ChangeEmail(username="non-existing-user", new_email=new_email)
             )
 
 
 class TestActivateUser:
-    def test_activate_user(self, messagebus, deactivated_user):
+    async def test_activate_user(self, messagebus, deactivated_user):
         messagebus.uow.user_repository.add(deactivated_user)
-        messagebus.handle(ActivateUser(username=deactivated_user.username))
+        await messagebus.handle(ActivateUser(username=deactivated_user.username))
         assert deactivated_user.is_active is True
 
-    def test_activate_non_existing_user(self, messagebus):
+    async def test_activate_non_existing_user(self, messagebus):
         with pytest.raises(UserNotFound):
-            messagebus.handle(ActivateUser(username="non-existing-user"))
+            await messagebus.handle(ActivateUser(username="non-existing-user"))
 
-    def test_activate_already_active_user(self, messagebus, activated_user):
+    async def test_activate_already_active_user(self, messagebus, activated_user):
         messagebus.uow.user_repository.add(activated_user)
         with pytest.raises(UserAlreadyActive):
-            messagebus.handle(ActivateUser(username=activated_user.username))
+            await messagebus.handle(ActivateUser(username=activated_user.username))
 
 
 class TestActivateUserWithCode:
@@ -246,39 +356,41 @@ class TestActivateUserWithCode:
         storage.save_activation_code(username=user.username, code=code)
         return code
 
-    def test_activate_user_with_code(
+    async def test_activate_user_with_code(
         self, messagebus, deactivated_user, valid_password
     ):
         messagebus.uow.user_repository.add(deactivated_user)
         code = self._create_code(messagebus, deactivated_user)
 
-        messagebus.handle(
+        await messagebus.handle(
             ActivateUserWithCode(username=deactivated_user.username, code=code)
         )
 
         assert deactivated_user.is_active
 
-    def test_wrong_code(self, messagebus, deactivated_user):
+    async def test_wrong_code(self, messagebus, deactivated_user):
         messagebus.uow.user_repository.add(deactivated_user)
         code = "wrong-token"
 
         with pytest.raises(CodeVerificationError):
-            messagebus.handle(
+            await messagebus.handle(
                 ActivateUserWithCode(username=deactivated_user.username, code=code)
             )
 
-    def test_already_active_user(self, messagebus, activated_user, valid_password):
+    async def test_already_active_user(
+        self, messagebus, activated_user, valid_password
+    ):
         messagebus.uow.user_repository.add(activated_user)
         code = self._create_code(messagebus, activated_user)
 
         with pytest.raises(UserAlreadyActive):
-            messagebus.handle(
+            await messagebus.handle(
                 ActivateUserWithCode(username=activated_user.username, code=code)
             )
 
 
 class TestResendActivationCode:
-    def test_resend_activation_code(
+    async def test_resend_activation_code(
         self, capsys, messagebus, deactivated_user, valid_password
     ):
         messagebus.uow.user_repository.add(deactivated_user)
@@ -286,28 +398,32 @@ class TestResendActivationCode:
         command = ResendActivationCode(
             username=deactivated_user.username, password=valid_password
         )
-        messagebus.handle(command)
+        await messagebus.handle(command)
 
         captured = capsys.readouterr()
         assert deactivated_user.email in captured.out
 
-    def test_resend_activation_code_non_existing_user(self, messagebus, valid_password):
+    async def test_resend_activation_code_non_existing_user(
+        self, messagebus, valid_password
+    ):
         command = ResendActivationCode(
             username="non-existing-user", password=valid_password
         )
         with pytest.raises(UserNotFound):
-            messagebus.handle(command)
+            await messagebus.handle(command)
 
-    def test_resend_activation_code_wrong_password(self, messagebus, deactivated_user):
+    async def test_resend_activation_code_wrong_password(
+        self, messagebus, deactivated_user
+    ):
         messagebus.uow.user_repository.add(deactivated_user)
 
         command = ResendActivationCode(
             username=deactivated_user.username, password="wrong-password"
         )
         with pytest.raises(PasswordVerificationError):
-            messagebus.handle(command)
+            await messagebus.handle(command)
 
-    def test_resend_activation_code_already_active(
+    async def test_resend_activation_code_already_active(
         self, messagebus, activated_user, valid_password
     ):
         messagebus.uow.user_repository.add(activated_user)
@@ -316,20 +432,20 @@ class TestResendActivationCode:
             username=activated_user.username, password=valid_password
         )
         with pytest.raises(UserActive):
-            messagebus.handle(command)
+            await messagebus.handle(command)
 
 
 class TestDeactivateUser:
-    def test_deactivate_user(self, messagebus, activated_user):
+    async def test_deactivate_user(self, messagebus, activated_user):
         messagebus.uow.user_repository.add(activated_user)
-        messagebus.handle(DeactivateUser(username=activated_user.username))
+        await messagebus.handle(DeactivateUser(username=activated_user.username))
         assert activated_user.is_active is False
 
-    def test_deactivate_non_existing_user(self, messagebus):
+    async def test_deactivate_non_existing_user(self, messagebus):
         with pytest.raises(UserNotFound):
-            messagebus.handle(DeactivateUser(username="non-existing-user"))
+            await messagebus.handle(DeactivateUser(username="non-existing-user"))
 
-    def test_deactivate_non_active_user(self, messagebus, deactivated_user):
+    async def test_deactivate_non_active_user(self, messagebus, deactivated_user):
         messagebus.uow.user_repository.add(deactivated_user)
         with pytest.raises(UserAlreadyDeactivated):
-            messagebus.handle(DeactivateUser(username=deactivated_user.username))
+            await messagebus.handle(DeactivateUser(username=deactivated_user.username))
@@ -1,10 +1,33 @@
-from src.modules.users.domain.events import UserCreated
+import pytest
+
+from src.modules.users.domain.events import (
+    EmailChanged,
+    PasswordChanged,
+    UserActivated,
+    UserCreated,
+    UserDeactivated,
+)
+
+pytestmark = pytest.mark.anyio
 
 
 class TestUserCreated:
-    def test_email_confirmation_sent(self, capsys, messagebus, user):
+    async def test_email_confirmation_sent(self, capsys, messagebus, user):
         messagebus.uow.user_repository.add(user)
-        messagebus.handle(UserCreated(username=user.username, email=user.email))
+        await messagebus.handle(UserCreated(username=user.username, email=user.email))
         # Test what fakenotificator print message to stdout
         captured = capsys.readouterr()
         assert user.email in captured.out
+
+
+class TestUserChanged:
+    @pytest.mark.parametrize(
+        "event_type", [PasswordChanged, EmailChanged, UserActivated, UserDeactivated]
+    )
+    async def test_cached_user_evicted(self, messagebus, user, event_type):
+        user_cache = messagebus.dependencies["user_cache"]
+        await user_cache.set(user.username, "{}")
+
+        await messagebus.handle(event_type(username=user.username))
+
+        assert await user_cache.get(user.username) is None
@@ -23,43 +23,46 @@ from src.shared.application.exceptions import (
 )
 from tests.unit.wishlists.helpers import find_not_purchased_item, find_purchased_item
 
+pytestmark = pytest.mark.anyio
+
 
 class TestCreateWishlist:
-    def test_create_wishlist(self, messagebus, user, wishlist_name):
+    async def test_create_wishlist(self, messagebus, user, wishlist_name):
         messagebus.uow.user_repository.add(user)
-        messagebus.handle(
+        await messagebus.handle(
             CreateWishlist(owner_username=user.username, name=wishlist_name)
         )
-        assert len(messagebus.uow.wishlist_repository.list_all()) == 1
+        assert len(await messagebus.uow.wishlist_repository.list_all()) == 1
 
-    def test_create_wishlist_with_invalid_user(self, messagebus, wishlist_name):
+    async def test_create_wishlist_with_invalid_user(self, messagebus, wishlist_name):
         with pytest.raises(UserNotFound):
-            messagebus.handle(
+            await messagebus.handle(
                 CreateWishlist(owner_username="non-existing-user", name=wishlist_name)
             )
 
 
 class TestChangeWishlistName:
-    def test_change_wishlist_name(self, messagebus, wishlist, wishlist_new_name):
+    async def test_change_wishlist_name(self, messagebus, wishlist, wishlist_new_name):
         messagebus.uow.wishlist_repository.add(wishlist)
-        messagebus.handle(
+        await messagebus.handle(
             ChangeWishlistName(uuid=wishlist.uuid, new_name=wishlist_new_name)
         )
         assert wishlist.name == wishlist_new_name
+        assert wishlist.version == 2
 
-    def test_change_wishlist_name_non_existing_wishlist(
+    async def test_change_wishlist_name_non_existing_wishlist(
         self, messagebus, wishlist_new_name
     ):
         with pytest.raises(WishlistNotFound):
-            messagebus.handle(
+            await messagebus.handle(
                 ChangeWishlistName(uuid=uuid.uuid4(), new_name=wishlist_new_name)
             )
 
 
 class TestAddWishlistItem:
-    def test_add_wishlist_item(self, messagebus, wishlist):
+    async def test_add_wishlist_item(self, messagebus, wishlist):
         messagebus.uow.wishlist_repository.add(wishlist)
-        messagebus.handle(
+        await messagebus.handle(
             AddWishlistItem(
                 wishlist_uuid=wishlist.uuid,
                 name="Apple",
@@ -69,10 +72,11 @@ class TestAddWishlistItem:
             )
         )
         assert len(wishlist.items) == 1
+        assert wishlist.version == 2
 
-    def test_add_wishlist_item_non_existing_wishlist(self, messagebus):
+    async def test_add_wishlist_item_non_existing_wishlist(self, messagebus):
         with pytest.raises(WishlistNotFound):
-            messagebus.handle(
+            await messagebus.handle(
                 AddWishlistItem(
                     wishlist_uuid=uuid.uuid4(),
                     name="Apple",
@@ -84,30 +88,32 @@ class TestAddWishlistItem:
 
 
 class TestRemoveWishlistItem:
-    def test_remove_wishlist_item(self, messagebus, populated_wishlist):
+    async def test_remove_wishlist_item(self, messagebus, populated_wishlist):
         messagebus.uow.wishlist_repository.add(populated_wishlist)
         item_to_remove = populated_wishlist.items[0]
-        messagebus.handle(
+        await messagebus.handle(
             RemoveWishlistItem(
                 wishlist_uuid=populated_wishlist.uuid, item_uuid=item_to_remove.uuid
             )
         )
         assert item_to_remove not in populated_wishlist.items
 
-    def test_remove_wishlist_item_non_existing_wishlist(self, messagebus, apple_item):
+    async def test_remove_wishlist_item_non_existing_wishlist(
+        self, messagebus, apple_item
+    ):
         with pytest.raises(WishlistNotFound):
-            messagebus.handle(
+            await messagebus.handle(
                 RemoveWishlistItem(
                     wishlist_uuid=uuid.uuid4(), item_uuid=apple_item.uuid
                 )
             )
 
-    def test_remove_wishlist_item_non_existing_wishlist_item(
+    async def test_remove_wishlist_item_non_existing_wishlist_item(
         self, populated_wishlist, messagebus
     ):
         messagebus.uow.wishlist_repository.add(populated_wishlist)
         with pytest.raises(WishlistItemNotFound):
-            messagebus.handle(
+            await messagebus.handle(
                 RemoveWishlistItem(
                     wishlist_uuid=populated_wishlist.uuid, item_uuid=uuid.uuid4()
                 )
@@ -115,7 +121,9 @@ class TestRemoveWishlistItem:
 
 
 class TestMarkWishlistItemAsPurchased:
-    def test_mark_wishlist_item_as_purchased(self, messagebus, populated_wishlist):
+    async def test_mark_wishlist_item_as_purchased(
+        self, messagebus, populated_wishlist
+    ):
         messagebus.uow.wishlist_repository.add(populated_wishlist)
         item = find_not_purchased_item(populated_wishlist)
         command = MarkWishlistItemAsPurchased(
@@ -123,11 +131,13 @@ class TestMarkWishlistItemAsPurchased:
             item_uuid=item.uuid,
         )
 
-        messagebus.handle(command)
+        await messagebus.handle(command)
 
         assert item.is_purchased is True
 
-    def test_already_purchased_wishlist_item(self, messagebus, populated_wishlist):
+    async def test_already_purchased_wishlist_item(
+        self, messagebus, populated_wishlist
+    ):
         messagebus.uow.wishlist_repository.add(populated_wishlist)
         item = find_purchased_item(populated_wishlist)
         command = MarkWishlistItemAsPurchased(
@@ -136,21 +146,21 @@ class TestMarkWishlistItemAsPurchased:
         )
 
         with pytest.raises(WishlistItemAlreadyPurchased):
-            messagebus.handle(command)
+            await messagebus.handle(command)
 
-    def test_non_existing_wishlist(self, messagebus, apple_item):
+    async def test_non_existing_wishlist(self, messagebus, apple_item):
         with pytest.raises(WishlistNotFound):
-            messagebus.handle(
+            await messagebus.handle(
                 MarkWishlistItemAsPurchased(
                     wishlist_uuid=uuid.uuid4(),
                     item_uuid=apple_item.uuid,
                 )
             )
 
-    def test_non_existing_wishlist_item(self, populated_wishlist, messagebus):
+    async def test_non_existing_wishlist_item(self, populated_wishlist, messagebus):
         messagebus.uow.wishlist_repository.add(populated_wishlist)
         with pytest.raises(WishlistItemNotFound):
-            messagebus.handle(
+            await messagebus.handle(
                 MarkWishlistItemAsPurchased(
                     wishlist_uuid=populated_wishlist.uuid,
                     item_uuid=uuid.uuid4(),
@@ -159,7 +169,9 @@ class TestMarkWishlistItemAsPurchased:
 
 
 class TestMarkWishlistItemAsNotPurchased:
-    def test_mark_wishlist_item_as_not_purchased(self, messagebus, populated_wishlist):
+    async def test_mark_wishlist_item_as_not_purchased(
+        self, messagebus, populated_wishlist
+    ):
         messagebus.uow.wishlist_repository.add(populated_wishlist)
         item = find_purchased_item(populated_wishlist)
         command = MarkWishlistItemAsNotPurchased(
@@ -167,11 +179,11 @@ class TestMarkWishlistItemAsNotPurchased:
             item_uuid=item.uuid,
         )
 
-        messagebus.handle(command)
+        await messagebus.handle(command)
 
         assert item.is_purchased is False
 
-    def test_not_purchased_wishlist_item(self, messagebus, populated_wishlist):
+    async def test_not_purchased_wishlist_item(self, messagebus, populated_wishlist):
         messagebus.uow.wishlist_repository.add(populated_wishlist)
         item = find_not_purchased_item(populated_wishlist)
         command = MarkWishlistItemAsNotPurchased(
@@ -180,18 +192,18 @@ class TestMarkWishlistItemAsNotPurchased:
         )
 
         with pytest.raises(WishlistItemNotPurchased):
-            messagebus.handle(command)
+            await messagebus.handle(command)
 
-    def test_non_existing_wishlist(self, messagebus, apple_item):
+    async def test_non_existing_wishlist(self, messagebus, apple_item):
         with pytest.raises(WishlistNotFound):
-            messagebus.handle(
+            await messagebus.handle(
                 MarkWishlistItemAsNotPurchased(
                     wishlist_uuid=uuid.uuid4(),
                     item_uuid=apple_item.uuid,
                 )
             )
 
-    def test_non_existing_wishlist_item(self, populated_wishlist, messagebus):
+    async def test_non_existing_wishlist_item(self, populated_wishlist, messagebus):
         messagebus.uow.wishlist_repository.add(populated_wishlist)
         command = MarkWishlistItemAsNotPurchased(
             wishlist_uuid=populated_wishlist.uuid,
@@ -199,36 +211,38 @@ class TestMarkWishlistItemAsNotPurchased:
         )
 
         with pytest.raises(WishlistItemNotFound):
-            messagebus.handle(command)
+            await messagebus.handle(command)
 
 
 class TestArchiveWishlist:
-    def test_archive_wishlist(self, messagebus, wishlist):
+    async def test_archive_wishlist(self, messagebus, wishlist):
         messagebus.uow.wishlist_repository.add(wishlist)
-        messagebus.handle(ArchiveWishlist(uuid=wishlist.uuid))
+        await messagebus.handle(ArchiveWishlist(uuid=wishlist.uuid))
         assert wishlist.is_archived is True
 
-    def test_archive_wishlist_non_existing_wishlist(self, messagebus):
+    async def test_archive_wishlist_non_existing_wishlist(self, messagebus):
         with pytest.raises(WishlistNotFound):
-            messagebus.handle(ArchiveWishlist(uuid=uuid.uuid4()))
+            await messagebus.handle(ArchiveWishlist(uuid=uuid.uuid4()))
 
-    def test_archive_wishlist_already_archived(self, messagebus, archived_wishlist):
+    async def test_archive_wishlist_already_archived(
+        self, messagebus, archived_wishlist
+    ):
         messagebus.uow.wishlist_repository.add(archived_wishlist)
         with pytest.raises(WishlistAlreadyArchived):
-            messagebus.handle(ArchiveWishlist(uuid=archived_wishlist.uuid))
+            await messagebus.handle(ArchiveWishlist(uuid=archived_wishlist.uuid))
 
 
 class TestUnarchiveWishlist:
-    def test_unarchive_wishlist(self, messagebus, archived_wishlist):
+    async def test_unarchive_wishlist(self, messagebus, archived_wishlist):
         messagebus.uow.wishlist_repository.add(archived_wishlist)
-        messagebus.handle(UnarchiveWishlist(uuid=archived_wishlist.uuid))
+        await messagebus.handle(UnarchiveWishlist(uuid=archived_wishlist.uuid))
         assert archived_wishlist.is_archived is False
 
-    def test_unarchive_wishlist_non_existing_wishlist(self, messagebus):
+    async def test_unarchive_wishlist_non_existing_wishlist(self, messagebus):
         with pytest.raises(WishlistNotFound):
-            messagebus.handle(UnarchiveWishlist(uuid=uuid.uuid4()))
+            await messagebus.handle(UnarchiveWishlist(uuid=uuid.uuid4()))
 
-    def test_unarchive_wishlist_not_archived(self, messagebus, wishlist):
+    async def test_unarchive_wishlist_not_archived(self, messagebus, wishlist):
         messagebus.uow.wishlist_repository.add(wishlist)
         with pytest.raises(WishlistNotArchived):
-            messagebus.handle(UnarchiveWishlist(uuid=wishlist.uuid))
+            await messagebus.handle(UnarchiveWishlist(uuid=wishlist.uuid))
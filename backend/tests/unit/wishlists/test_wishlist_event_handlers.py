@@ -0,0 +1,72 @@
+import pytest
+
+from src.modules.wishlists.domain.commands import (
+    AddWishlistItem,
+    ArchiveWishlist,
+    ChangeWishlistName,
+    MarkWishlistItemAsPurchased,
+)
+from tests.unit.wishlists.helpers import find_not_purchased_item
+
+pytestmark = pytest.mark.anyio
+
+
+class TestWishlistChanged:
+    async def test_cached_wishlist_invalidated_on_name_change(
+        self, messagebus, wishlist, wishlist_new_name
+    ):
+        wishlist_cache = messagebus.dependencies["wishlist_cache"]
+        messagebus.uow.wishlist_repository.add(wishlist)
+        await wishlist_cache.set(str(wishlist.uuid), "{}")
+
+        await messagebus.handle(
+            ChangeWishlistName(uuid=wishlist.uuid, new_name=wishlist_new_name)
+        )
+
+        assert await wishlist_cache.get(str(wishlist.uuid)) is None
+
+    async def test_cached_wishlist_invalidated_on_archive(self, messagebus, wishlist):
+        wishlist_cache = messagebus.dependencies["wishlist_cache"]
+        messagebus.uow.wishlist_repository.add(wishlist)
+        await wishlist_cache.set(str(wishlist.uuid), "{}")
+
+        await messagebus.handle(ArchiveWishlist(uuid=wishlist.uuid))
+
+        assert await wishlist_cache.get(str(wishlist.uuid)) is None
+
+
+class TestWishlistItemChanged:
+    async def test_cached_wishlist_invalidated_on_item_added(
+        self, messagebus, wishlist
+    ):
+        wishlist_cache = messagebus.dependencies["wishlist_cache"]
+        messagebus.uow.wishlist_repository.add(wishlist)
+        await wishlist_cache.set(str(wishlist.uuid), "{}")
+
+        await messagebus.handle(
+            AddWishlistItem(
+                wishlist_uuid=wishlist.uuid,
+                name="Apple",
+                quantity=3,
+                measurement_unit="kg.",
+                priority=1,
+            )
+        )
+
+        assert await wishlist_cache.get(str(wishlist.uuid)) is None
+
+    async def test_cached_wishlist_invalidated_on_item_purchased(
+        self, messagebus, populated_wishlist
+    ):
+        wishlist_cache = messagebus.dependencies["wishlist_cache"]
+        messagebus.uow.wishlist_repository.add(populated_wishlist)
+        await wishlist_cache.set(str(populated_wishlist.uuid), "{}")
+        item = find_not_purchased_item(populated_wishlist)
+
+        await messagebus.handle(
+            MarkWishlistItemAsPurchased(
+                wishlist_uuid=populated_wishlist.uuid, item_uuid=item.uuid
+            )
+        )
+
+        assert await wishlist_cache.get(str(populated_wishlist.uuid)) is None
@@ -37,7 +37,17 @@ export default defineNuxtConfig({
       },
       token: {
         signInResponseTokenPointer: "/access_token",
-        maxAgeInSeconds: Number(process.env.NUXT_PUBLIC_TOKEN_LIFETIME) || 24 * 60 * 60,
+        maxAgeInSeconds: Number(process.env.NUXT_PUBLIC_ACCESS_TOKEN_LIFETIME) || 15 * 60,
+      },
+      refresh: {
+        isEnabled: true,
+        endpoint: { path: "auth/refresh", method: "post" },
+        token: {
+          signInResponseRefreshTokenPointer: "/refresh_token",
+          refreshResponseTokenPointer: "/access_token",
+          refreshRequestTokenPointer: "/refresh_token",
+          maxAgeInSeconds: Number(process.env.NUXT_PUBLIC_TOKEN_LIFETIME) || 24 * 60 * 60,
+        },
       },
       session: {
         dataType: {